@@ -34,6 +34,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -51,7 +52,10 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
-            target_metadata=target_metadata
+            target_metadata=target_metadata,
+            # Each revision gets its own transaction so migrations can use
+            # autocommit_block() for statements like CREATE INDEX CONCURRENTLY
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
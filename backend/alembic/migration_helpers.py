@@ -0,0 +1,122 @@
+"""Helpers shared by the migrations in alembic/versions.
+
+Importable from every revision because alembic.ini puts this directory on
+sys.path (prepend_sys_path).
+"""
+import time
+from typing import Callable
+
+from alembic import context, op
+import sqlalchemy as sa
+from sqlalchemy.exc import OperationalError
+
+
+BACKFILL_BATCH_SIZE = 1000
+LOCK_TIMEOUT = '3s'
+STATEMENT_TIMEOUT = '30s'
+LOCK_RETRIES = 5
+LOCK_NOT_AVAILABLE = '55P03'
+
+
+def backfill(table: str, column: str, value: str) -> None:
+    """Fill NULLs in small batches so no single UPDATE locks the whole table."""
+    if context.is_offline_mode():
+        op.execute(f"UPDATE {table} SET {column} = {value} WHERE {column} IS NULL")
+        return
+
+    statement = sa.text(
+        f"UPDATE {table} SET {column} = {value} WHERE id IN "
+        f"(SELECT id FROM {table} WHERE {column} IS NULL LIMIT {BACKFILL_BATCH_SIZE})"
+    )
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while bind.execute(statement).rowcount:
+            pass
+
+
+def alter(operation: Callable[[], None]) -> None:
+    """Run an ALTER so that it gives up quickly when it cannot get its lock.
+
+    ALTER TABLE waits for an ACCESS EXCLUSIVE lock and every later query on
+    the table queues behind it. On PostgreSQL the statement runs in its own
+    transaction with a short lock_timeout and is retried with backoff, so a
+    long-running reader delays the migration instead of stalling the app.
+    """
+    if op.get_context().dialect.name != 'postgresql':
+        operation()
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        op.execute(f"SET statement_timeout = '{STATEMENT_TIMEOUT}'")
+        try:
+            for attempt in range(LOCK_RETRIES):
+                try:
+                    operation()
+                    break
+                except OperationalError as exc:
+                    lock_timed_out = getattr(exc.orig, 'pgcode', None) == LOCK_NOT_AVAILABLE
+                    if not lock_timed_out or attempt == LOCK_RETRIES - 1:
+                        raise
+                    time.sleep(2 ** attempt)
+        finally:
+            op.execute("RESET statement_timeout")
+            op.execute("RESET lock_timeout")
+
+
+def table_exists(name: str) -> bool:
+    """Whether the table exists already (offline mode assumes a fresh database)."""
+    if context.is_offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def has_column(table: str, column: str) -> bool:
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(existing['name'] == column for existing in columns)
+
+
+def _index_columns(columns: list[str]) -> list:
+    # "created_at DESC" and the like are expressions, plain names stay columns
+    return [sa.text(c) if ' ' in c else c for c in columns]
+
+
+def swap_indexes(drop: list[tuple[str, str, list[str]]],
+                 create: list[tuple[str, str, list[str]]]) -> None:
+    """Create the (table, name, columns) indexes first, then drop the old ones.
+
+    On PostgreSQL both run CONCURRENTLY (outside the migration transaction),
+    so the tables stay writable while the new indexes build. IF [NOT] EXISTS
+    everywhere: tables first created by create_all() may already have either set.
+    """
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for table, name, columns in create:
+                op.create_index(name, table, _index_columns(columns),
+                                postgresql_concurrently=True, if_not_exists=True)
+            for table, name, _ in drop:
+                op.drop_index(name, table_name=table,
+                              postgresql_concurrently=True, if_exists=True)
+        return
+
+    for table, name, columns in create:
+        op.create_index(name, table, _index_columns(columns), if_not_exists=True)
+    for table, name, _ in drop:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+
+def create_indexes(table: str, indexes: list[tuple[str, list[str], bool]]) -> None:
+    """Create (name, columns, unique) indexes on a table that was just created.
+
+    The table is still empty, so nothing is gained by CONCURRENTLY; on
+    PostgreSQL all of them go out as one multi-statement execute.
+    """
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute("; ".join(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX {name} ON {table} ({', '.join(columns)})"
+            for name, columns, unique in indexes
+        ))
+        return
+
+    for name, columns, unique in indexes:
+        op.create_index(name, table, _index_columns(columns), unique=unique)
@@ -4,10 +4,10 @@ Revision ID: 1f300dbdbe3a
 Revises: 66a463fd1f4b
 Create Date: 2026-01-12 10:44:36.783149
 
+Intentionally empty. It cannot be dropped from the chain or skipped:
+databases stamped with 1f300dbdbe3a would no longer find their current
+revision. Applying it costs a single alembic_version UPDATE.
 """
-from alembic import op
-import sqlalchemy as sa
-import sqlmodel
 
 
 # revision identifiers, used by Alembic.
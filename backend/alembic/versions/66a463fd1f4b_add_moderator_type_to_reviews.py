@@ -1,14 +1,20 @@
 """add_moderator_type_to_reviews
 
 Revision ID: 66a463fd1f4b
-Revises: b7c8d9e0f1a2
+Revises: 9f836e3c48f0
 Create Date: 2026-01-09 22:55:27.917671
 
+moderator_type is no longer added here: a1b2c3d4e5f6 drops it again, so a
+fresh database would pay for an ADD + DROP round-trip on reviews for nothing.
+Databases that already ran the old version of this revision still have the
+column and a1b2c3d4e5f6 removes it for them.
 """
 from alembic import op
 import sqlalchemy as sa
 import sqlmodel
 
+from migration_helpers import alter, backfill, has_column
+
 
 # revision identifiers, used by Alembic.
 revision = '66a463fd1f4b'
@@ -17,23 +23,74 @@ branch_labels = None
 depends_on = None
 
 
-def upgrade() -> None:
-    # Add review_mode and moderator_type columns to reviews table
-    with op.batch_alter_table('reviews', schema=None) as batch_op:
-        batch_op.add_column(
-            sa.Column('review_mode', sqlmodel.sql.sqltypes.AutoString(length=20),
+def _review_mode_column() -> sa.Column:
+    return sa.Column('review_mode', sqlmodel.sql.sqltypes.AutoString(length=20),
                      nullable=False, server_default='council')
-        )
-        batch_op.add_column(
-            sa.Column('moderator_type', sqlmodel.sql.sqltypes.AutoString(length=20),
-                     nullable=False, server_default='debate')
-        )
-        batch_op.create_index('ix_reviews_review_mode', ['review_mode'], unique=False)
+
+
+def _enforce_not_null(table: str, column: sa.Column, default: str) -> None:
+    """Make a freshly added nullable column NOT NULL without rewriting the table.
+
+    The default is attached for new rows only, existing rows are backfilled
+    in batches and only then is NOT NULL enforced. The application always
+    writes the column, so the default is dropped again at the end.
+    """
+    alter(lambda: op.alter_column(table, column.name, existing_type=column.type,
+                                  server_default=sa.text(default)))
+    backfill(table, column.name, default)
+    alter(lambda: op.alter_column(table, column.name, existing_type=column.type,
+                                  nullable=False))
+    alter(lambda: op.alter_column(table, column.name, existing_type=column.type,
+                                  existing_nullable=False, server_default=None))
+
+
+def upgrade() -> None:
+    dialect = op.get_context().dialect.name
+
+    # Add review_mode column to reviews table
+    if dialect == 'sqlite':
+        # Batch mode is only needed on SQLite, which lacks most ALTER TABLE forms
+        with op.batch_alter_table('reviews', schema=None) as batch_op:
+            batch_op.add_column(_review_mode_column())
+            batch_op.create_index('ix_reviews_review_mode', ['review_mode'], unique=False)
+        return
+
+    # Other backends get plain ALTER TABLE statements (catalog-only changes)
+    review_mode = _review_mode_column()
+    alter(lambda: op.add_column(
+        'reviews', sa.Column(review_mode.name, review_mode.type, nullable=True)
+    ))
+    _enforce_not_null('reviews', review_mode, "'council'")
+
+    if dialect == 'postgresql':
+        # CONCURRENTLY keeps reviews writable while the index builds,
+        # but it cannot run inside a transaction block
+        with op.get_context().autocommit_block():
+            op.create_index('ix_reviews_review_mode', 'reviews', ['review_mode'],
+                            unique=False, postgresql_concurrently=True)
+    else:
+        op.create_index('ix_reviews_review_mode', 'reviews', ['review_mode'], unique=False)
 
 
 def downgrade() -> None:
-    # Remove review_mode and moderator_type columns from reviews table
-    with op.batch_alter_table('reviews', schema=None) as batch_op:
-        batch_op.drop_index('ix_reviews_review_mode')
-        batch_op.drop_column('moderator_type')
-        batch_op.drop_column('review_mode')
+    dialect = op.get_context().dialect.name
+
+    # Remove review_mode (and the legacy moderator_type, if present) from reviews
+    if dialect == 'sqlite':
+        drop_moderator_type = has_column('reviews', 'moderator_type')
+        with op.batch_alter_table('reviews', schema=None) as batch_op:
+            batch_op.drop_index('ix_reviews_review_mode')
+            if drop_moderator_type:
+                batch_op.drop_column('moderator_type')
+            batch_op.drop_column('review_mode')
+        return
+
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_reviews_review_mode', table_name='reviews',
+                          postgresql_concurrently=True)
+    else:
+        op.drop_index('ix_reviews_review_mode', table_name='reviews')
+    alter(lambda: op.execute(
+        "ALTER TABLE reviews DROP COLUMN IF EXISTS moderator_type, DROP COLUMN review_mode"
+    ))
@@ -30,8 +30,8 @@ def upgrade() -> None:
     sa.Column('updated_at', sa.DateTime(), nullable=False),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
-    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
+    op.create_index('ix_users_email', 'users', ['email'], unique=True)
+    op.create_index('ix_users_username', 'users', ['username'], unique=True)
     op.create_table('projects',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('name', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
@@ -42,8 +42,8 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_projects_name'), 'projects', ['name'], unique=False)
-    op.create_index(op.f('ix_projects_owner_id'), 'projects', ['owner_id'], unique=False)
+    op.create_index('ix_projects_name', 'projects', ['name'], unique=False)
+    op.create_index('ix_projects_owner_id', 'projects', ['owner_id'], unique=False)
     op.create_table('files',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('project_id', sa.Integer(), nullable=False),
@@ -57,8 +57,8 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_files_content_hash'), 'files', ['content_hash'], unique=False)
-    op.create_index(op.f('ix_files_project_id'), 'files', ['project_id'], unique=False)
+    op.create_index('ix_files_content_hash', 'files', ['content_hash'], unique=False)
+    op.create_index('ix_files_project_id', 'files', ['project_id'], unique=False)
     op.create_table('reviews',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('project_id', sa.Integer(), nullable=False),
@@ -71,9 +71,9 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_reviews_created_by'), 'reviews', ['created_by'], unique=False)
-    op.create_index(op.f('ix_reviews_project_id'), 'reviews', ['project_id'], unique=False)
-    op.create_index(op.f('ix_reviews_status'), 'reviews', ['status'], unique=False)
+    op.create_index('ix_reviews_created_by', 'reviews', ['created_by'], unique=False)
+    op.create_index('ix_reviews_project_id', 'reviews', ['project_id'], unique=False)
+    op.create_index('ix_reviews_status', 'reviews', ['status'], unique=False)
     op.create_table('conversations',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('review_id', sa.Integer(), nullable=False),
@@ -88,10 +88,10 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['review_id'], ['reviews.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_conversations_mode'), 'conversations', ['mode'], unique=False)
-    op.create_index(op.f('ix_conversations_review_id'), 'conversations', ['review_id'], unique=False)
-    op.create_index(op.f('ix_conversations_status'), 'conversations', ['status'], unique=False)
-    op.create_index(op.f('ix_conversations_topic_type'), 'conversations', ['topic_type'], unique=False)
+    op.create_index('ix_conversations_mode', 'conversations', ['mode'], unique=False)
+    op.create_index('ix_conversations_review_id', 'conversations', ['review_id'], unique=False)
+    op.create_index('ix_conversations_status', 'conversations', ['status'], unique=False)
+    op.create_index('ix_conversations_topic_type', 'conversations', ['topic_type'], unique=False)
     op.create_table('issues',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('review_id', sa.Integer(), nullable=False),
@@ -113,11 +113,11 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['review_id'], ['reviews.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_issues_category'), 'issues', ['category'], unique=False)
-    op.create_index(op.f('ix_issues_file_id'), 'issues', ['file_id'], unique=False)
-    op.create_index(op.f('ix_issues_review_id'), 'issues', ['review_id'], unique=False)
-    op.create_index(op.f('ix_issues_severity'), 'issues', ['severity'], unique=False)
-    op.create_index(op.f('ix_issues_status'), 'issues', ['status'], unique=False)
+    op.create_index('ix_issues_category', 'issues', ['category'], unique=False)
+    op.create_index('ix_issues_file_id', 'issues', ['file_id'], unique=False)
+    op.create_index('ix_issues_review_id', 'issues', ['review_id'], unique=False)
+    op.create_index('ix_issues_severity', 'issues', ['severity'], unique=False)
+    op.create_index('ix_issues_status', 'issues', ['status'], unique=False)
     op.create_table('review_agents',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('review_id', sa.Integer(), nullable=False),
@@ -130,7 +130,7 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['review_id'], ['reviews.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_review_agents_review_id'), 'review_agents', ['review_id'], unique=False)
+    op.create_index('ix_review_agents_review_id', 'review_agents', ['review_id'], unique=False)
     op.create_table('messages',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('conversation_id', sa.Integer(), nullable=False),
@@ -144,9 +144,9 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_messages_conversation_id'), 'messages', ['conversation_id'], unique=False)
-    op.create_index(op.f('ix_messages_sender_type'), 'messages', ['sender_type'], unique=False)
-    op.create_index(op.f('ix_messages_turn_index'), 'messages', ['turn_index'], unique=False)
+    op.create_index('ix_messages_conversation_id', 'messages', ['conversation_id'], unique=False)
+    op.create_index('ix_messages_sender_type', 'messages', ['sender_type'], unique=False)
+    op.create_index('ix_messages_turn_index', 'messages', ['turn_index'], unique=False)
     op.create_table('suggestions',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('issue_id', sa.Integer(), nullable=False),
@@ -156,42 +156,42 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['issue_id'], ['issues.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_suggestions_issue_id'), 'suggestions', ['issue_id'], unique=False)
+    op.create_index('ix_suggestions_issue_id', 'suggestions', ['issue_id'], unique=False)
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_index(op.f('ix_suggestions_issue_id'), table_name='suggestions')
+    op.drop_index('ix_suggestions_issue_id', table_name='suggestions')
     op.drop_table('suggestions')
-    op.drop_index(op.f('ix_messages_turn_index'), table_name='messages')
-    op.drop_index(op.f('ix_messages_sender_type'), table_name='messages')
-    op.drop_index(op.f('ix_messages_conversation_id'), table_name='messages')
+    op.drop_index('ix_messages_turn_index', table_name='messages')
+    op.drop_index('ix_messages_sender_type', table_name='messages')
+    op.drop_index('ix_messages_conversation_id', table_name='messages')
     op.drop_table('messages')
-    op.drop_index(op.f('ix_review_agents_review_id'), table_name='review_agents')
+    op.drop_index('ix_review_agents_review_id', table_name='review_agents')
     op.drop_table('review_agents')
-    op.drop_index(op.f('ix_issues_status'), table_name='issues')
-    op.drop_index(op.f('ix_issues_severity'), table_name='issues')
-    op.drop_index(op.f('ix_issues_review_id'), table_name='issues')
-    op.drop_index(op.f('ix_issues_file_id'), table_name='issues')
-    op.drop_index(op.f('ix_issues_category'), table_name='issues')
+    op.drop_index('ix_issues_status', table_name='issues')
+    op.drop_index('ix_issues_severity', table_name='issues')
+    op.drop_index('ix_issues_review_id', table_name='issues')
+    op.drop_index('ix_issues_file_id', table_name='issues')
+    op.drop_index('ix_issues_category', table_name='issues')
     op.drop_table('issues')
-    op.drop_index(op.f('ix_conversations_topic_type'), table_name='conversations')
-    op.drop_index(op.f('ix_conversations_status'), table_name='conversations')
-    op.drop_index(op.f('ix_conversations_review_id'), table_name='conversations')
-    op.drop_index(op.f('ix_conversations_mode'), table_name='conversations')
+    op.drop_index('ix_conversations_topic_type', table_name='conversations')
+    op.drop_index('ix_conversations_status', table_name='conversations')
+    op.drop_index('ix_conversations_review_id', table_name='conversations')
+    op.drop_index('ix_conversations_mode', table_name='conversations')
     op.drop_table('conversations')
-    op.drop_index(op.f('ix_reviews_status'), table_name='reviews')
-    op.drop_index(op.f('ix_reviews_project_id'), table_name='reviews')
-    op.drop_index(op.f('ix_reviews_created_by'), table_name='reviews')
+    op.drop_index('ix_reviews_status', table_name='reviews')
+    op.drop_index('ix_reviews_project_id', table_name='reviews')
+    op.drop_index('ix_reviews_created_by', table_name='reviews')
     op.drop_table('reviews')
-    op.drop_index(op.f('ix_files_project_id'), table_name='files')
-    op.drop_index(op.f('ix_files_content_hash'), table_name='files')
+    op.drop_index('ix_files_project_id', table_name='files')
+    op.drop_index('ix_files_content_hash', table_name='files')
     op.drop_table('files')
-    op.drop_index(op.f('ix_projects_owner_id'), table_name='projects')
-    op.drop_index(op.f('ix_projects_name'), table_name='projects')
+    op.drop_index('ix_projects_owner_id', table_name='projects')
+    op.drop_index('ix_projects_name', table_name='projects')
     op.drop_table('projects')
-    op.drop_index(op.f('ix_users_username'), table_name='users')
-    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_index('ix_users_username', table_name='users')
+    op.drop_index('ix_users_email', table_name='users')
     op.drop_table('users')
     # ### end Alembic commands ###
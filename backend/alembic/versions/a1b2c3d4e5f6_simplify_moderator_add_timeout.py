@@ -5,7 +5,8 @@ Revises: 1f300dbdbe3a
 Create Date: 2026-01-12 15:00:00.000000
 
 Changes:
-- Drop moderator_type column from reviews (no longer needed)
+- Drop moderator_type column from reviews (no longer needed; only present on
+  databases that ran the original 66a463fd1f4b)
 - Add summary column to reviews (moderator's final report)
 - Add timed_out and timeout_seconds columns to review_agents
 """
@@ -13,6 +14,8 @@ from alembic import op
 import sqlalchemy as sa
 import sqlmodel
 
+from migration_helpers import alter, backfill, has_column
+
 
 # revision identifiers, used by Alembic.
 revision = 'a1b2c3d4e5f6'
@@ -22,33 +25,66 @@ depends_on = None
 
 
 def upgrade() -> None:
-    # Drop moderator_type column from reviews
-    with op.batch_alter_table('reviews', schema=None) as batch_op:
-        batch_op.drop_column('moderator_type')
-        batch_op.add_column(
-            sa.Column('summary', sa.Text(), nullable=True)
-        )
-
-    # Add timeout columns to review_agents
-    with op.batch_alter_table('review_agents', schema=None) as batch_op:
-        batch_op.add_column(
-            sa.Column('timed_out', sa.Boolean(), nullable=False, server_default='0')
-        )
-        batch_op.add_column(
-            sa.Column('timeout_seconds', sa.Integer(), nullable=True)
-        )
+    if op.get_context().dialect.name == 'sqlite':
+        # SQLite cannot drop columns in place - batch mode recreates the table
+        drop_moderator_type = has_column('reviews', 'moderator_type')
+        with op.batch_alter_table('reviews', schema=None) as batch_op:
+            if drop_moderator_type:
+                batch_op.drop_column('moderator_type')
+            batch_op.add_column(
+                sa.Column('summary', sa.Text(), nullable=True)
+            )
+
+        with op.batch_alter_table('review_agents', schema=None) as batch_op:
+            batch_op.add_column(
+                sa.Column('timed_out', sa.Boolean(), nullable=False, server_default='0')
+            )
+            batch_op.add_column(
+                sa.Column('timeout_seconds', sa.Integer(), nullable=True)
+            )
+        return
+
+    # Each table is altered with a single multi-clause ALTER TABLE, so the
+    # lock on reviews/review_agents is taken once per table.
+    alter(lambda: op.execute(
+        "ALTER TABLE reviews DROP COLUMN IF EXISTS moderator_type, ADD COLUMN summary TEXT"
+    ))
+
+    # timed_out is added as nullable, backfilled in batches and only then made
+    # NOT NULL, so the ALTER never rewrites the table while holding the lock.
+    alter(lambda: op.execute(
+        "ALTER TABLE review_agents ADD COLUMN timed_out BOOLEAN, "
+        "ADD COLUMN timeout_seconds INTEGER"
+    ))
+    alter(lambda: op.alter_column('review_agents', 'timed_out', existing_type=sa.Boolean(),
+                                  server_default=sa.false()))
+    backfill('review_agents', 'timed_out', 'false')
+    alter(lambda: op.alter_column('review_agents', 'timed_out', existing_type=sa.Boolean(),
+                                  nullable=False))
+    alter(lambda: op.alter_column('review_agents', 'timed_out', existing_type=sa.Boolean(),
+                                  existing_nullable=False, server_default=None))
 
 
 def downgrade() -> None:
-    # Remove timeout columns from review_agents
-    with op.batch_alter_table('review_agents', schema=None) as batch_op:
-        batch_op.drop_column('timeout_seconds')
-        batch_op.drop_column('timed_out')
-
-    # Restore moderator_type column and remove summary
-    with op.batch_alter_table('reviews', schema=None) as batch_op:
-        batch_op.drop_column('summary')
-        batch_op.add_column(
-            sa.Column('moderator_type', sqlmodel.sql.sqltypes.AutoString(length=20),
-                     nullable=False, server_default='debate')
-        )
+    if op.get_context().dialect.name == 'sqlite':
+        # Remove timeout columns from review_agents
+        with op.batch_alter_table('review_agents', schema=None) as batch_op:
+            batch_op.drop_column('timeout_seconds')
+            batch_op.drop_column('timed_out')
+
+        # Restore moderator_type column and remove summary
+        with op.batch_alter_table('reviews', schema=None) as batch_op:
+            batch_op.drop_column('summary')
+            batch_op.add_column(
+                sa.Column('moderator_type', sqlmodel.sql.sqltypes.AutoString(length=20),
+                         nullable=False, server_default='debate')
+            )
+        return
+
+    alter(lambda: op.execute(
+        "ALTER TABLE review_agents DROP COLUMN timeout_seconds, DROP COLUMN timed_out"
+    ))
+    alter(lambda: op.execute(
+        "ALTER TABLE reviews DROP COLUMN summary, "
+        "ADD COLUMN moderator_type VARCHAR(20) NOT NULL DEFAULT 'debate'"
+    ))
@@ -19,10 +19,22 @@ depends_on = None
 def upgrade() -> None:
     # Add agent_role column to issues table
     op.add_column('issues', sa.Column('agent_role', sa.String(length=50), nullable=True))
-    op.create_index(op.f('ix_issues_agent_role'), 'issues', ['agent_role'], unique=False)
+
+    if op.get_context().dialect.name == 'postgresql':
+        # Build the index without blocking writes to issues (needs autocommit)
+        with op.get_context().autocommit_block():
+            op.create_index('ix_issues_agent_role', 'issues', ['agent_role'],
+                            unique=False, postgresql_concurrently=True)
+    else:
+        op.create_index('ix_issues_agent_role', 'issues', ['agent_role'], unique=False)
 
 
 def downgrade() -> None:
     # Remove agent_role column from issues table
-    op.drop_index(op.f('ix_issues_agent_role'), table_name='issues')
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_issues_agent_role', table_name='issues',
+                          postgresql_concurrently=True)
+    else:
+        op.drop_index('ix_issues_agent_role', table_name='issues')
     op.drop_column('issues', 'agent_role')
@@ -0,0 +1,110 @@
+"""add_arena_tables
+
+Revision ID: add_arena_tables
+Revises: add_agent_role_issues
+Create Date: 2026-01-20 10:00:00.000000
+
+Brings arena_sessions and team_ratings under Alembic. Until now they were
+only created by SQLModel.metadata.create_all() at application startup, so
+tables that already exist are skipped here and brought up to the current
+schema by arena_tables_existing_schema.
+
+Every index is created right after its CREATE TABLE, while the table is
+still empty: the build costs nothing and never has to scan existing rows.
+On PostgreSQL the index DDL for a table is sent as one multi-statement
+execute, so a fresh deployment pays one round-trip per table instead of
+one per index.
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+from migration_helpers import create_indexes, table_exists
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_arena_tables'
+down_revision = 'add_agent_role_issues'
+branch_labels = None
+depends_on = None
+
+
+# Config columns are JSONB on PostgreSQL (parsed once on write, GIN-indexable)
+CONFIG_JSON = sa.JSON().with_variant(postgresql.JSONB(), 'postgresql')
+
+# Native enums on PostgreSQL, VARCHAR + CHECK constraint elsewhere
+ARENA_STATUS = sa.Enum('pending', 'running', 'voting', 'completed', 'failed',
+                       name='arena_session_status', create_constraint=True)
+ARENA_WINNER = sa.Enum('A', 'B', 'tie', name='arena_winner', create_constraint=True)
+
+
+
+
+def upgrade() -> None:
+    if not table_exists('arena_sessions'):
+        op.create_table('arena_sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=False),
+        sa.Column('status', ARENA_STATUS, nullable=False),
+        sa.Column('error_message', sqlmodel.sql.sqltypes.AutoString(length=2000), nullable=True),
+        sa.Column('team_a_config', CONFIG_JSON, nullable=True),
+        sa.Column('team_b_config', CONFIG_JSON, nullable=True),
+        sa.Column('team_a_summary', sqlmodel.sql.sqltypes.AutoString(length=10000), nullable=True),
+        sa.Column('team_b_summary', sqlmodel.sql.sqltypes.AutoString(length=10000), nullable=True),
+        sa.Column('team_a_issues', sa.JSON(), nullable=True),
+        sa.Column('team_b_issues', sa.JSON(), nullable=True),
+        sa.Column('winner', ARENA_WINNER, nullable=True),
+        sa.Column('vote_comment', sqlmodel.sql.sqltypes.AutoString(length=2000), nullable=True),
+        sa.Column('voted_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        # Composite indexes match the real access patterns ("sessions of a project
+        # in a given status, newest first" and "my sessions, newest first") with
+        # one seek each, instead of bitmap-ANDing single-column indexes. The
+        # leading project_id / created_by columns still cover the FK lookups.
+        create_indexes('arena_sessions', [
+            ('ix_arena_sessions_project_status_created',
+             ['project_id', 'status', 'created_at DESC'], False),
+            ('ix_arena_sessions_created_by_created', ['created_by', 'created_at DESC'], False),
+        ])
+
+    if not table_exists('team_ratings'):
+        op.create_table('team_ratings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('config_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+        sa.Column('config', CONFIG_JSON, nullable=True),
+        sa.Column('elo_rating', sa.Float(), nullable=False),
+        sa.Column('games_played', sa.Integer(), nullable=False),
+        sa.Column('wins', sa.Integer(), nullable=False),
+        sa.Column('losses', sa.Integer(), nullable=False),
+        sa.Column('ties', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+        )
+        create_indexes('team_ratings', [
+            ('ix_team_ratings_config_hash', ['config_hash'], True),
+            # Rankings scan in elo_rating order and filter games_played >= N
+            # from the index itself
+            ('ix_team_ratings_elo_games', ['elo_rating', 'games_played'], False),
+        ])
+        if op.get_context().dialect.name == 'postgresql':
+            # jsonb_path_ops is smaller and faster than the default opclass for @>
+            op.create_index('ix_team_ratings_config_gin', 'team_ratings', ['config'],
+                            postgresql_using='gin',
+                            postgresql_ops={'config': 'jsonb_path_ops'})
+
+
+def downgrade() -> None:
+    # DROP TABLE removes the table's indexes as well
+    op.drop_table('team_ratings')
+    op.drop_table('arena_sessions')
+    if op.get_context().dialect.name == 'postgresql':
+        op.execute("DROP TYPE IF EXISTS arena_winner")
+        op.execute("DROP TYPE IF EXISTS arena_session_status")
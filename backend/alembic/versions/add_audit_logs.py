@@ -0,0 +1,78 @@
+"""add_audit_logs
+
+Revision ID: add_audit_logs
+Revises: partial_review_mode_index
+Create Date: 2026-02-09 10:00:00.000000
+
+Brings audit_logs under Alembic (until now it was only created by
+SQLModel.metadata.create_all() at startup) and replaces the single-column
+user_id / action indexes with composites matching the keyset-paginated
+audit endpoints: "logs of a user, newest first" and "logs of an action,
+newest first". id is part of the user index so the (created_at, id) cursor
+is resolved from the index alone.
+
+Databases that already have the table only get the index swap; on
+PostgreSQL it is done CONCURRENTLY so audit writes are not blocked.
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+from migration_helpers import create_indexes, swap_indexes, table_exists
+
+
+# revision identifiers, used by Alembic.
+revision = 'add_audit_logs'
+down_revision = 'partial_review_mode_index'
+branch_labels = None
+depends_on = None
+
+
+# Same type as SQLModel's create_all(): enum member names, PG type "auditaction"
+AUDIT_ACTION = sa.Enum(
+    'LOGIN', 'LOGOUT', 'REGISTER', 'PASSWORD_CHANGE', 'TOKEN_REFRESH',
+    'PROJECT_CREATE', 'PROJECT_UPDATE', 'PROJECT_DELETE',
+    'FILE_CREATE', 'FILE_UPDATE', 'FILE_DELETE',
+    'REVIEW_CREATE', 'REVIEW_COMPLETE', 'ISSUE_UPDATE', 'API_KEY_ACCESS',
+    name='auditaction',
+)
+
+NEW_INDEXES = [
+    ('audit_logs', 'ix_audit_logs_user_created', ['user_id', 'created_at DESC', 'id DESC']),
+    ('audit_logs', 'ix_audit_logs_action_created', ['action', 'created_at DESC']),
+]
+OLD_INDEXES = [
+    ('audit_logs', 'ix_audit_logs_user_id', ['user_id']),
+    ('audit_logs', 'ix_audit_logs_action', ['action']),
+]
+
+
+
+
+def upgrade() -> None:
+    if table_exists('audit_logs'):
+        swap_indexes(drop=OLD_INDEXES, create=NEW_INDEXES)
+        return
+
+    op.create_table('audit_logs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('action', AUDIT_ACTION, nullable=False),
+    sa.Column('resource_type', sqlmodel.sql.sqltypes.AutoString(length=50), nullable=True),
+    sa.Column('resource_id', sa.Integer(), nullable=True),
+    sa.Column('details', sqlmodel.sql.sqltypes.AutoString(length=2000), nullable=True),
+    sa.Column('ip_address', sqlmodel.sql.sqltypes.AutoString(length=45), nullable=True),
+    sa.Column('user_agent', sqlmodel.sql.sqltypes.AutoString(length=500), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    create_indexes('audit_logs', [
+        ('ix_audit_logs_created_at', ['created_at'], False),
+        *((name, columns, False) for _, name, columns in NEW_INDEXES),
+    ])
+
+
+def downgrade() -> None:
+    # The table may predate this revision (create_all), so only the indexes
+    # are reverted - audit history is never dropped by a downgrade
+    swap_indexes(drop=NEW_INDEXES, create=OLD_INDEXES)
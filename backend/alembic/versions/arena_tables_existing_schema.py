@@ -0,0 +1,214 @@
+"""arena_tables_existing_schema
+
+Revision ID: arena_tables_existing_schema
+Revises: review_issue_list_indexes
+Create Date: 2026-03-09 10:00:00.000000
+
+add_arena_tables only creates arena_sessions / team_ratings when they are
+missing, so databases where SQLModel.metadata.create_all() had already
+created them kept the original schema. This revision brings such tables up
+to the current model:
+
+- config columns JSON -> JSONB and status / winner VARCHAR -> native enums
+  (PostgreSQL), VARCHAR + CHECK constraints (SQLite),
+- project_id / created_by foreign keys recreated with ON DELETE CASCADE,
+- single-column project_id / created_by / status indexes replaced by the
+  composite ones, elo_rating / GIN config indexes on team_ratings added.
+
+Every step first inspects the live schema, so on databases created by
+add_arena_tables this revision changes nothing. Offline (--sql) mode
+assumes such a fresh database and emits nothing.
+
+Downgrade puts the tables back in the create_all() shape (JSON, VARCHAR,
+plain foreign keys, single-column indexes), whichever way they got here.
+"""
+from alembic import context, op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+from migration_helpers import alter, swap_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = 'arena_tables_existing_schema'
+down_revision = 'review_issue_list_indexes'
+branch_labels = None
+depends_on = None
+
+CONFIG_JSON = sa.JSON().with_variant(postgresql.JSONB(), 'postgresql')
+ARENA_STATUS = sa.Enum('pending', 'running', 'voting', 'completed', 'failed',
+                       name='arena_session_status', create_constraint=True)
+ARENA_WINNER = sa.Enum('A', 'B', 'tie', name='arena_winner', create_constraint=True)
+
+CONFIG_COLUMNS = [
+    ('arena_sessions', 'team_a_config'),
+    ('arena_sessions', 'team_b_config'),
+    ('team_ratings', 'config'),
+]
+ENUM_COLUMNS = [
+    ('status', ARENA_STATUS, False),
+    ('winner', ARENA_WINNER, True),
+]
+
+NEW_INDEXES = [
+    ('arena_sessions', 'ix_arena_sessions_project_status_created',
+     ['project_id', 'status', 'created_at DESC']),
+    ('arena_sessions', 'ix_arena_sessions_created_by_created', ['created_by', 'created_at DESC']),
+    ('team_ratings', 'ix_team_ratings_elo_games', ['elo_rating', 'games_played']),
+]
+OLD_INDEXES = [
+    ('arena_sessions', 'ix_arena_sessions_project_id', ['project_id']),
+    ('arena_sessions', 'ix_arena_sessions_created_by', ['created_by']),
+    ('arena_sessions', 'ix_arena_sessions_status', ['status']),
+]
+GIN_INDEX = 'ix_team_ratings_config_gin'
+
+
+def _arena_sessions_table(legacy: bool = False) -> sa.Table:
+    """arena_sessions definition used to rebuild the table on SQLite.
+
+    legacy=True gives the create_all() shape: VARCHAR status / winner
+    without CHECK constraints and foreign keys without ON DELETE CASCADE.
+    """
+    ondelete = None if legacy else 'CASCADE'
+    metadata = sa.MetaData()
+    sa.Table('projects', metadata, sa.Column('id', sa.Integer(), primary_key=True))
+    sa.Table('users', metadata, sa.Column('id', sa.Integer(), primary_key=True))
+    return sa.Table('arena_sessions', metadata,
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('project_id', sa.Integer(), nullable=False),
+        sa.Column('created_by', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String() if legacy else ARENA_STATUS, nullable=False),
+        sa.Column('error_message', sqlmodel.sql.sqltypes.AutoString(length=2000), nullable=True),
+        sa.Column('team_a_config', CONFIG_JSON, nullable=True),
+        sa.Column('team_b_config', CONFIG_JSON, nullable=True),
+        sa.Column('team_a_summary', sqlmodel.sql.sqltypes.AutoString(length=10000), nullable=True),
+        sa.Column('team_b_summary', sqlmodel.sql.sqltypes.AutoString(length=10000), nullable=True),
+        sa.Column('team_a_issues', sa.JSON(), nullable=True),
+        sa.Column('team_b_issues', sa.JSON(), nullable=True),
+        sa.Column('winner', sa.String(10) if legacy else ARENA_WINNER, nullable=True),
+        sa.Column('vote_comment', sqlmodel.sql.sqltypes.AutoString(length=2000), nullable=True),
+        sa.Column('voted_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id'], ondelete=ondelete),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete=ondelete),
+        sa.PrimaryKeyConstraint('id'),
+    )
+
+
+def _fks_without_cascade(inspector) -> list[dict]:
+    return [
+        fk for fk in inspector.get_foreign_keys('arena_sessions')
+        if (fk.get('options') or {}).get('ondelete', '').upper() != 'CASCADE'
+    ]
+
+
+def _recreate_fks(fks: list[dict], ondelete: str | None) -> None:
+    for fk in fks:
+        alter(lambda: op.drop_constraint(fk['name'], 'arena_sessions', type_='foreignkey'))
+        alter(lambda: op.create_foreign_key(fk['name'], 'arena_sessions', fk['referred_table'],
+                                            fk['constrained_columns'], fk['referred_columns'],
+                                            ondelete=ondelete))
+
+
+def _upgrade_postgresql(inspector) -> None:
+    bind = op.get_bind()
+
+    for table, column in CONFIG_COLUMNS:
+        existing = {c['name']: c['type'] for c in inspector.get_columns(table)}
+        if not isinstance(existing[column], postgresql.JSONB):
+            alter(lambda: op.alter_column(table, column, type_=postgresql.JSONB(),
+                                          existing_type=existing[column],
+                                          postgresql_using=f'{column}::jsonb'))
+
+    existing = {c['name']: c['type'] for c in inspector.get_columns('arena_sessions')}
+    for column, enum, nullable in ENUM_COLUMNS:
+        if not isinstance(existing[column], sa.Enum):
+            enum.create(bind, checkfirst=True)
+            alter(lambda: op.alter_column('arena_sessions', column, type_=enum,
+                                          existing_type=existing[column],
+                                          existing_nullable=nullable,
+                                          postgresql_using=f'{column}::{enum.name}'))
+
+    _recreate_fks(_fks_without_cascade(inspector), ondelete='CASCADE')
+
+
+def _upgrade_sqlite(inspector) -> None:
+    # SQLite cannot alter constraints in place: rebuild the table from the
+    # current definition (drops the old indexes, recreated below)
+    if _fks_without_cascade(inspector) or not inspector.get_check_constraints('arena_sessions'):
+        with op.batch_alter_table('arena_sessions', recreate='always',
+                                  copy_from=_arena_sessions_table()):
+            pass
+
+
+def _swap_indexes(inspector) -> None:
+    """Create the missing composite indexes first, then drop the old ones."""
+    existing = {
+        table: {ix['name'] for ix in inspector.get_indexes(table)}
+        for table in ('arena_sessions', 'team_ratings')
+    }
+    swap_indexes(drop=[ix for ix in OLD_INDEXES if ix[1] in existing[ix[0]]],
+                 create=[ix for ix in NEW_INDEXES if ix[1] not in existing[ix[0]]])
+
+    if (op.get_context().dialect.name == 'postgresql'
+            and GIN_INDEX not in existing['team_ratings']):
+        with op.get_context().autocommit_block():
+            # jsonb_path_ops is smaller and faster than the default opclass for @>
+            op.create_index(GIN_INDEX, 'team_ratings', ['config'],
+                            postgresql_using='gin',
+                            postgresql_ops={'config': 'jsonb_path_ops'},
+                            postgresql_concurrently=True, if_not_exists=True)
+
+
+def upgrade() -> None:
+    if context.is_offline_mode():
+        return
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        _upgrade_postgresql(sa.inspect(bind))
+    else:
+        _upgrade_sqlite(sa.inspect(bind))
+    # Fresh inspector: the SQLite rebuild above changes the index list
+    _swap_indexes(sa.inspect(bind))
+
+
+def _downgrade_postgresql(inspector) -> None:
+    # jsonb_path_ops only exists for jsonb - the GIN index goes before the type
+    with op.get_context().autocommit_block():
+        op.drop_index(GIN_INDEX, table_name='team_ratings',
+                      postgresql_concurrently=True, if_exists=True)
+
+    for table, column in CONFIG_COLUMNS:
+        alter(lambda: op.alter_column(table, column, type_=sa.JSON(),
+                                      existing_type=postgresql.JSONB(),
+                                      postgresql_using=f'{column}::json'))
+    for column, enum, nullable in ENUM_COLUMNS:
+        legacy_type = sa.String() if column == 'status' else sa.String(10)
+        alter(lambda: op.alter_column('arena_sessions', column, type_=legacy_type,
+                                      existing_type=enum, existing_nullable=nullable,
+                                      postgresql_using=f'{column}::varchar'))
+
+    cascading = [
+        fk for fk in inspector.get_foreign_keys('arena_sessions')
+        if (fk.get('options') or {}).get('ondelete', '').upper() == 'CASCADE'
+    ]
+    _recreate_fks(cascading, ondelete=None)
+
+
+def downgrade() -> None:
+    if context.is_offline_mode():
+        return
+
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        _downgrade_postgresql(sa.inspect(bind))
+    else:
+        with op.batch_alter_table('arena_sessions', recreate='always',
+                                  copy_from=_arena_sessions_table(legacy=True)):
+            pass
+    # The enum types stay until add_arena_tables' downgrade drops them
+    swap_indexes(drop=NEW_INDEXES, create=OLD_INDEXES)
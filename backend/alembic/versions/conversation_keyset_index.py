@@ -0,0 +1,31 @@
+"""conversation_keyset_index
+
+Revision ID: conversation_keyset_index
+Revises: add_audit_logs
+Create Date: 2026-02-16 10:00:00.000000
+
+The conversation list of a review is keyset-paginated on (created_at, id),
+newest first. A composite (review_id, created_at DESC, id DESC) index turns
+every page into one index range scan; it also covers the review_id FK
+lookups, so the single-column ix_conversations_review_id goes away.
+"""
+from migration_helpers import swap_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = 'conversation_keyset_index'
+down_revision = 'add_audit_logs'
+branch_labels = None
+depends_on = None
+
+KEYSET_INDEX = [('conversations', 'ix_conversations_review_created',
+                 ['review_id', 'created_at DESC', 'id DESC'])]
+REVIEW_INDEX = [('conversations', 'ix_conversations_review_id', ['review_id'])]
+
+
+def upgrade() -> None:
+    swap_indexes(drop=REVIEW_INDEX, create=KEYSET_INDEX)
+
+
+def downgrade() -> None:
+    swap_indexes(drop=KEYSET_INDEX, create=REVIEW_INDEX)
@@ -0,0 +1,41 @@
+"""drop_review_mode_index
+
+Revision ID: drop_review_mode_index
+Revises: arena_tables_existing_schema
+Create Date: 2026-03-10 10:00:00.000000
+
+Drops ix_reviews_review_mode. 'council' is the only review mode left, so
+the partial index from partial_review_mode_index (review_mode <> 'council')
+never holds a row, and no query seeks on review_mode (the rankings count
+filters it inside an aggregate over all reviews).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'drop_review_mode_index'
+down_revision = 'arena_tables_existing_schema'
+branch_labels = None
+depends_on = None
+
+NON_COUNCIL = sa.text("review_mode <> 'council'")
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_reviews_review_mode', table_name='reviews',
+                          postgresql_concurrently=True, if_exists=True)
+    else:
+        op.drop_index('ix_reviews_review_mode', table_name='reviews')
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index('ix_reviews_review_mode', 'reviews', ['review_mode'],
+                            postgresql_where=NON_COUNCIL, postgresql_concurrently=True)
+    else:
+        op.create_index('ix_reviews_review_mode', 'reviews', ['review_mode'],
+                        sqlite_where=NON_COUNCIL)
@@ -0,0 +1,29 @@
+"""files_project_name_index
+
+Revision ID: files_project_name_index
+Revises: project_file_count
+Create Date: 2026-03-04 10:00:00.000000
+
+Files are listed per project ordered by name. A composite (project_id, name)
+index serves the ORDER BY without a sort and covers the project_id lookups,
+so the single-column ix_files_project_id goes away.
+"""
+from migration_helpers import swap_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = 'files_project_name_index'
+down_revision = 'project_file_count'
+branch_labels = None
+depends_on = None
+
+NAME_INDEX = [('files', 'ix_files_project_name', ['project_id', 'name'])]
+PROJECT_INDEX = [('files', 'ix_files_project_id', ['project_id'])]
+
+
+def upgrade() -> None:
+    swap_indexes(drop=PROJECT_INDEX, create=NAME_INDEX)
+
+
+def downgrade() -> None:
+    swap_indexes(drop=NAME_INDEX, create=PROJECT_INDEX)
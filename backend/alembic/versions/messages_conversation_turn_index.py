@@ -0,0 +1,31 @@
+"""messages_conversation_turn_index
+
+Revision ID: messages_conversation_turn_index
+Revises: conversation_keyset_index
+Create Date: 2026-02-23 10:00:00.000000
+
+Messages are always read per conversation in turn order (message list,
+selectinload of Conversation.messages) and counted per conversation. A
+composite (conversation_id, turn_index) index serves the ORDER BY without a
+sort and covers the conversation_id lookups and counts, so the
+single-column ix_messages_conversation_id goes away.
+"""
+from migration_helpers import swap_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = 'messages_conversation_turn_index'
+down_revision = 'conversation_keyset_index'
+branch_labels = None
+depends_on = None
+
+TURN_INDEX = [('messages', 'ix_messages_conversation_turn', ['conversation_id', 'turn_index'])]
+CONVERSATION_INDEX = [('messages', 'ix_messages_conversation_id', ['conversation_id'])]
+
+
+def upgrade() -> None:
+    swap_indexes(drop=CONVERSATION_INDEX, create=TURN_INDEX)
+
+
+def downgrade() -> None:
+    swap_indexes(drop=TURN_INDEX, create=CONVERSATION_INDEX)
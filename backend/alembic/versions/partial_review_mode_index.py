@@ -0,0 +1,47 @@
+"""partial_review_mode_index
+
+Revision ID: partial_review_mode_index
+Revises: add_arena_tables
+Create Date: 2026-02-02 10:00:00.000000
+
+Almost every review is in 'council' mode, so a full index on review_mode
+stores one entry per row for a key the planner never seeks on (a filter on
+'council' is a sequential scan anyway). Keep only the rows that are worth
+finding by mode.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'partial_review_mode_index'
+down_revision = 'add_arena_tables'
+branch_labels = None
+depends_on = None
+
+NON_COUNCIL = sa.text("review_mode <> 'council'")
+
+
+def _recreate_index(**kwargs) -> None:
+    dialect = op.get_context().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.drop_index('ix_reviews_review_mode', table_name='reviews',
+                          postgresql_concurrently=True)
+            op.create_index('ix_reviews_review_mode', 'reviews', ['review_mode'],
+                            postgresql_concurrently=True, **kwargs)
+    else:
+        op.drop_index('ix_reviews_review_mode', table_name='reviews')
+        op.create_index('ix_reviews_review_mode', 'reviews', ['review_mode'], **kwargs)
+
+
+def upgrade() -> None:
+    # Partial indexes exist on PostgreSQL and SQLite; elsewhere keep the full one
+    if op.get_context().dialect.name in ('postgresql', 'sqlite'):
+        _recreate_index(postgresql_where=NON_COUNCIL, sqlite_where=NON_COUNCIL)
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name in ('postgresql', 'sqlite'):
+        _recreate_index()
@@ -0,0 +1,53 @@
+"""project_file_count
+
+Revision ID: project_file_count
+Revises: messages_conversation_turn_index
+Create Date: 2026-03-02 10:00:00.000000
+
+Adds projects.file_count, a counter of the project's files kept up to date
+by create_file / delete_file. The per-project file limit is then enforced
+by one conditional UPDATE instead of a COUNT(*) over files before every
+upload (which also let two parallel uploads both take the last slot).
+
+On PostgreSQL the column is added nullable with the default attached for
+new rows only, existing projects are backfilled from files in batches and
+only then is NOT NULL enforced, every ALTER under a short lock timeout.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import alter, backfill
+
+
+# revision identifiers, used by Alembic.
+revision = 'project_file_count'
+down_revision = 'messages_conversation_turn_index'
+branch_labels = None
+depends_on = None
+
+FILE_COUNT = "(SELECT count(*) FROM files WHERE files.project_id = projects.id)"
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == 'sqlite':
+        # SQLite adds a NOT NULL column with a constant default in place
+        op.add_column('projects', sa.Column('file_count', sa.Integer(), nullable=False,
+                                            server_default='0'))
+        op.execute(f"UPDATE projects SET file_count = {FILE_COUNT}")
+        return
+
+    alter(lambda: op.add_column('projects', sa.Column('file_count', sa.Integer(), nullable=True)))
+    alter(lambda: op.alter_column('projects', 'file_count', existing_type=sa.Integer(),
+                                  server_default='0'))
+    backfill('projects', 'file_count', FILE_COUNT)
+    alter(lambda: op.alter_column('projects', 'file_count', existing_type=sa.Integer(),
+                                  nullable=False))
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'sqlite':
+        with op.batch_alter_table('projects', schema=None) as batch_op:
+            batch_op.drop_column('file_count')
+        return
+
+    alter(lambda: op.drop_column('projects', 'file_count'))
@@ -0,0 +1,37 @@
+"""review_issue_list_indexes
+
+Revision ID: review_issue_list_indexes
+Revises: files_project_name_index
+Create Date: 2026-03-06 10:00:00.000000
+
+Composite indexes matching the two paginated lists of the review API:
+reviews of a project newest first (project_id, created_at DESC) and issues
+of a review by severity, then age (review_id, severity DESC, created_at).
+Both serve their ORDER BY without a sort node and cover the project_id /
+review_id lookups and counts, so the single-column FK indexes go away.
+"""
+from migration_helpers import swap_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = 'review_issue_list_indexes'
+down_revision = 'files_project_name_index'
+branch_labels = None
+depends_on = None
+
+NEW_INDEXES = [
+    ('reviews', 'ix_reviews_project_created', ['project_id', 'created_at DESC']),
+    ('issues', 'ix_issues_review_severity_created', ['review_id', 'severity DESC', 'created_at']),
+]
+OLD_INDEXES = [
+    ('reviews', 'ix_reviews_project_id', ['project_id']),
+    ('issues', 'ix_issues_review_id', ['review_id']),
+]
+
+
+def upgrade() -> None:
+    swap_indexes(drop=OLD_INDEXES, create=NEW_INDEXES)
+
+
+def downgrade() -> None:
+    swap_indexes(drop=NEW_INDEXES, create=OLD_INDEXES)
@@ -2,7 +2,8 @@
 
 Endpoints:
 - POST /arena/sessions - utwórz nową sesję Arena
-- GET /arena/sessions - lista sesji użytkownika
+- GET /arena/sessions - lista sesji użytkownika (?project_id= zawęża do projektu)
+- GET /arena/sessions/export - eksport sesji użytkownika (NDJSON, strumieniowo)
 - GET /arena/sessions/{id} - szczegóły sesji
 - POST /arena/sessions/{id}/vote - zagłosuj na zwycięzcę
 - GET /arena/rankings - rankingi zespołów
@@ -10,8 +11,14 @@ Endpoints:
 import hashlib
 import json
 import logging
+from functools import lru_cache
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, Response, status, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import lambda_stmt
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlmodel import Session, select, func
 
 from app.database import get_session
@@ -22,11 +29,35 @@ from app.models.arena import (
     ArenaSessionCreate, ArenaSessionRead, ArenaVoteCreate, TeamRatingRead
 )
 from app.api.deps import get_current_user
+from app.utils.cache import cache
+from app.utils.tasks import enqueue_task, task
 
 logger = logging.getLogger(__name__)
 
+# Endpointy korzystają z synchronicznej sesji SQLModel, więc są zwykłymi `def` -
+# FastAPI uruchamia je w threadpoolu i zapytania do bazy nie blokują event loopa
 router = APIRouter(prefix="/arena", tags=["arena"])
 
+RANKINGS_CACHE_PREFIX = "arena:rankings:"
+RANKINGS_CACHE_TTL = 60  # sekundy
+EXPORT_BATCH_SIZE = 500  # Wierszy na partię przy eksporcie sesji
+
+# INSERT ... ON CONFLICT dla baz, które go obsługują (upsert ratingów)
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+# Kolumny TeamRating zwracane przez /rankings (pola TeamRatingRead)
+_RANKING_COLUMNS = (
+    TeamRating.id, TeamRating.config_hash, TeamRating.config, TeamRating.elo_rating,
+    TeamRating.games_played, TeamRating.wins, TeamRating.losses, TeamRating.ties,
+)
+
+# Walidacja i serializacja całej listy jednym skompilowanym walidatorem
+SESSION_LIST = TypeAdapter(list[ArenaSessionRead])
+RANKING_LIST = TypeAdapter(list[TeamRatingRead])
+
+# Pola wymagane w konfiguracji roli general (sprawdzane w tej kolejności)
+_ENGINE_FIELDS = ("provider", "model")
+
 
 def get_engine_config(config: dict) -> dict:
     """Wyciągnij konfigurację silnika (provider/model) z config zespołu."""
@@ -37,56 +68,100 @@ def get_engine_config(config: dict) -> dict:
 
 
 def get_engine_hash(engine_config: dict) -> str:
-    """Generuj unikalny hash dla silnika (provider/model)."""
-    sorted_config = json.dumps(engine_config, sort_keys=True)
+    """Generuj unikalny hash dla silnika (provider/model).
+
+    Hash liczymy w aplikacji, a nie jako kolumnę GENERATED w bazie: SQLite nie
+    ma funkcji skrótu, a jsonb::text w PostgreSQL nie daje tego samego tekstu
+    co json.dumps(sort_keys=True) (inna kolejność kluczy, escapowanie), więc
+    istniejące config_hash przestałyby pasować.
+    """
+    return _engine_hash(engine_config["provider"], engine_config["model"])
+
+
+@lru_cache(maxsize=1024)
+def _engine_hash(provider: str, model: str) -> str:
+    # Silników jest kilkadziesiąt, więc wynik cache'ujemy po (provider, model).
+    # Format JSON musi zostać ten sam - od niego zależą zapisane config_hash.
+    sorted_config = json.dumps({"provider": provider, "model": model}, sort_keys=True)
     return hashlib.sha256(sorted_config.encode()).hexdigest()
 
 
-def calculate_elo(winner_rating: float, loser_rating: float, is_tie: bool = False) -> tuple[float, float]:
-    """Oblicz nowe ratingi ELO po walce.
+ELO_K = 32  # Współczynnik K (jak szybko zmienia się rating)
 
-    Args:
-        winner_rating: Aktualny rating zwycięzcy
-        loser_rating: Aktualny rating przegranego
-        is_tie: Czy był remis
+# Wynik zespołu A dla danego głosu (zespół B dostaje 1 - wynik A)
+_VOTE_SCORE_A = {"A": 1.0, "B": 0.0, "tie": 0.5}
+# Który licznik rośnie zespołom (A, B) przy danym głosie
+_VOTE_COUNTERS = {"A": ("wins", "losses"), "B": ("losses", "wins"), "tie": ("ties", "ties")}
 
-    Returns:
-        tuple: (nowy_rating_zwycięzcy, nowy_rating_przegranego)
-    """
-    K = 32  # Współczynnik K (jak szybko zmienia się rating)
 
-    # Oczekiwana szansa na wygraną
-    expected_winner = 1 / (1 + 10 ** ((loser_rating - winner_rating) / 400))
-    expected_loser = 1 - expected_winner
+def elo_delta(rating_a: float, rating_b: float, score_a: float) -> float:
+    """Zmiana ratingu zespołu A po walce z B (B dostaje -zmiana: ELO sumuje się do zera).
 
-    if is_tie:
-        # Remis - każdy dostaje 0.5
-        new_winner = winner_rating + K * (0.5 - expected_winner)
-        new_loser = loser_rating + K * (0.5 - expected_loser)
-    else:
-        # Zwycięstwo/przegrana
-        new_winner = winner_rating + K * (1 - expected_winner)
-        new_loser = loser_rating + K * (0 - expected_loser)
+    Args:
+        rating_a: Aktualny rating zespołu A
+        rating_b: Aktualny rating zespołu B
+        score_a: Wynik A - 1 wygrana, 0.5 remis, 0 przegrana
 
-    return new_winner, new_loser
+    Returns:
+        float: o ile zmienia się rating A
+    """
+    # Oczekiwana szansa A na wygraną
+    expected_a = 1 / (1 + 10 ** ((rating_b - rating_a) / 400))
+    return ELO_K * (score_a - expected_a)
 
 
+@task("arena.run")
 async def run_arena_in_background(
     session_id: int,
     api_keys: dict | None = None,
-    engine_override=None,
 ):
     """Uruchom analizę Arena w tle."""
     from app.database import Session as DBSession, engine
     from app.orchestrators.arena import ArenaOrchestrator
 
-    with DBSession(engine_override or engine) as session:
+    with DBSession(engine) as session:
         orchestrator = ArenaOrchestrator(session)
         await orchestrator.run_arena(session_id, api_keys)
 
 
+def _upsert_ratings(session: Session, engines: dict[str, dict], now: datetime) -> dict[str, TeamRating]:
+    """Pobierz ratingi silników (hash -> config), tworząc brakujące.
+
+    Na PostgreSQL/SQLite to jedno INSERT ... ON CONFLICT (config_hash) DO UPDATE
+    ... RETURNING - bez wyścigu przy równoległych głosach na nowy silnik, a na
+    PostgreSQL wiersze zostają zablokowane do commitu, więc równoległe głosy nie
+    nadpisują sobie ELO. Inne bazy: SELECT ... IN + dodanie brakujących.
+    """
+    dialect = session.get_bind().dialect
+    insert = _UPSERT_INSERTS.get(dialect.name)
+
+    if insert is not None and dialect.insert_returning:
+        rows = [
+            TeamRating(config_hash=config_hash, config=engine).model_dump(exclude={"id"})
+            for config_hash, engine in engines.items()
+        ]
+        stmt = (
+            insert(TeamRating)
+            .values(rows)
+            .on_conflict_do_update(index_elements=["config_hash"], set_={"updated_at": now})
+            .returning(TeamRating)
+        )
+        ratings = session.scalars(stmt, execution_options={"populate_existing": True}).all()
+        return {r.config_hash: r for r in ratings}
+
+    ratings = session.exec(
+        select(TeamRating).where(TeamRating.config_hash.in_(list(engines)))
+    ).all()
+    by_hash = {r.config_hash: r for r in ratings}
+    for config_hash, engine in engines.items():
+        if config_hash not in by_hash:
+            by_hash[config_hash] = TeamRating(config_hash=config_hash, config=engine)
+            session.add(by_hash[config_hash])
+    return by_hash
+
+
 @router.post("/sessions", response_model=ArenaSessionRead, status_code=status.HTTP_201_CREATED)
-async def create_arena_session(
+def create_arena_session(
     data: ArenaSessionCreate,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
@@ -106,69 +181,52 @@ async def create_arena_session(
         raise HTTPException(status_code=403, detail="Brak dostępu do projektu")
 
     # Walidacja konfiguracji - wymagamy tylko general (pozostałe role ignorujemy)
-    logger.info(
-        "🔍 Arena validation: team_a_config keys=%s, team_b_config keys=%s",
-        list(data.team_a_config.keys()) if isinstance(data.team_a_config, dict) else 'NOT A DICT',
-        list(data.team_b_config.keys()) if isinstance(data.team_b_config, dict) else 'NOT A DICT'
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "🔍 Arena validation: team_a_config keys=%s, team_b_config keys=%s",
+            list(data.team_a_config.keys()) if isinstance(data.team_a_config, dict) else 'NOT A DICT',
+            list(data.team_b_config.keys()) if isinstance(data.team_b_config, dict) else 'NOT A DICT'
+        )
 
-    for team_name, config in [("A", data.team_a_config), ("B", data.team_b_config)]:
+    for team_name, config in (("A", data.team_a_config), ("B", data.team_b_config)):
         if not isinstance(config, dict):
             raise HTTPException(
                 status_code=422,
                 detail=f"Zespół {team_name}: konfiguracja musi być obiektem"
             )
 
-        config_keys = set(config.keys())
         if "general" not in config:
+            # Lista kluczy budowana tylko na ścieżce błędu
             raise HTTPException(
                 status_code=422,
-                detail=f"Zespół {team_name}: brak konfiguracji dla roli 'general'. Otrzymano klucze: {', '.join(sorted(config_keys))}"
+                detail=f"Zespół {team_name}: brak konfiguracji dla roli 'general'. Otrzymano klucze: {', '.join(sorted(config))}"
             )
 
-        general_config = config.get("general", {})
+        general_config = config["general"]
         if not isinstance(general_config, dict):
             raise HTTPException(
                 status_code=422,
                 detail=f"Zespół {team_name}, rola general: konfiguracja musi być obiektem"
             )
 
-        provider = general_config.get("provider")
-        model = general_config.get("model")
-
-        # Validate provider
-        if provider is None:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Zespół {team_name}, rola general: brak pola 'provider'"
-            )
-        if not isinstance(provider, str):
-            raise HTTPException(
-                status_code=422,
-                detail=f"Zespół {team_name}, rola general: 'provider' musi być stringiem (otrzymano: {type(provider).__name__})"
-            )
-        if not provider.strip():
-            raise HTTPException(
-                status_code=422,
-                detail=f"Zespół {team_name}, rola general: 'provider' nie może być pustym stringiem"
-            )
-
-        # Validate model
-        if model is None:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Zespół {team_name}, rola general: brak pola 'model'"
-            )
-        if not isinstance(model, str):
-            raise HTTPException(
-                status_code=422,
-                detail=f"Zespół {team_name}, rola general: 'model' musi być stringiem (otrzymano: {type(model).__name__})"
-            )
-        if not model.strip():
-            raise HTTPException(
-                status_code=422,
-                detail=f"Zespół {team_name}, rola general: 'model' nie może być pustym stringiem"
-            )
+        # Validate provider / model
+        for field in _ENGINE_FIELDS:
+            value = general_config.get(field)
+            if value is None:
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Zespół {team_name}, rola general: brak pola '{field}'"
+                )
+            if not isinstance(value, str):
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Zespół {team_name}, rola general: '{field}' musi być stringiem (otrzymano: {type(value).__name__})"
+                )
+            if not value.strip():
+                raise HTTPException(
+                    status_code=422,
+                    detail=f"Zespół {team_name}, rola general: '{field}' nie może być pustym stringiem"
+                )
 
     # Utwórz sesję
     arena_session = ArenaSession(
@@ -182,36 +240,71 @@ async def create_arena_session(
     session.commit()
     session.refresh(arena_session)
 
-    # Uruchom analizę w tle
-    background_tasks.add_task(
-        run_arena_in_background,
+    # Uruchom analizę w tle (kolejka Redis albo BackgroundTasks)
+    enqueue_task(
+        background_tasks,
+        "arena.run",
         arena_session.id,
         data.api_keys,
-        session.get_bind(),
     )
 
     logger.info(f"Arena session {arena_session.id} created for project {data.project_id}")
 
-    return ArenaSessionRead(**arena_session.model_dump())
+    return ArenaSessionRead.model_validate(arena_session)
 
 
 @router.get("/sessions", response_model=list[ArenaSessionRead])
-async def list_arena_sessions(
+def list_arena_sessions(
+    current_user: User = Depends(get_current_user),
+    session: Session = Depends(get_session),
+    project_id: int | None = None
+):
+    """Lista sesji Arena użytkownika (opcjonalnie tylko dla jednego projektu).
+
+    Filtr created_by sam ogranicza wynik do sesji użytkownika, więc filtr po
+    projekcie nie wymaga osobnego sprawdzania dostępu do projektu.
+    """
+    # lambda_stmt - SQL kompilowany raz i brany z cache (parametry jako bind)
+    user_id = current_user.id
+    query = lambda_stmt(lambda: select(ArenaSession).where(ArenaSession.created_by == user_id))
+    if project_id is not None:
+        query += lambda q: q.where(ArenaSession.project_id == project_id)
+    query += lambda q: q.order_by(ArenaSession.created_at.desc())
+
+    sessions = SESSION_LIST.validate_python(session.scalars(query).all(), from_attributes=True)
+    return Response(content=SESSION_LIST.dump_json(sessions), media_type="application/json")
+
+
+@router.get("/sessions/export")
+def export_arena_sessions(
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    """Lista sesji Arena użytkownika."""
+    """Eksport wszystkich sesji Arena użytkownika jako NDJSON (jedna sesja na linię).
+
+    Wiersze są czytane partiami (yield_per) i wysyłane strumieniowo, więc
+    pamięć zależy od rozmiaru partii, a nie od liczby sesji. Generator
+    otwiera własną sesję - sesja z Depends jest zamykana przed wysłaniem
+    odpowiedzi.
+    """
+    bind = session.get_bind()
     query = (
         select(ArenaSession)
         .where(ArenaSession.created_by == current_user.id)
         .order_by(ArenaSession.created_at.desc())
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
     )
-    sessions = session.exec(query).all()
-    return [ArenaSessionRead(**s.model_dump()) for s in sessions]
+
+    def generate():
+        with Session(bind) as export_session:
+            for arena_session in export_session.exec(query):
+                yield ArenaSessionRead.model_validate(arena_session).model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/sessions/{session_id}", response_model=ArenaSessionRead)
-async def get_arena_session(
+def get_arena_session(
     session_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
@@ -225,11 +318,11 @@ async def get_arena_session(
     if arena_session.created_by != current_user.id:
         raise HTTPException(status_code=403, detail="Brak dostępu do sesji")
 
-    return ArenaSessionRead(**arena_session.model_dump())
+    return ArenaSessionRead.model_validate(arena_session)
 
 
 @router.post("/sessions/{session_id}/vote", response_model=ArenaSessionRead)
-async def vote_arena_session(
+def vote_arena_session(
     session_id: int,
     vote: ArenaVoteCreate,
     current_user: User = Depends(get_current_user),
@@ -259,12 +352,13 @@ async def vote_arena_session(
     if arena_session.winner:
         raise HTTPException(status_code=400, detail="Już zagłosowano w tej sesji")
 
-    # Zapisz głos
+    # Zapisz głos (jeden znacznik czasu dla sesji i obu ratingów)
+    now = datetime.now(timezone.utc)
     arena_session.winner = vote.winner
     arena_session.vote_comment = vote.comment
-    arena_session.voted_at = datetime.now(timezone.utc)
+    arena_session.voted_at = now
     arena_session.status = "completed"
-    arena_session.completed_at = datetime.now(timezone.utc)
+    arena_session.completed_at = now
 
     # Aktualizuj rankingi ELO
     team_a_engine = get_engine_config(arena_session.team_a_config)
@@ -272,67 +366,37 @@ async def vote_arena_session(
     team_a_hash = get_engine_hash(team_a_engine)
     team_b_hash = get_engine_hash(team_b_engine)
 
-    # Pobierz lub utwórz ratingi dla obu zespołów
-    team_a_rating = session.exec(
-        select(TeamRating).where(TeamRating.config_hash == team_a_hash)
-    ).first()
-    if not team_a_rating:
-        team_a_rating = TeamRating(
-            config_hash=team_a_hash,
-            config=team_a_engine
-        )
-        session.add(team_a_rating)
-
-    team_b_rating = session.exec(
-        select(TeamRating).where(TeamRating.config_hash == team_b_hash)
-    ).first()
-    if not team_b_rating:
-        team_b_rating = TeamRating(
-            config_hash=team_b_hash,
-            config=team_b_engine
-        )
-        session.add(team_b_rating)
-
-    session.commit()
-    session.refresh(team_a_rating)
-    session.refresh(team_b_rating)
-
-    # Oblicz nowe ratingi
-    if vote.winner == "A":
-        new_a, new_b = calculate_elo(team_a_rating.elo_rating, team_b_rating.elo_rating)
-        team_a_rating.wins += 1
-        team_b_rating.losses += 1
-    elif vote.winner == "B":
-        new_b, new_a = calculate_elo(team_b_rating.elo_rating, team_a_rating.elo_rating)
-        team_a_rating.losses += 1
-        team_b_rating.wins += 1
-    else:  # tie
-        new_a, new_b = calculate_elo(
-            team_a_rating.elo_rating, team_b_rating.elo_rating, is_tie=True
-        )
-        team_a_rating.ties += 1
-        team_b_rating.ties += 1
-
-    team_a_rating.elo_rating = new_a
-    team_b_rating.elo_rating = new_b
+    # Utwórz brakujące / zablokuj istniejące ratingi obu zespołów jednym upsertem
+    by_hash = _upsert_ratings(session, {team_a_hash: team_a_engine, team_b_hash: team_b_engine}, now)
+    team_a_rating = by_hash[team_a_hash]
+    team_b_rating = by_hash[team_b_hash]
+
+    # Oblicz nowe ratingi - jedna zmiana, z przeciwnym znakiem dla B
+    delta = elo_delta(team_a_rating.elo_rating, team_b_rating.elo_rating, _VOTE_SCORE_A[vote.winner])
+    team_a_rating.elo_rating += delta
+    team_b_rating.elo_rating -= delta
+    counter_a, counter_b = _VOTE_COUNTERS[vote.winner]
+    setattr(team_a_rating, counter_a, getattr(team_a_rating, counter_a) + 1)
+    setattr(team_b_rating, counter_b, getattr(team_b_rating, counter_b) + 1)
     team_a_rating.games_played += 1
     team_b_rating.games_played += 1
-    team_a_rating.updated_at = datetime.now(timezone.utc)
-    team_b_rating.updated_at = datetime.now(timezone.utc)
+    team_a_rating.updated_at = now
+    team_b_rating.updated_at = now
 
     session.add(arena_session)
-    session.add(team_a_rating)
-    session.add(team_b_rating)
     session.commit()
     session.refresh(arena_session)
 
+    # Nowe ratingi - unieważnij zapisane rankingi (wszystkie warianty min_games)
+    cache.delete_prefix(RANKINGS_CACHE_PREFIX)
+
     logger.info(f"Arena session {session_id} voted: winner={vote.winner}")
 
-    return ArenaSessionRead(**arena_session.model_dump())
+    return ArenaSessionRead.model_validate(arena_session)
 
 
 @router.get("/rankings", response_model=list[TeamRatingRead])
-async def get_arena_rankings(
+def get_arena_rankings(
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
     min_games: int = 1
@@ -341,20 +405,24 @@ async def get_arena_rankings(
 
     Rankingi są sortowane po ELO rating (najlepsze na górze).
     Można filtrować po minimalnej liczbie gier.
+
+    Wynik trzymamy w cache już jako JSON, więc trafienie w cache zwraca
+    gotowe bajty bez ponownej walidacji i serializacji.
     """
-    query = (
-        select(TeamRating)
+    cache_key = f"{RANKINGS_CACHE_PREFIX}{min_games}"
+    cached = cache.get_raw(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Tylko kolumny potrzebne w odpowiedzi - wiersze (Row) zamiast obiektów ORM,
+    # bez identity map i śledzenia stanu dla danych tylko do odczytu
+    query = lambda_stmt(
+        lambda: select(*_RANKING_COLUMNS)
         .where(TeamRating.games_played >= min_games)
         .order_by(TeamRating.elo_rating.desc())
     )
-    ratings = session.exec(query).all()
-
-    result = []
-    for r in ratings:
-        win_rate = (r.wins / r.games_played * 100) if r.games_played > 0 else 0
-        result.append(TeamRatingRead(
-            **r.model_dump(),
-            win_rate=round(win_rate, 1)
-        ))
+    rows = session.execute(query).all()
 
-    return result
+    payload = RANKING_LIST.dump_json(RANKING_LIST.validate_python(rows, from_attributes=True)).decode()
+    cache.set_raw(cache_key, payload, ttl=RANKINGS_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
@@ -1,17 +1,49 @@
 """Audit log API endpoints."""
 from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Row, lambda_stmt, tuple_
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlmodel import Session, select, func
 from app.database import get_session
 from app.models.user import User
 from app.models.audit import AuditLog, AuditLogRead, AuditAction
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_token_payload
 
-router = APIRouter(prefix="/audit", tags=["audit"])
+router = APIRouter(prefix="/audit", tags=["audit"], default_response_class=ORJSONResponse)
 
+# Validates a whole page straight from the result rows (no per-row model_dump)
+AUDIT_LOG_LIST = TypeAdapter(list[AuditLogRead])
 
-def require_superuser(current_user: User = Depends(get_current_user)) -> User:
-    """Dependency to require superuser access."""
+# Only the columns AuditLogRead exposes (user_agent is never returned)
+_READ_COLUMNS = tuple(getattr(AuditLog, name) for name in AuditLogRead.model_fields)
+
+
+def _require_superuser_claim(payload: dict = Depends(get_token_payload)) -> None:
+    """Reject tokens whose signed "sup" claim is false, before any DB lookup.
+
+    Tokens issued before the claim existed carry no "sup" at all; those are
+    decided by the user row alone instead of forcing a re-login.
+    """
+    if payload.get("sup", True) is False:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Superuser access required"
+        )
+
+
+def require_superuser(
+    _claim: None = Depends(_require_superuser_claim),
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """Dependency to require superuser access.
+
+    The "sup" claim only turns regular users away early; it saves no query
+    for superusers. A token issued before the account was deactivated or
+    lost the superuser flag is still valid, so both flags are confirmed
+    against the user row (get_current_user reads them fresh).
+    """
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -20,97 +52,150 @@ def require_superuser(current_user: User = Depends(get_current_user)) -> User:
     return current_user
 
 
-@router.get("/logs", response_model=list[AuditLogRead])
-async def get_audit_logs(
-    current_user: User = Depends(require_superuser),
-    session: Session = Depends(get_session),
+def audit_filters(
     user_id: int | None = Query(None, description="Filter by user ID"),
     action: AuditAction | None = Query(None, description="Filter by action type"),
     resource_type: str | None = Query(None, description="Filter by resource type"),
     from_date: datetime | None = Query(None, description="Filter from date"),
     to_date: datetime | None = Query(None, description="Filter to date"),
-    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
-    offset: int = Query(0, ge=0, description="Number of records to skip"),
-):
-    """Get audit logs with optional filters.
-
-    Only accessible by superusers.
+) -> dict:
+    """Query parameters shared by the list and count endpoints."""
+    return {
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "from_date": from_date,
+        "to_date": to_date,
+    }
+
+
+def apply_filters(
+    query: StatementLambdaElement,
+    *,
+    user_id: int | None = None,
+    action: AuditAction | None = None,
+    resource_type: str | None = None,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+) -> StatementLambdaElement:
+    """Add the given filters to a lambda_stmt.
+
+    Each combination of filters compiles once and is then served from the
+    statement cache; the values are bound parameters.
     """
-    statement = select(AuditLog)
-
-    # Apply filters
     if user_id is not None:
-        statement = statement.where(AuditLog.user_id == user_id)
+        query += lambda q: q.where(AuditLog.user_id == user_id)
     if action is not None:
-        statement = statement.where(AuditLog.action == action)
+        query += lambda q: q.where(AuditLog.action == action)
     if resource_type is not None:
-        statement = statement.where(AuditLog.resource_type == resource_type)
+        query += lambda q: q.where(AuditLog.resource_type == resource_type)
     if from_date is not None:
-        statement = statement.where(AuditLog.created_at >= from_date)
+        query += lambda q: q.where(AuditLog.created_at >= from_date)
     if to_date is not None:
-        statement = statement.where(AuditLog.created_at <= to_date)
+        query += lambda q: q.where(AuditLog.created_at <= to_date)
+    return query
+
+
+def apply_cursor(
+    query: StatementLambdaElement,
+    cursor_created_at: datetime | None,
+    cursor_id: int | None,
+    limit: int,
+) -> StatementLambdaElement:
+    """Keyset pagination: continue after the (created_at, id) of the last seen row.
+
+    Seeks straight into the (.., created_at DESC, id DESC) index instead of
+    scanning and discarding OFFSET rows, so deep pages cost the same as the first.
+    """
+    if (cursor_created_at is None) != (cursor_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor_created_at and cursor_id must be given together"
+        )
+    if cursor_created_at is not None:
+        query += lambda q: q.where(
+            tuple_(AuditLog.created_at, AuditLog.id) < tuple_(cursor_created_at, cursor_id)
+        )
+    query += lambda q: q.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit)
+    return query
 
-    # Order by most recent first
-    statement = statement.order_by(AuditLog.created_at.desc())
 
-    # Apply pagination
-    statement = statement.offset(offset).limit(limit)
+def audit_page_response(request: Request, logs: list[Row], limit: int) -> ORJSONResponse:
+    """Serialize a page of logs, linking the next page (rel="next") if there may be one.
 
-    logs = session.exec(statement).all()
-    return [AuditLogRead(**log.model_dump()) for log in logs]
+    Returned directly, so FastAPI does not validate and encode the page again
+    against response_model (which stays for the OpenAPI schema).
+    """
+    headers = {}
+    if len(logs) == limit:
+        last = logs[-1]
+        next_url = request.url.include_query_params(
+            cursor_created_at=last.created_at.isoformat(), cursor_id=last.id
+        )
+        headers["Link"] = f'<{next_url}>; rel="next"'
+
+    page = AUDIT_LOG_LIST.validate_python(logs, from_attributes=True)
+    return ORJSONResponse(AUDIT_LOG_LIST.dump_python(page, mode="json"), headers=headers)
+
+
+@router.get("/logs", response_model=list[AuditLogRead])
+def get_audit_logs(
+    request: Request,
+    _superuser: User = Depends(require_superuser),
+    session: Session = Depends(get_session),
+    filters: dict = Depends(audit_filters),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor_created_at: datetime | None = Query(None, description="created_at of the last seen record"),
+    cursor_id: int | None = Query(None, description="id of the last seen record"),
+):
+    """Get audit logs with optional filters, newest first.
+
+    Only accessible by superusers. The next page is linked in the Link header.
+    """
+    query = apply_filters(lambda_stmt(lambda: select(*_READ_COLUMNS)), **filters)
+
+    # Most recent first, continuing after the cursor
+    query = apply_cursor(query, cursor_created_at, cursor_id, limit)
+
+    logs = session.execute(query).all()
+    return audit_page_response(request, logs, limit)
 
 
 @router.get("/logs/count")
-async def get_audit_logs_count(
-    current_user: User = Depends(require_superuser),
+def get_audit_logs_count(
+    _superuser: User = Depends(require_superuser),
     session: Session = Depends(get_session),
-    user_id: int | None = Query(None, description="Filter by user ID"),
-    action: AuditAction | None = Query(None, description="Filter by action type"),
-    resource_type: str | None = Query(None, description="Filter by resource type"),
-    from_date: datetime | None = Query(None, description="Filter from date"),
-    to_date: datetime | None = Query(None, description="Filter to date"),
+    filters: dict = Depends(audit_filters),
 ):
     """Get count of audit logs matching filters.
 
     Only accessible by superusers.
     """
-    statement = select(func.count(AuditLog.id))
+    # COUNT(*) - no column to read, so filtered counts can use index-only scans
+    query = apply_filters(lambda_stmt(lambda: select(func.count()).select_from(AuditLog)), **filters)
 
-    # Apply filters
-    if user_id is not None:
-        statement = statement.where(AuditLog.user_id == user_id)
-    if action is not None:
-        statement = statement.where(AuditLog.action == action)
-    if resource_type is not None:
-        statement = statement.where(AuditLog.resource_type == resource_type)
-    if from_date is not None:
-        statement = statement.where(AuditLog.created_at >= from_date)
-    if to_date is not None:
-        statement = statement.where(AuditLog.created_at <= to_date)
-
-    count = session.exec(statement).one()
+    count = session.scalar(query)
     return {"count": count}
 
 
 @router.get("/logs/my", response_model=list[AuditLogRead])
-async def get_my_audit_logs(
+def get_my_audit_logs(
+    request: Request,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
     action: AuditAction | None = Query(None, description="Filter by action type"),
     limit: int = Query(50, ge=1, le=100, description="Number of records to return"),
-    offset: int = Query(0, ge=0, description="Number of records to skip"),
+    cursor_created_at: datetime | None = Query(None, description="created_at of the last seen record"),
+    cursor_id: int | None = Query(None, description="id of the last seen record"),
 ):
     """Get current user's audit logs.
 
     Allows users to see their own activity history.
     """
-    statement = select(AuditLog).where(AuditLog.user_id == current_user.id)
-
-    if action is not None:
-        statement = statement.where(AuditLog.action == action)
-
-    statement = statement.order_by(AuditLog.created_at.desc())
-    statement = statement.offset(offset).limit(limit)
+    query = apply_filters(
+        lambda_stmt(lambda: select(*_READ_COLUMNS)), user_id=current_user.id, action=action
+    )
+    query = apply_cursor(query, cursor_created_at, cursor_id, limit)
 
-    logs = session.exec(statement).all()
-    return [AuditLogRead(**log.model_dump()) for log in logs]
+    logs = session.execute(query).all()
+    return audit_page_response(request, logs, limit)
@@ -1,7 +1,12 @@
 """Authentication API endpoints."""
+import base64
 import logging
+import os
 import secrets
+import threading
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
+from sqlalchemy import exists
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 from app.database import get_session
 from app.models.user import User, UserCreate, UserLogin, UserRead, Token, TokenWithRefresh, RefreshTokenRequest, PasswordChange
@@ -10,13 +15,15 @@ from app.utils.auth import (
     verify_password,
     create_access_token,
     create_refresh_token,
-    decode_refresh_token,
+    decode_refresh_token_cached,
+    forget_access_token,
+    forget_refresh_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     REFRESH_TOKEN_EXPIRE_DAYS,
 )
 from app.utils.validation import validate_email_format, validate_password_strength
 from app.config import settings
-from app.utils.audit import log_audit_event, get_client_ip, get_user_agent
+from app.utils.audit import sync_log_audit_event, get_client_ip, get_user_agent
 from app.utils.rate_limit import check_rate_limit
 from app.models.audit import AuditAction
 from app.api.deps import get_current_user
@@ -25,43 +32,82 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+EMAIL_TAKEN = "Ten email jest już zarejestrowany"
+USERNAME_TAKEN = "Ta nazwa użytkownika jest już zajęta"
+
+# Verified against when the email is unknown, so a login costs one bcrypt
+# check either way and response time does not reveal registered emails
+_DUMMY_HASH = hash_password(secrets.token_urlsafe(12))
+
+# CSRF tokens are cut from a buffer refilled with os.urandom 4 KiB at a time
+# (one syscall per 128 tokens instead of one per login/refresh)
+CSRF_TOKEN_BYTES = 32
+_ENTROPY_REFILL = 4096
+_entropy = bytearray()
+_entropy_lock = threading.Lock()
+
+
+def _reset_entropy_after_fork() -> None:
+    """A forked worker must not hand out the bytes its parent (or a sibling) will."""
+    global _entropy_lock
+    # The lock may have been held by another thread at fork time
+    _entropy_lock = threading.Lock()
+    _entropy.clear()
+
+
+os.register_at_fork(after_in_child=_reset_entropy_after_fork)
+
+
+def _csrf_token() -> str:
+    """Return a fresh URL-safe CSRF token (same format as secrets.token_urlsafe(32))."""
+    with _entropy_lock:
+        if len(_entropy) < CSRF_TOKEN_BYTES:
+            _entropy.extend(os.urandom(_ENTROPY_REFILL))
+        chunk = bytes(_entropy[:CSRF_TOKEN_BYTES])
+        # Each byte is handed out exactly once
+        del _entropy[:CSRF_TOKEN_BYTES]
+    return base64.urlsafe_b64encode(chunk).rstrip(b"=").decode("ascii")
+
+
+def _cookie_template(name: str, max_age: int, httponly: bool) -> bytes:
+    """Set-Cookie value with a %s slot for the cookie value.
+
+    Same attributes, in the same order, as Response.set_cookie(path="/",
+    samesite="lax", secure=settings.is_production) produces.
+    """
+    attrs = [f"{name}=%s"]
+    if httponly:
+        attrs.append("HttpOnly")
+    attrs += [f"Max-Age={max_age}", "Path=/", "SameSite=lax"]
+    if settings.is_production:
+        attrs.append("Secure")
+    return "; ".join(attrs).encode("latin-1")
+
+
+# Cookie attributes only depend on the environment - formatted once at import
+_ACCESS_COOKIE = _cookie_template("access_token", ACCESS_TOKEN_EXPIRE_MINUTES * 60, httponly=True)
+_REFRESH_COOKIE = _cookie_template("refresh_token", REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60, httponly=True)
+_CSRF_COOKIE = _cookie_template("csrf_token", REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60, httponly=False)
+
 
 def _set_auth_cookies(response: Response, access_token: str, refresh_token: str) -> str:
-    csrf_token = secrets.token_urlsafe(32)
-    secure = settings.is_production
-    response.set_cookie(
-        key="access_token",
-        value=access_token,
-        httponly=True,
-        secure=secure,
-        samesite="lax",
-        max_age=ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        path="/",
-    )
-    response.set_cookie(
-        key="refresh_token",
-        value=refresh_token,
-        httponly=True,
-        secure=secure,
-        samesite="lax",
-        max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
-        path="/",
-    )
-    response.set_cookie(
-        key="csrf_token",
-        value=csrf_token,
-        httponly=False,
-        secure=secure,
-        samesite="lax",
-        max_age=REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
-        path="/",
-    )
+    csrf_token = _csrf_token()
+    response.raw_headers.extend((
+        (b"set-cookie", _ACCESS_COOKIE % access_token.encode("latin-1")),
+        (b"set-cookie", _REFRESH_COOKIE % refresh_token.encode("latin-1")),
+        (b"set-cookie", _CSRF_COOKIE % csrf_token.encode("latin-1")),
+    ))
     return csrf_token
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, request: Request, session: Session = Depends(get_session)):
-    """Register a new user."""
+def register(user_data: UserCreate, request: Request, session: Session = Depends(get_session)):
+    """Register a new user.
+
+    Rate limited to 3 registrations per minute per IP address.
+    """
+    check_rate_limit(request, user_id=None, limit=3)
+
     try:
         logger.info(f"Registration attempt for email domain: {user_data.email.split('@')[-1] if '@' in user_data.email else 'invalid'}")
 
@@ -80,22 +126,22 @@ async def register(user_data: UserCreate, request: Request, session: Session = D
                 detail=error_msg
             )
 
-        # Check if email already exists
-        statement = select(User).where(User.email == user_data.email)
-        existing_user = session.exec(statement).first()
-        if existing_user:
+        # Check if email or username already exists - two EXISTS probes on the
+        # unique indexes, answered as two booleans in one round-trip
+        statement = select(
+            exists().where(User.email == user_data.email),
+            exists().where(User.username == user_data.username),
+        )
+        email_taken, username_taken = session.exec(statement).one()
+        if email_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Ten email jest już zarejestrowany"
+                detail=EMAIL_TAKEN
             )
-
-        # Check if username already exists
-        statement = select(User).where(User.username == user_data.username)
-        existing_user = session.exec(statement).first()
-        if existing_user:
+        if username_taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Ta nazwa użytkownika jest już zajęta"
+                detail=USERNAME_TAKEN
             )
 
         hashed_pw = hash_password(user_data.password)
@@ -107,20 +153,32 @@ async def register(user_data: UserCreate, request: Request, session: Session = D
             hashed_password=hashed_pw
         )
         session.add(user)
-        session.commit()
+        try:
+            session.commit()
+        except IntegrityError as e:
+            # Concurrent registration won the race between the check and INSERT;
+            # the unique index (ix_users_email / ix_users_username) tells which one
+            session.rollback()
+            message = str(e.orig)
+            email_taken = "ix_users_email" in message or "users.email" in message
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=EMAIL_TAKEN if email_taken else USERNAME_TAKEN
+            )
         session.refresh(user)
 
         logger.info(f"User registered successfully: ID={user.id}")
 
         # Log audit event
-        await log_audit_event(
+        sync_log_audit_event(
             session=session,
             action=AuditAction.REGISTER,
             user_id=user.id,
             resource_type="user",
             resource_id=user.id,
             details=f"User registered: {user.username}",
-            request=request,
+            ip_address=get_client_ip(request),
+            user_agent=get_user_agent(request),
         )
 
         return user
@@ -135,7 +193,7 @@ async def register(user_data: UserCreate, request: Request, session: Session = D
 
 
 @router.post("/login", response_model=TokenWithRefresh)
-async def login(
+def login(
     credentials: UserLogin,
     request: Request,
     response: Response,
@@ -154,12 +212,14 @@ async def login(
     statement = select(User).where(User.email == credentials.email)
     user = session.exec(statement).first()
 
-    logger.info(f"User found: {user is not None}")
-    if user:
-        password_valid = verify_password(credentials.password, user.hashed_password)
-        logger.info(f"Password valid: {password_valid}")
+    # bcrypt is deliberately slow - verify once; the endpoint runs in the
+    # threadpool, so the KDF never blocks the event loop
+    password_valid = verify_password(
+        credentials.password, user.hashed_password if user else _DUMMY_HASH
+    ) and user is not None
+    logger.info(f"User found: {user is not None}, password valid: {password_valid}")
 
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not password_valid:
         logger.warning(f"Login failed for: {credentials.email}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -174,21 +234,22 @@ async def login(
         )
 
     # Create tokens
-    token_data = {"user_id": user.id, "email": user.email}
+    token_data = {"user_id": user.id, "email": user.email, "sup": user.is_superuser}
     access_token = create_access_token(data=token_data)
     refresh_token = create_refresh_token(data=token_data)
 
     logger.info(f"User logged in: ID={user.id}")
 
     # Log audit event
-    await log_audit_event(
+    sync_log_audit_event(
         session=session,
         action=AuditAction.LOGIN,
         user_id=user.id,
         resource_type="user",
         resource_id=user.id,
         details="User logged in successfully",
-        request=request,
+        ip_address=get_client_ip(request),
+        user_agent=get_user_agent(request),
     )
 
     _set_auth_cookies(response, access_token, refresh_token)
@@ -196,7 +257,7 @@ async def login(
 
 
 @router.post("/refresh", response_model=TokenWithRefresh)
-async def refresh_tokens(
+def refresh_tokens(
     request: Request,
     response: Response,
     session: Session = Depends(get_session),
@@ -209,7 +270,7 @@ async def refresh_tokens(
         refresh_token = refresh_request.refresh_token
     if not refresh_token:
         refresh_token = request.cookies.get("refresh_token")
-    payload = decode_refresh_token(refresh_token) if refresh_token else None
+    payload = decode_refresh_token_cached(refresh_token) if refresh_token else None
     if not payload:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -229,21 +290,22 @@ async def refresh_tokens(
         )
 
     # Create new tokens
-    token_data = {"user_id": user.id, "email": user.email}
+    token_data = {"user_id": user.id, "email": user.email, "sup": user.is_superuser}
     access_token = create_access_token(data=token_data)
     refresh_token = create_refresh_token(data=token_data)
 
     logger.info(f"Tokens refreshed for user: ID={user.id}")
 
     # Log audit event
-    await log_audit_event(
+    sync_log_audit_event(
         session=session,
         action=AuditAction.TOKEN_REFRESH,
         user_id=user.id,
         resource_type="user",
         resource_id=user.id,
         details="Tokens refreshed",
-        request=request,
+        ip_address=get_client_ip(request),
+        user_agent=get_user_agent(request),
     )
 
     _set_auth_cookies(response, access_token, refresh_token)
@@ -251,8 +313,14 @@ async def refresh_tokens(
 
 
 @router.post("/logout")
-async def logout(response: Response):
+async def logout(request: Request, response: Response):
     """Clear auth cookies."""
+    refresh_token = request.cookies.get("refresh_token")
+    if refresh_token:
+        forget_refresh_token(refresh_token)
+    access_token = request.cookies.get("access_token")
+    if access_token:
+        forget_access_token(access_token)
     response.delete_cookie("access_token", path="/")
     response.delete_cookie("refresh_token", path="/")
     response.delete_cookie("csrf_token", path="/")
@@ -260,13 +328,13 @@ async def logout(response: Response):
 
 
 @router.get("/me", response_model=UserRead)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: User = Depends(get_current_user)):
     """Get current authenticated user information."""
     return current_user
 
 
 @router.patch("/me/password")
-async def change_password(
+def change_password(
     password_data: PasswordChange,
     request: Request,
     current_user: User = Depends(get_current_user),
@@ -296,14 +364,15 @@ async def change_password(
     logger.info(f"Password changed for user: ID={current_user.id}")
 
     # Log audit event
-    await log_audit_event(
+    sync_log_audit_event(
         session=session,
         action=AuditAction.PASSWORD_CHANGE,
         user_id=current_user.id,
         resource_type="user",
         resource_id=current_user.id,
         details="Password changed successfully",
-        request=request,
+        ip_address=get_client_ip(request),
+        user_agent=get_user_agent(request),
     )
 
     return {"message": "Hasło zostało zmienione pomyślnie"}
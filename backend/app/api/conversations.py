@@ -1,68 +1,56 @@
 """Conversation API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Response, Request
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import tuple_
 from sqlmodel import Session, select, func
-from app.database import get_session
+from app.database import engine, get_session
 from app.models.user import User
-from app.models.review import Review, Issue
-from app.models.project import Project
 from app.models.conversation import (
     Conversation, Message,
-    ConversationCreate, ConversationRead,
+    ConversationCreate, ConversationRead, ConversationReadWithMessages,
     MessageRead, DebateIssueRequest
 )
 from app.api.deps import get_current_user
 from app.orchestrators.conversation import ConversationOrchestrator
-from app.utils.access import verify_review_access
-
-router = APIRouter(prefix="/conversations", tags=["conversations"])
-reviews_router = APIRouter(prefix="/reviews/{review_id}/conversations", tags=["conversations"])
-issues_router = APIRouter(prefix="/issues/{issue_id}/debate", tags=["conversations"])
-
-
-def build_link_header(request: Request, page: int, page_size: int, total: int) -> str:
-    """Build RFC 5988 compliant Link header for pagination.
-
-    Args:
-        request: FastAPI Request object
-        page: Current page number
-        page_size: Items per page
-        total: Total number of items
-
-    Returns:
-        Link header string with rel="first", "prev", "next", "last"
-    """
-    base_url = str(request.url.remove_query_params("page", "page_size"))
-    total_pages = (total + page_size - 1) // page_size if page_size > 0 else 1
-
-    links = []
-
-    # First page
-    links.append(f'<{base_url}?page=1&page_size={page_size}>; rel="first"')
-
-    # Previous page
-    if page > 1:
-        links.append(f'<{base_url}?page={page - 1}&page_size={page_size}>; rel="prev"')
+from app.utils.access import (
+    verify_conversation_access, verify_conversation_access_with_count,
+    verify_issue_access, verify_review_access
+)
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.tasks import enqueue_task, task
 
-    # Next page
-    if page < total_pages:
-        links.append(f'<{base_url}?page={page + 1}&page_size={page_size}>; rel="next"')
+router = APIRouter(prefix="/conversations", tags=["conversations"], default_response_class=ORJSONResponse)
+reviews_router = APIRouter(
+    prefix="/reviews/{review_id}/conversations", tags=["conversations"], default_response_class=ORJSONResponse
+)
+issues_router = APIRouter(
+    prefix="/issues/{issue_id}/debate", tags=["conversations"], default_response_class=ORJSONResponse
+)
 
-    # Last page
-    links.append(f'<{base_url}?page={total_pages}&page_size={page_size}>; rel="last"')
+CONVERSATION_LIST = TypeAdapter(list[ConversationRead])
+MESSAGE_LIST = TypeAdapter(list[MessageRead])
 
-    return ", ".join(links)
+# Only the columns ConversationRead exposes (meta_info JSON is never listed)
+_READ_COLUMNS = tuple(
+    getattr(Conversation, name) for name in ConversationRead.model_fields if name != "message_count"
+)
 
 
-async def run_conversation_in_background(conversation_id: int, provider: str | None, model: str | None):
-    """Run conversation in background task."""
-    from app.database import Session, engine
+@task("conversations.run")
+async def run_conversation_in_background(
+    conversation_id: int,
+    provider: str | None,
+    model: str | None,
+):
+    """Run conversation in background task (task worker or BackgroundTasks)."""
     with Session(engine) as session:
         orchestrator = ConversationOrchestrator(session)
         await orchestrator.run_conversation(conversation_id, provider, model)
 
 
 @reviews_router.post("", response_model=ConversationRead, status_code=status.HTTP_201_CREATED)
-async def create_conversation(
+def create_conversation(
     review_id: int,
     conversation_data: ConversationCreate,
     background_tasks: BackgroundTasks,
@@ -70,7 +58,7 @@ async def create_conversation(
     session: Session = Depends(get_session)
 ):
     """Create and start a new conversation for a review."""
-    review = await verify_review_access(review_id, current_user, session)
+    review = verify_review_access(review_id, current_user, session)
 
     # Create conversation
     conversation = Conversation(
@@ -84,144 +72,128 @@ async def create_conversation(
     session.commit()
     session.refresh(conversation)
 
-    # Start conversation in background
-    background_tasks.add_task(
-        run_conversation_in_background,
+    # Start conversation in background (Redis task queue or BackgroundTasks)
+    enqueue_task(
+        background_tasks,
+        "conversations.run",
         conversation.id,
         conversation_data.provider,
-        conversation_data.model
+        conversation_data.model,
     )
 
-    return ConversationRead(
-        **conversation.model_dump(),
-        message_count=0
-    )
+    return ConversationRead.model_validate(conversation)
 
 
 @reviews_router.get("", response_model=list[ConversationRead])
-async def list_review_conversations(
+def list_review_conversations(
     review_id: int,
     request: Request,
-    response: Response,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page")
+    cursor: str | None = Query(None, description="Cursor from the previous page (Link rel=\"next\")"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page")
 ):
-    """List all conversations for a review with pagination."""
-    await verify_review_access(review_id, current_user, session)
-
-    offset = (page - 1) * page_size
-
-    # Get total count for pagination links
-    count_stmt = select(func.count(Conversation.id)).where(Conversation.review_id == review_id)
-    total = session.exec(count_stmt).one()
+    """List conversations for a review, newest first, with cursor pagination.
 
-    # Add Link header (RFC 5988)
-    if total > 0:
-        response.headers["Link"] = build_link_header(request, page, page_size, total)
-
-    # Optimized query with LEFT JOIN to avoid N+1 problem
-    statement = (
-        select(
-            Conversation,
-            func.count(Message.id).label('message_count')
-        )
-        .outerjoin(Message, Message.conversation_id == Conversation.id)
-        .where(Conversation.review_id == review_id)
-        .group_by(Conversation.id)
-        .order_by(Conversation.created_at.desc())
-        .limit(page_size)
-        .offset(offset)
+    The next page is linked in the Link header (rel="next"). Keyset on
+    (created_at, id) - each page is one range scan of the
+    (review_id, created_at DESC, id DESC) index, however deep, and no
+    COUNT(*) over all conversations is needed.
+    """
+    verify_review_access(review_id, current_user, session)
+
+    # Message counts in the same query (no N+1). A correlated subquery instead
+    # of JOIN + GROUP BY: it runs only for the rows of this page, each as an
+    # index-only count on messages.conversation_id, rather than aggregating
+    # the messages of every conversation of the review before LIMIT.
+    message_count = (
+        select(func.count())
+        .where(Message.conversation_id == Conversation.id)
+        .correlate(Conversation)
+        .scalar_subquery()
     )
-    results = session.exec(statement).all()
-
-    # Build responses with counts from single query
-    return [
-        ConversationRead(
-            **conversation.model_dump(),
-            message_count=count
+    statement = select(*_READ_COLUMNS, message_count.label('message_count')).where(
+        Conversation.review_id == review_id
+    )
+    if cursor is not None:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        statement = statement.where(
+            tuple_(Conversation.created_at, Conversation.id) < tuple_(cursor_created_at, cursor_id)
         )
-        for conversation, count in results
-    ]
+    statement = statement.order_by(Conversation.created_at.desc(), Conversation.id.desc()).limit(limit)
+    rows = session.exec(statement).all()
+
+    # A full page means there may be more - link the page after its last row
+    headers = {}
+    if len(rows) == limit:
+        last = rows[-1]
+        next_url = request.url.include_query_params(cursor=encode_cursor(last.created_at, last.id))
+        headers["Link"] = f'<{next_url}>; rel="next"'
+
+    # Plain rows straight into the response schema - no ORM instances. Returned
+    # directly, so FastAPI does not validate and encode the page a second time
+    page = CONVERSATION_LIST.validate_python(rows, from_attributes=True)
+    return ORJSONResponse(CONVERSATION_LIST.dump_python(page, mode="json"), headers=headers)
 
 
-@router.get("/{conversation_id}")
-async def get_conversation(
+@router.get("/{conversation_id}", response_model=ConversationReadWithMessages)
+def get_conversation(
     conversation_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    """Get a specific conversation with all messages."""
-    conversation = session.get(Conversation, conversation_id)
-
-    if not conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Conversation not found"
-        )
-
-    # Verify access through review and project
-    review = session.get(Review, conversation.review_id)
-    if not review:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
+    """Get a specific conversation with all messages.
 
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this conversation"
-        )
-
-    # Get messages
-    message_stmt = select(Message).where(Message.conversation_id == conversation_id).order_by(Message.turn_index)
-    messages = session.exec(message_stmt).all()
-    message_reads = [MessageRead(**msg.model_dump()) for msg in messages]
-
-    # Return dict to avoid circular import
-    return {
-        **conversation.model_dump(),
-        "message_count": len(message_reads),
-        "messages": [m.model_dump() for m in message_reads]
-    }
+    Access check + conversation and its messages in two statements
+    (joined SELECT, then selectinload of the messages).
+    """
+    conversation = verify_conversation_access(
+        conversation_id, current_user, session, load_messages=True
+    )
+    # Validated once from the ORM objects, messages included
+    result = ConversationReadWithMessages.model_validate(conversation)
+    result.message_count = len(result.messages)
+    return ORJSONResponse(result.model_dump(mode="json"))
 
 
-@router.get("/{conversation_id}/messages", response_model=list[MessageRead])
-async def get_conversation_messages(
+@router.get(
+    "/{conversation_id}/messages",
+    response_model=list[MessageRead],
+    responses={304: {"description": "Messages unchanged since the ETag sent in If-None-Match"}},
+)
+def get_conversation_messages(
     conversation_id: int,
+    request: Request,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    """Get all messages for a conversation."""
-    conversation = session.get(Conversation, conversation_id)
-
-    if not conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Conversation not found"
-        )
+    """Get all messages for a conversation.
 
-    # Verify access through review and project
-    review = session.get(Review, conversation.review_id)
-    if not review:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
+    Clients poll this while a conversation runs, so the response carries a
+    weak ETag; a matching If-None-Match gets an empty 304 instead of the
+    list. Messages are append-only, so (count, last id) identifies the list.
+    """
+    verify_conversation_access(conversation_id, current_user, session)
 
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this conversation"
-        )
+    message_count, last_message_id = session.exec(
+        select(func.count(), func.max(Message.id)).where(Message.conversation_id == conversation_id)
+    ).one()
+    etag = f'W/"{conversation_id}-{message_count}-{last_message_id or 0}"'
+    if etag in (tag.strip() for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
 
     # Get messages
     message_stmt = select(Message).where(Message.conversation_id == conversation_id).order_by(Message.turn_index)
-    messages = session.exec(message_stmt).all()
+    messages = MESSAGE_LIST.validate_python(session.exec(message_stmt).all(), from_attributes=True)
 
-    return [MessageRead(**msg.model_dump()) for msg in messages]
+    return ORJSONResponse(MESSAGE_LIST.dump_python(messages, mode="json"), headers={"ETag": etag})
 
 
 @router.post("/{conversation_id}/run", response_model=ConversationRead)
-async def run_conversation(
+def run_conversation(
     conversation_id: int,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
@@ -230,46 +202,27 @@ async def run_conversation(
     model: str | None = None
 ):
     """Manually trigger a conversation to run (if not auto-started)."""
-    conversation = session.get(Conversation, conversation_id)
-
-    if not conversation:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Conversation not found"
-        )
-
-    # Verify access
-    review = session.get(Review, conversation.review_id)
-    if not review:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
-
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to run this conversation"
-        )
+    # Count as of before this run, fetched with the access check
+    conversation, message_count = verify_conversation_access_with_count(
+        conversation_id, current_user, session, action="run"
+    )
 
-    # Start conversation in background
-    background_tasks.add_task(
-        run_conversation_in_background,
+    # Start conversation in background (Redis task queue or BackgroundTasks)
+    enqueue_task(
+        background_tasks,
+        "conversations.run",
         conversation.id,
         provider,
-        model
+        model,
     )
 
-    # Get message count
-    message_count_stmt = select(func.count(Message.id)).where(Message.conversation_id == conversation.id)
-    message_count = session.exec(message_count_stmt).one()
-
-    return ConversationRead(
-        **conversation.model_dump(),
-        message_count=message_count
-    )
+    result = ConversationRead.model_validate(conversation)
+    result.message_count = message_count
+    return result
 
 
 @issues_router.post("", response_model=ConversationRead, status_code=status.HTTP_201_CREATED)
-async def debate_issue(
+def debate_issue(
     issue_id: int,
     debate_request: DebateIssueRequest,
     background_tasks: BackgroundTasks,
@@ -277,29 +230,11 @@ async def debate_issue(
     session: Session = Depends(get_session)
 ):
     """Start an adversarial debate for a specific issue."""
-    issue = session.get(Issue, issue_id)
-
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-
-    # Verify access through review and project
-    review = session.get(Review, issue.review_id)
-    if not review:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
-
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to debate this issue"
-        )
+    issue = verify_issue_access(issue_id, current_user, session, action="debate")
 
     # Create adversarial conversation
     conversation = Conversation(
-        review_id=review.id,
+        review_id=issue.review_id,
         mode="adversarial",
         topic_type="issue",
         topic_id=issue_id,
@@ -309,15 +244,13 @@ async def debate_issue(
     session.commit()
     session.refresh(conversation)
 
-    # Start debate in background
-    background_tasks.add_task(
-        run_conversation_in_background,
+    # Start debate in background (Redis task queue or BackgroundTasks)
+    enqueue_task(
+        background_tasks,
+        "conversations.run",
         conversation.id,
         debate_request.provider,
-        debate_request.model
+        debate_request.model,
     )
 
-    return ConversationRead(
-        **conversation.model_dump(),
-        message_count=0
-    )
+    return ConversationRead.model_validate(conversation)
@@ -1,27 +1,34 @@
 """API dependencies for authentication and database sessions."""
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security.http import HTTPBearer, HTTPAuthorizationCredentials
-from sqlmodel import Session, select
+from sqlmodel import Session
 from app.database import get_session
 from app.models.user import User
-from app.utils.auth import decode_access_token
+from app.utils.auth import decode_access_token_cached
 
 # HTTP Bearer token scheme (optional to allow cookie-based auth)
 security = HTTPBearer(auto_error=False)
 
 
-async def get_current_user(
+def get_token_payload(
     request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
-    session: Session = Depends(get_session)
-) -> User:
-    """Get current authenticated user from JWT token."""
+) -> dict:
+    """Decode and check the access token (Bearer header or cookie), without a DB lookup.
+
+    The checked payload is kept on request.state, so any further resolution
+    within the same request (another dependency tree, middleware) reuses it.
+    """
+    payload = getattr(request.state, "token_payload", None)
+    if payload is not None:
+        return payload
+
     token = credentials.credentials if credentials else None
     if token is None:
         token = request.cookies.get("access_token")
 
     # Decode token
-    payload = decode_access_token(token) if token else None
+    payload = decode_access_token_cached(token) if token else None
     if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -46,8 +53,22 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    request.state.token_payload = payload
+    return payload
+
+
+def get_current_user(
+    request: Request,
+    payload: dict = Depends(get_token_payload),
+    session: Session = Depends(get_session)
+) -> User:
+    """Get current authenticated user from JWT token (once per request)."""
+    user = getattr(request.state, "current_user", None)
+    if user is not None:
+        return user
+
     # Get user from database
-    user = session.get(User, user_id)
+    user = session.get(User, payload["user_id"])
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -61,10 +82,11 @@ async def get_current_user(
             detail="Inactive user"
         )
 
+    request.state.current_user = user
     return user
 
 
-async def get_current_active_user(
+def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
     """Get current active user."""
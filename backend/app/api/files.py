@@ -1,6 +1,11 @@
 """File CRUD API endpoints."""
+import re
+from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select, func
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import case
+from sqlmodel import Session, select, update
 from app.database import get_session
 from app.models.user import User
 from app.models.project import Project
@@ -11,9 +16,63 @@ from app.utils.access import verify_project_access
 
 router = APIRouter(prefix="/projects/{project_id}/files", tags=["files"])
 
+FILE_LIST = TypeAdapter(list[FileRead])
 
-def validate_code_content(content: str, filename: str) -> dict:
-    """Validate code content and return warnings/errors."""
+# Only the columns FileRead exposes - the list never loads file content
+_READ_COLUMNS = tuple(getattr(File, name) for name in FileRead.model_fields)
+
+# Common code indicators
+CODE_INDICATORS = [
+    'def ', 'class ', 'function', 'import ', 'from ', 'const ', 'let ', 'var ',
+    'public ', 'private ', 'return', 'if ', 'for ', 'while ', '#include',
+    '<?php', '<!DOCTYPE', '<html', 'package ', 'func ', 'fn ', 'struct '
+]
+
+
+def _trie_pattern(words: list[str]) -> str:
+    """Build a regex matching any of `words`, factored by common prefixes.
+
+    e.g. ['for', 'from', 'fn'] -> 'f(?:n|or|rom)'. The regex engine then
+    tries one branch per character instead of every word at every position
+    (the same idea as an Aho-Corasick automaton).
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end of a word
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        optional = '' in node
+        body = branches[0] if len(branches) == 1 and not optional else f"(?:{'|'.join(branches)})"
+        return body + ('?' if optional else '')
+
+    return build(trie)
+
+
+# Compiled once - a single scan of the content, stopping at the first indicator
+_CODE_INDICATOR_RE = re.compile(_trie_pattern(CODE_INDICATORS))
+
+# Byte classes counted with bytes.translate (deleted bytes = occurrences, C-level).
+# All of them are ASCII, so in UTF-8 they never occur inside multi-byte characters.
+_CODE_SYMBOL_BYTES = b'{}()[];:='
+_NON_PRINTABLE_BYTES = bytes(b for b in range(32) if b not in b'\n\r\t')
+
+
+def _count_bytes(data: bytes, chars: bytes) -> int:
+    """Count occurrences of any of `chars` in `data` in one pass."""
+    return len(data) - len(data.translate(None, chars))
+
+
+def validate_code_content(content: str, filename: str, encoded: bytes | None = None) -> dict:
+    """Validate code content and return warnings/errors.
+
+    `encoded` is the UTF-8 encoding of `content` when the caller already has it.
+    """
     result = {"valid": True, "warnings": [], "errors": []}
 
     # Check for empty content
@@ -42,129 +101,133 @@ def validate_code_content(content: str, filename: str) -> dict:
         result["errors"].append(f"Plik jest zbyt duży (maksymalnie {settings.max_file_size_mb}MB)")
         return result
 
-    # Check for common code indicators
-    code_indicators = [
-        'def ', 'class ', 'function', 'import ', 'from ', 'const ', 'let ', 'var ',
-        'public ', 'private ', 'return', 'if ', 'for ', 'while ', '#include',
-        '<?php', '<!DOCTYPE', '<html', 'package ', 'func ', 'fn ', 'struct '
-    ]
-
-    has_code = any(indicator in content for indicator in code_indicators)
+    # Check for binary/garbage characters - first, so binary uploads are
+    # rejected after one C-level pass, before the indicator and line scans
+    if encoded is None:
+        encoded = content.encode('utf-8')
+    non_printable = _count_bytes(encoded, _NON_PRINTABLE_BYTES)
+    if non_printable > 0:
+        if non_printable > len(content) * 0.1:
+            result["valid"] = False
+            result["errors"].append("File contains too many non-printable characters - may be binary file")
+            return result
+        result["warnings"].append("File contains non-printable characters")
 
-    # Check for brackets/symbols common in code
-    code_symbols = ['{', '}', '(', ')', '[', ']', ';', ':', '=']
-    symbol_count = sum(content.count(s) for s in code_symbols)
+    # Check for common code indicators / brackets and symbols common in code
+    has_code = _CODE_INDICATOR_RE.search(content) is not None
 
-    if not has_code and symbol_count < 5:
+    if not has_code and _count_bytes(encoded, _CODE_SYMBOL_BYTES) < 5:
         result["warnings"].append("Content doesn't appear to be code - review results may be irrelevant")
 
     # Check for repetitive/garbage content
     lines = stripped.split('\n')
     if len(lines) > 3:
-        unique_lines = set(line.strip() for line in lines if line.strip())
-        if len(unique_lines) < len(lines) * settings.file_line_uniqueness_threshold:
-            result["warnings"].append("Many repeated lines detected - may indicate low-quality content")
-
-    # Check for binary/garbage characters
-    non_printable = sum(1 for c in content if ord(c) < 32 and c not in '\n\r\t')
-    if non_printable > 0:
-        if non_printable > len(content) * 0.1:
-            result["valid"] = False
-            result["errors"].append("File contains too many non-printable characters - may be binary file")
+        # Stop as soon as enough distinct lines are seen - a normal file never
+        # builds the full set of its lines
+        required_unique = len(lines) * settings.file_line_uniqueness_threshold
+        unique_lines = set()
+        for line in lines:
+            line = line.strip()
+            if line:
+                unique_lines.add(line)
+                if len(unique_lines) >= required_unique:
+                    break
         else:
-            result["warnings"].append("File contains non-printable characters")
+            result["warnings"].append("Many repeated lines detected - may indicate low-quality content")
 
     return result
 
 
 @router.post("", response_model=FileRead, status_code=status.HTTP_201_CREATED)
-async def create_file(
+def create_file(
     project_id: int,
     file_data: FileCreate,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Create a new file in a project."""
-    project = await verify_project_access(project_id, current_user, session)
+    verify_project_access(project_id, current_user, session)
+
+    # Encoded once - reused for validation, size and hash
+    encoded = file_data.content.encode('utf-8')
 
     # Validate content
-    validation = validate_code_content(file_data.content, file_data.name)
+    validation = validate_code_content(file_data.content, file_data.name, encoded)
     if not validation["valid"]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=validation["errors"][0] if validation["errors"] else "Invalid file content"
         )
 
-    # Check file count limit
-    file_count_stmt = select(func.count(File.id)).where(File.project_id == project_id)
-    file_count = session.exec(file_count_stmt).one()
-
-    if file_count >= settings.max_files_per_project:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Maximum {settings.max_files_per_project} files per project"
-        )
-
     # Check file size
-    content_bytes = len(file_data.content.encode('utf-8'))
+    content_bytes = len(encoded)
     if content_bytes > settings.max_file_size_bytes:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
             detail=f"File size exceeds maximum of {settings.max_file_size_mb}MB"
         )
 
-    # Create file
+    # Hash and build the row before taking the slot, so the UPDATE holding the
+    # project row lock is followed straight by the INSERT and COMMIT
     file = File(
         project_id=project_id,
         name=file_data.name,
         content=file_data.content,
         language=file_data.language,
         size_bytes=content_bytes,
-        content_hash=File.compute_hash(file_data.content)
+        content_hash=File.compute_hash(encoded)
     )
 
+    # Take a file slot (and bump the project timestamp) with one conditional
+    # UPDATE instead of COUNT(*) - parallel uploads cannot both take the last slot
+    reserved = session.exec(
+        update(Project)
+        .where(Project.id == project_id, Project.file_count < settings.max_files_per_project)
+        .values(file_count=Project.file_count + 1, updated_at=datetime.now(timezone.utc))
+    )
+    if reserved.rowcount == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Maximum {settings.max_files_per_project} files per project"
+        )
+
+    # Insert in the same transaction - a failed insert releases the slot
     session.add(file)
     session.commit()
     session.refresh(file)
 
-    # Update project timestamp
-    from datetime import datetime, timezone
-    project.updated_at = datetime.now(timezone.utc)
-    session.add(project)
-    session.commit()
-
     # Return file - FastAPI will use response_model to convert
     return file
 
 
 @router.get("", response_model=list[FileRead])
-async def list_files(
+def list_files(
     project_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
-    """List all files in a project."""
-    await verify_project_access(project_id, current_user, session)
+    """List all files in a project (metadata only, without content)."""
+    verify_project_access(project_id, current_user, session)
 
     statement = (
-        select(File)
+        select(*_READ_COLUMNS)
         .where(File.project_id == project_id)
         .order_by(File.name)
     )
-    files = session.exec(statement).all()
+    files = FILE_LIST.validate_python(session.exec(statement).all(), from_attributes=True)
 
-    return files
+    return ORJSONResponse(FILE_LIST.dump_python(files, mode="json"))
 
 
 @router.get("/{file_id}", response_model=FileReadWithContent)
-async def get_file(
+def get_file(
     project_id: int,
     file_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Get a specific file with its content."""
-    await verify_project_access(project_id, current_user, session)
+    verify_project_access(project_id, current_user, session)
 
     file = session.get(File, file_id)
 
@@ -178,7 +241,7 @@ async def get_file(
 
 
 @router.patch("/{file_id}", response_model=FileRead)
-async def update_file(
+def update_file(
     project_id: int,
     file_id: int,
     file_update: FileUpdate,
@@ -186,7 +249,7 @@ async def update_file(
     session: Session = Depends(get_session)
 ):
     """Update a file."""
-    project = await verify_project_access(project_id, current_user, session)
+    project = verify_project_access(project_id, current_user, session)
 
     file = session.get(File, file_id)
 
@@ -201,7 +264,8 @@ async def update_file(
 
     if "content" in update_data:
         content = update_data["content"]
-        content_bytes = len(content.encode('utf-8'))
+        encoded = content.encode('utf-8')
+        content_bytes = len(encoded)
 
         if content_bytes > settings.max_file_size_bytes:
             raise HTTPException(
@@ -211,15 +275,15 @@ async def update_file(
 
         file.content = content
         file.size_bytes = content_bytes
-        file.content_hash = File.compute_hash(content)
+        file.content_hash = File.compute_hash(encoded)
 
     for field, value in update_data.items():
         if field != "content":
             setattr(file, field, value)
 
-    from datetime import datetime, timezone
-    file.updated_at = datetime.now(timezone.utc)
-    project.updated_at = datetime.now(timezone.utc)
+    now = datetime.now(timezone.utc)
+    file.updated_at = now
+    project.updated_at = now
 
     session.add(file)
     session.add(project)
@@ -230,13 +294,13 @@ async def update_file(
 
 
 @router.post("/validate", response_model=dict)
-async def validate_files(
+def validate_files(
     project_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Validate all files in a project before review."""
-    await verify_project_access(project_id, current_user, session)
+    verify_project_access(project_id, current_user, session)
 
     statement = select(File).where(File.project_id == project_id)
     files = session.exec(statement).all()
@@ -255,8 +319,9 @@ async def validate_files(
     file_validations = []
     total_code_size = 0
 
-    for file in files:
-        validation = validate_code_content(file.content, file.name)
+    validations = [validate_code_content(file.content, file.name) for file in files]
+
+    for file, validation in zip(files, validations):
         total_code_size += len(file.content)
 
         file_validations.append({
@@ -287,14 +352,14 @@ async def validate_files(
 
 
 @router.delete("/{file_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_file(
+def delete_file(
     project_id: int,
     file_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Delete a file."""
-    project = await verify_project_access(project_id, current_user, session)
+    verify_project_access(project_id, current_user, session)
 
     file = session.get(File, file_id)
 
@@ -306,10 +371,16 @@ async def delete_file(
 
     session.delete(file)
 
-    # Update project timestamp
-    from datetime import datetime, timezone
-    project.updated_at = datetime.now(timezone.utc)
-    session.add(project)
+    # Release the file slot and update project timestamp (floored at 0, so a
+    # counter that drifted low cannot go negative)
+    session.exec(
+        update(Project)
+        .where(Project.id == project_id)
+        .values(
+            file_count=case((Project.file_count > 0, Project.file_count - 1), else_=0),
+            updated_at=datetime.now(timezone.utc),
+        )
+    )
 
     session.commit()
 
@@ -1,4 +1,6 @@
 """Ollama API endpoints."""
+import asyncio
+import logging
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
 from app.providers.ollama import OllamaProvider
@@ -7,8 +9,19 @@ from app.api.deps import get_current_user
 import httpx
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/ollama", tags=["ollama"])
 
+MODELS_CACHE_KEY = "ollama:models"
+MODELS_CACHE_TTL = 60
+# Last known list, served while a single refresh runs in the background
+MODELS_STALE_KEY = "ollama:models:stale"
+MODELS_STALE_TTL = 3600
+
+# Singleflight: the running refresh, awaited by every concurrent cache miss
+_models_refresh: asyncio.Task | None = None
+
 
 class ModelsResponse(BaseModel):
     """Response model for list of available models."""
@@ -17,11 +30,41 @@ class ModelsResponse(BaseModel):
     cached: bool = False
 
 
+async def _fetch_models() -> list[str]:
+    """Fetch the model list from Ollama and cache it."""
+    ollama = OllamaProvider()
+    models = await ollama.list_models()
+
+    # Remove duplicates and sort
+    unique_models = sorted(set(models))
+
+    cache.set(MODELS_CACHE_KEY, unique_models, ttl=MODELS_CACHE_TTL)
+    cache.set(MODELS_STALE_KEY, unique_models, ttl=MODELS_STALE_TTL)
+    return unique_models
+
+
+def _refresh_models() -> asyncio.Task:
+    """Start a model list refresh, or join the one already running."""
+    global _models_refresh
+    if (_models_refresh is None or _models_refresh.done()
+            or _models_refresh.get_loop() is not asyncio.get_running_loop()):
+        _models_refresh = asyncio.create_task(_fetch_models())
+        _models_refresh.add_done_callback(_log_refresh_error)
+    return _models_refresh
+
+
+def _log_refresh_error(refresh: asyncio.Task) -> None:
+    if not refresh.cancelled() and refresh.exception() is not None:
+        logger.warning(f"Ollama models refresh failed: {refresh.exception()}")
+
+
 @router.get("/models", response_model=ModelsResponse)
 async def list_ollama_models(current_user=Depends(get_current_user)):
     """List available Ollama models.
 
     Returns cached results for 60 seconds to avoid hammering Ollama API.
+    After that the last known list is returned while a single background
+    request refreshes it; concurrent misses share one request (singleflight).
 
     Requires authentication.
 
@@ -31,24 +74,20 @@ async def list_ollama_models(current_user=Depends(get_current_user)):
     Raises:
         HTTPException: If Ollama is not available or request fails
     """
-    cache_key = "ollama:models"
-
     # Try to get from cache first
-    cached_models = cache.get(cache_key)
+    cached_models = cache.get(MODELS_CACHE_KEY)
     if cached_models is not None:
         return ModelsResponse(models=cached_models, cached=True)
 
-    # Fetch from Ollama
-    try:
-        ollama = OllamaProvider()
-        models = await ollama.list_models()
-
-        # Remove duplicates and sort
-        unique_models = sorted(list(set(models)))
-
-        # Cache for 60 seconds
-        cache.set(cache_key, unique_models, ttl=60)
+    # Expired: serve the previous list while one refresh runs in the background
+    stale_models = cache.get(MODELS_STALE_KEY)
+    if stale_models is not None:
+        _refresh_models()
+        return ModelsResponse(models=stale_models, cached=True)
 
+    # Nothing cached - all concurrent callers wait for the same Ollama request
+    try:
+        unique_models = await asyncio.shield(_refresh_models())
         return ModelsResponse(models=unique_models, cached=False)
 
     except httpx.HTTPError as e:
@@ -12,9 +12,18 @@ from app.api.deps import get_current_user
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# Review count of the project in each selected row (correlated subquery)
+_REVIEW_COUNT = (
+    select(func.count(Review.id))
+    .where(Review.project_id == Project.id)
+    .correlate(Project)
+    .scalar_subquery()
+    .label("review_count")
+)
+
 
 @router.post("", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
-async def create_project(
+def create_project(
     project_data: ProjectCreate,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
@@ -31,14 +40,13 @@ async def create_project(
     # Build response with counts
     response = ProjectRead(
         **project.model_dump(),
-        file_count=0,
         review_count=0
     )
     return response
 
 
 @router.get("")
-async def list_projects(
+def list_projects(
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session),
     page: int = Query(1, ge=1, description="Page number"),
@@ -48,7 +56,9 @@ async def list_projects(
 
     Returns paginated response with metadata including total count, page info.
 
-    Optimized: Uses single query with subqueries to avoid N+1 problem.
+    Optimized: one query for the page - review counts as a correlated
+    subquery, evaluated only for the returned rows (no N+1, no GROUP BY
+    over the reviews of every project before LIMIT).
     """
     # Get total count
     total_stmt = select(func.count(Project.id)).where(Project.owner_id == current_user.id)
@@ -57,31 +67,23 @@ async def list_projects(
     # Calculate offset
     offset = (page - 1) * page_size
 
-    # Get projects with counts in single query using subqueries
+    # Get projects with review counts in single query (file_count is a column)
     statement = (
-        select(
-            Project,
-            func.count(File.id).label("file_count"),
-            func.count(Review.id).label("review_count")
-        )
-        .outerjoin(File, File.project_id == Project.id)
-        .outerjoin(Review, Review.project_id == Project.id)
+        select(Project, _REVIEW_COUNT)
         .where(Project.owner_id == current_user.id)
-        .group_by(Project.id)
         .offset(offset)
         .limit(page_size)
         .order_by(Project.created_at.desc())
     )
 
-    # Execute query - returns tuples of (Project, file_count, review_count)
+    # Execute query - returns tuples of (Project, review_count)
     results = session.exec(statement).all()
 
     # Build responses
     items = []
-    for project, file_count, review_count in results:
+    for project, review_count in results:
         items.append(ProjectRead(
             **project.model_dump(),
-            file_count=file_count or 0,
             review_count=review_count or 0
         ))
 
@@ -100,13 +102,16 @@ async def list_projects(
 
 
 @router.get("/{project_id}")
-async def get_project(
+def get_project(
     project_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Get a specific project with its files."""
-    project = session.get(Project, project_id)
+    # Project and its review count in one query
+    project, review_count = session.exec(
+        select(Project, _REVIEW_COUNT).where(Project.id == project_id)
+    ).first() or (None, 0)
 
     if not project:
         raise HTTPException(
@@ -125,10 +130,6 @@ async def get_project(
     files = session.exec(file_stmt).all()
     file_reads = [FileReadWithContent(**file.model_dump()) for file in files]
 
-    # Count reviews
-    review_count_stmt = select(func.count(Review.id)).where(Review.project_id == project.id)
-    review_count = session.exec(review_count_stmt).one()
-
     # Return dict directly to avoid circular import issues
     return {
         **project.model_dump(),
@@ -139,7 +140,7 @@ async def get_project(
 
 
 @router.patch("/{project_id}", response_model=ProjectRead)
-async def update_project(
+def update_project(
     project_id: int,
     project_update: ProjectUpdate,
     current_user: User = Depends(get_current_user),
@@ -170,24 +171,22 @@ async def update_project(
 
     session.add(project)
     session.commit()
-    session.refresh(project)
-
-    # Get counts
-    file_count_stmt = select(func.count(File.id)).where(File.project_id == project.id)
-    file_count = session.exec(file_count_stmt).one()
 
-    review_count_stmt = select(func.count(Review.id)).where(Review.project_id == project.id)
-    review_count = session.exec(review_count_stmt).one()
+    # Reload the project with its review count in one query (file_count is a column)
+    project, review_count = session.exec(
+        select(Project, _REVIEW_COUNT)
+        .where(Project.id == project_id)
+        .execution_options(populate_existing=True)
+    ).one()
 
     return ProjectRead(
         **project.model_dump(),
-        file_count=file_count,
         review_count=review_count
     )
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project(
+def delete_project(
     project_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
@@ -1,17 +1,63 @@
 """Rankings API endpoints - statistics based on code reviews."""
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import Integer, cast
 from sqlmodel import Session, select, func, and_
 from typing import List, Dict, Any
 from app.database import get_session
 from app.models import Review, ReviewAgent, Issue
 from app.api.deps import get_current_user
 from app.models.user import User
+from app.utils.cache import cache
 
 router = APIRouter(prefix="/rankings", tags=["rankings"])
 
+# Rankings are aggregates over all reviews - materialized as ready JSON in the
+# cache and recomputed at most once per TTL
+RANKINGS_CACHE_PREFIX = "rankings:"
+RANKINGS_CACHE_TTL = 60  # seconds
+
+
+def _general_agent_stats(session: Session, *keys):
+    """Stats of 'general' agents grouped by `keys`, with issue counts.
+
+    One statement: agent aggregates LEFT JOIN issue counts per group (issues
+    of the reviews the agents took part in) instead of a query per group.
+    """
+    agent_stats = (
+        select(
+            *keys,
+            func.count(ReviewAgent.id).label('reviews_count'),
+            func.sum(cast(ReviewAgent.parsed_successfully, Integer)).label('successful_parses'),
+        )
+        .where(ReviewAgent.role == "general")
+        .group_by(*keys)
+        .subquery()
+    )
+    issue_counts = (
+        select(*keys, func.count(Issue.id).label('issues_found'))
+        .join(Issue, Issue.review_id == ReviewAgent.review_id)
+        .where(ReviewAgent.role == "general")
+        .group_by(*keys)
+        .subquery()
+    )
+    return session.exec(
+        select(agent_stats, func.coalesce(issue_counts.c.issues_found, 0).label('issues_found'))
+        .outerjoin(issue_counts, and_(*(agent_stats.c[key.key] == issue_counts.c[key.key] for key in keys)))
+    ).all()
+
+
+def _cached_response(cache_key: str, build) -> Response:
+    """Return the cached JSON for `cache_key`, building and caching it on a miss."""
+    payload = cache.get_raw(cache_key)
+    if payload is None:
+        payload = orjson.dumps(build()).decode()
+        cache.set_raw(cache_key, payload, ttl=RANKINGS_CACHE_TTL)
+    return Response(content=payload, media_type="application/json")
+
 
 @router.get("/models")
-async def get_model_rankings(
+def get_model_rankings(
     *,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user),
@@ -24,145 +70,94 @@ async def get_model_rankings(
     - Number of issues found
     - Average issues per review
     - Success rate (parsed successfully)
-    """
-    # Base query (ranking only for general agent)
-    query = (
-        select(
-            ReviewAgent.provider,
-            ReviewAgent.model,
-            ReviewAgent.role,
-            func.count(ReviewAgent.id).label('reviews_count'),
-            func.sum(func.cast(ReviewAgent.parsed_successfully, int)).label('successful_parses'),
-        )
-        .where(ReviewAgent.role == "general")
-        .group_by(ReviewAgent.provider, ReviewAgent.model, ReviewAgent.role)
-    )
 
+    Results are cached for 60 seconds.
+    """
     # Backwards compatibility: ignore non-general role filters
     if agent_role and agent_role != "general":
         raise HTTPException(status_code=400, detail="Rankingi dostępne tylko dla agenta 'general'")
 
-    results = session.exec(query).all()
-
-    # Get issue counts per agent
-    rankings = []
-    for result in results:
-        provider, model, role, reviews_count, successful_parses = result
-
-        # Count issues found by this specific model+role combo
-        issues_query = (
-            select(func.count(Issue.id))
-            .join(Review, Issue.review_id == Review.id)
-            .join(ReviewAgent, ReviewAgent.review_id == Review.id)
-            .where(
-                and_(
-                    ReviewAgent.provider == provider,
-                    ReviewAgent.model == model,
-                    ReviewAgent.role == "general"
-                )
-            )
-        )
-        issues_count = session.exec(issues_query).one()
-
-        success_rate = (successful_parses / reviews_count * 100) if reviews_count > 0 else 0
-        avg_issues = (issues_count / reviews_count) if reviews_count > 0 else 0
-
-        rankings.append({
-            'provider': provider,
-            'model': model,
-            'role': role,
-            'reviews_count': reviews_count,
-            'issues_found': issues_count,
-            'avg_issues_per_review': round(avg_issues, 2),
-            'success_rate': round(success_rate, 1),
-            'successful_parses': successful_parses
-        })
-
-    # Sort by issues found (descending)
-    rankings.sort(key=lambda x: (x['issues_found'], x['success_rate']), reverse=True)
-
-    return rankings
+    def build() -> List[Dict[str, Any]]:
+        # Ranking only for general agent
+        rankings = []
+        for provider, model, role, reviews_count, successful_parses, issues_count in _general_agent_stats(
+            session, ReviewAgent.provider, ReviewAgent.model, ReviewAgent.role
+        ):
+            success_rate = (successful_parses / reviews_count * 100) if reviews_count > 0 else 0
+            avg_issues = (issues_count / reviews_count) if reviews_count > 0 else 0
+
+            rankings.append({
+                'provider': provider,
+                'model': model,
+                'role': role,
+                'reviews_count': reviews_count,
+                'issues_found': issues_count,
+                'avg_issues_per_review': round(avg_issues, 2),
+                'success_rate': round(success_rate, 1),
+                'successful_parses': successful_parses
+            })
+
+        # Sort by issues found (descending)
+        rankings.sort(key=lambda x: (x['issues_found'], x['success_rate']), reverse=True)
+        return rankings
+
+    return _cached_response(f"{RANKINGS_CACHE_PREFIX}models", build)
 
 
 @router.get("/providers")
-async def get_provider_rankings(
+def get_provider_rankings(
     *,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ) -> List[Dict[str, Any]]:
-    """Get provider rankings aggregated across all models."""
-    query = (
-        select(
-            ReviewAgent.provider,
-            func.count(ReviewAgent.id).label('reviews_count'),
-            func.sum(func.cast(ReviewAgent.parsed_successfully, int)).label('successful_parses'),
-        )
-        .where(ReviewAgent.role == "general")
-        .group_by(ReviewAgent.provider)
-    )
+    """Get provider rankings aggregated across all models (cached for 60 seconds)."""
+    def build() -> List[Dict[str, Any]]:
+        rankings = []
+        for provider, reviews_count, successful_parses, issues_count in _general_agent_stats(
+            session, ReviewAgent.provider
+        ):
+            success_rate = (successful_parses / reviews_count * 100) if reviews_count > 0 else 0
+            avg_issues = (issues_count / reviews_count) if reviews_count > 0 else 0
 
-    results = session.exec(query).all()
-
-    rankings = []
-    for result in results:
-        provider, reviews_count, successful_parses = result
-
-        # Count total issues found by this provider
-        issues_query = (
-            select(func.count(Issue.id))
-            .join(Review, Issue.review_id == Review.id)
-            .join(ReviewAgent, ReviewAgent.review_id == Review.id)
-            .where(
-                and_(
-                    ReviewAgent.provider == provider,
-                    ReviewAgent.role == "general"
-                )
-            )
-        )
-        issues_count = session.exec(issues_query).one()
+            rankings.append({
+                'provider': provider,
+                'reviews_count': reviews_count,
+                'issues_found': issues_count,
+                'avg_issues_per_review': round(avg_issues, 2),
+                'success_rate': round(success_rate, 1)
+            })
 
-        success_rate = (successful_parses / reviews_count * 100) if reviews_count > 0 else 0
-        avg_issues = (issues_count / reviews_count) if reviews_count > 0 else 0
+        rankings.sort(key=lambda x: (x['issues_found'], x['success_rate']), reverse=True)
+        return rankings
 
-        rankings.append({
-            'provider': provider,
-            'reviews_count': reviews_count,
-            'issues_found': issues_count,
-            'avg_issues_per_review': round(avg_issues, 2),
-            'success_rate': round(success_rate, 1)
-        })
-
-    rankings.sort(key=lambda x: (x['issues_found'], x['success_rate']), reverse=True)
-
-    return rankings
+    return _cached_response(f"{RANKINGS_CACHE_PREFIX}providers", build)
 
 
 @router.get("/stats")
-async def get_overall_stats(
+def get_overall_stats(
     *,
     session: Session = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """Get overall statistics."""
-    # Total reviews
-    total_reviews = session.exec(select(func.count(Review.id))).one()
-
-    # Completed reviews
-    completed_reviews = session.exec(
-        select(func.count(Review.id)).where(Review.status == "completed")
-    ).one()
-
-    # Total issues found
-    total_issues = session.exec(select(func.count(Issue.id))).one()
-
-    # Total agents participated
-    total_agents = session.exec(
-        select(func.count(ReviewAgent.id)).where(ReviewAgent.role == "general")
-    ).one()
-
-    # Reviews by mode
-    council_reviews = session.exec(
-        select(func.count(Review.id)).where(Review.review_mode == "council")
+    # All counters in one statement: review counts via FILTER aggregates,
+    # issue/agent totals as scalar subqueries
+    (
+        total_reviews,
+        completed_reviews,
+        council_reviews,
+        total_issues,
+        total_agents,
+    ) = session.exec(
+        select(
+            func.count(Review.id),
+            func.count(Review.id).filter(Review.status == "completed"),
+            func.count(Review.id).filter(Review.review_mode == "council"),
+            select(func.count(Issue.id)).scalar_subquery(),
+            select(func.count(ReviewAgent.id))
+            .where(ReviewAgent.role == "general")
+            .scalar_subquery(),
+        )
     ).one()
 
     return {
@@ -1,22 +1,27 @@
 """Review API endpoints."""
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query, Response, Request
+from pydantic import TypeAdapter, ValidationError
 from sqlmodel import Session, select, func
 from sqlalchemy.orm import selectinload
-from app.database import get_session
+from app.database import engine, get_session
 from app.models.user import User
-from app.models.project import Project
 from app.models.review import (
-    Review, ReviewAgent, Issue, Suggestion,
+    Review, ReviewAgent, Issue, Suggestion, AgentConfig,
     ReviewCreate, ReviewRead, ReviewAgentRead, IssueRead, IssueReadWithSuggestions,
-    SuggestionRead, IssueUpdate
+    IssueUpdate
 )
 from app.api.deps import get_current_user
 from app.orchestrators.review import ReviewOrchestrator
-from app.utils.access import verify_project_access, verify_review_access
+from app.utils.access import verify_issue_access, verify_project_access, verify_review_access
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 projects_router = APIRouter(prefix="/projects/{project_id}/reviews", tags=["reviews"])
 
+ISSUE_PAGE = TypeAdapter(list[IssueReadWithSuggestions])
+
+# One Link header entry; base already ends with "?page=" or "&page="
+_LINK_FMT = '<{base}{page}&page_size={page_size}>; rel="{rel}"'.format
+
 
 def build_link_header(request: Request, page: int, page_size: int, total: int) -> str:
     """Build RFC 5988 compliant Link header for pagination.
@@ -30,26 +35,49 @@ def build_link_header(request: Request, page: int, page_size: int, total: int) -
     Returns:
         Link header string with rel="first", "prev", "next", "last"
     """
-    base_url = str(request.url.remove_query_params("page", "page_size"))
+    # Serialized once; other query params (filters) are kept as they are
+    base = request.url.remove_query_params(["page", "page_size"])
+    base_url = f"{base}{'&' if base.query else '?'}page="
     total_pages = (total + page_size - 1) // page_size if page_size > 0 else 1
 
-    links = []
-
-    # First page
-    links.append(f'<{base_url}?page=1&page_size={page_size}>; rel="first"')
+    pages = (
+        (1, "first", True),
+        (page - 1, "prev", page > 1),
+        (page + 1, "next", page < total_pages),
+        (total_pages, "last", True),
+    )
+    return ", ".join(
+        _LINK_FMT(base=base_url, page=number, page_size=page_size, rel=rel)
+        for number, rel, present in pages
+        if present
+    )
 
-    # Previous page
-    if page > 1:
-        links.append(f'<{base_url}?page={page - 1}&page_size={page_size}>; rel="prev"')
 
-    # Next page
-    if page < total_pages:
-        links.append(f'<{base_url}?page={page + 1}&page_size={page_size}>; rel="next"')
+def _review_stats(session: Session, review_id: int) -> dict:
+    """agent_count, issue_count and models ("provider/model") of a review in one query.
 
-    # Last page
-    links.append(f'<{base_url}?page={total_pages}&page_size={page_size}>; rel="last"')
+    Review LEFT JOIN its agents (one row even without agents), with the issue
+    count as a correlated subquery instead of two separate COUNTs.
+    """
+    issue_count = (
+        select(func.count())
+        .where(Issue.review_id == Review.id)
+        .correlate(Review)
+        .scalar_subquery()
+    )
+    rows = session.exec(
+        select(ReviewAgent.id, ReviewAgent.provider, ReviewAgent.model, issue_count)
+        .select_from(Review)
+        .outerjoin(ReviewAgent, ReviewAgent.review_id == Review.id)
+        .where(Review.id == review_id)
+    ).all()
 
-    return ", ".join(links)
+    agents = [(provider, model) for agent_id, provider, model, _ in rows if agent_id is not None]
+    return {
+        "agent_count": len(agents),
+        "issue_count": rows[0][3] if rows else 0,
+        "models": list({f"{provider}/{model}" for provider, model in agents if provider and model}),
+    }
 
 
 async def run_review_in_background(
@@ -61,9 +89,6 @@ async def run_review_in_background(
     engine_override=None,
 ):
     """Run review in background task."""
-    from app.database import Session, engine
-    from app.models.review import AgentConfig
-
     # Convert dict to AgentConfig objects if provided
     parsed_agent_configs = None
     if agent_configs:
@@ -86,7 +111,7 @@ async def run_review_in_background(
 
 
 @projects_router.post("", response_model=ReviewRead, status_code=status.HTTP_201_CREATED)
-async def create_review(
+def create_review(
     project_id: int,
     review_data: ReviewCreate,
     background_tasks: BackgroundTasks,
@@ -112,7 +137,7 @@ async def create_review(
         HTTPException 404: Projekt nie istnieje
         HTTPException 422: Brak wymaganej konfiguracji
     """
-    project = await verify_project_access(project_id, current_user, session)
+    project = verify_project_access(project_id, current_user, session)
 
     # Walidacja trybu review - tylko council
     review_mode = review_data.review_mode
@@ -164,8 +189,9 @@ async def create_review(
         review_mode=review_mode
     )
     session.add(review)
-    session.commit()
-    session.refresh(review)
+    # Flush only for review.id - review and agents are committed together, so
+    # a rejected agent config leaves no orphaned pending review
+    session.flush()
 
     # Create agent records
     for role in review_data.agent_roles:
@@ -199,7 +225,7 @@ async def create_review(
 
     # Start review in background with agent configs
     agent_configs_dict = {
-        role: {k: v for k, v in config.model_dump().items() if k != "prompt"}
+        role: config.model_dump(exclude={"prompt"})
         for role, config in review_data.agent_configs.items()
     }
 
@@ -221,7 +247,7 @@ async def create_review(
 
 
 @projects_router.get("", response_model=list[ReviewRead])
-async def list_project_reviews(
+def list_project_reviews(
     project_id: int,
     request: Request,
     response: Response,
@@ -231,7 +257,7 @@ async def list_project_reviews(
     page_size: int = Query(20, ge=1, le=100, description="Items per page")
 ):
     """List all reviews for a project with pagination."""
-    await verify_project_access(project_id, current_user, session)
+    verify_project_access(project_id, current_user, session)
 
     offset = (page - 1) * page_size
 
@@ -300,71 +326,25 @@ async def list_project_reviews(
 
 
 @router.get("/{review_id}", response_model=ReviewRead)
-async def get_review(
+def get_review(
     review_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Get a specific review."""
-    review = session.get(Review, review_id)
-
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-
-    # Verify access through project
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this review"
-        )
-
-    # Get counts
-    agent_count_stmt = select(func.count(ReviewAgent.id)).where(ReviewAgent.review_id == review.id)
-    agent_count = session.exec(agent_count_stmt).one()
+    review = verify_review_access(review_id, current_user, session)
 
-    issue_count_stmt = select(func.count(Issue.id)).where(Issue.review_id == review.id)
-    issue_count = session.exec(issue_count_stmt).one()
-
-    # Get unique provider/model combinations from agents
-    agents_stmt = select(ReviewAgent.provider, ReviewAgent.model).where(ReviewAgent.review_id == review.id)
-    agents_data = session.exec(agents_stmt).all()
-    # Create list of unique "provider/model" strings
-    models_list = list(set([f"{agent.provider}/{agent.model}" for agent in agents_data if agent.provider and agent.model]))
-
-    return ReviewRead(
-        **review.model_dump(),
-        agent_count=agent_count,
-        issue_count=issue_count,
-        models=models_list
-    )
+    return ReviewRead(**review.model_dump(), **_review_stats(session, review.id))
 
 
 @router.get("/{review_id}/agents", response_model=list[ReviewAgentRead])
-async def get_review_agents(
+def get_review_agents(
     review_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Get all agents that participated in a review."""
-    review = session.get(Review, review_id)
-
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-
-    # Verify access through project
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this review"
-        )
+    verify_review_access(review_id, current_user, session)
 
     statement = select(ReviewAgent).where(ReviewAgent.review_id == review_id)
     agents = session.exec(statement).all()
@@ -373,7 +353,7 @@ async def get_review_agents(
 
 
 @router.get("/{review_id}/issues")
-async def get_review_issues(
+def get_review_issues(
     review_id: int,
     request: Request,
     response: Response,
@@ -389,21 +369,7 @@ async def get_review_issues(
     import logging
     logger = logging.getLogger(__name__)
 
-    review = session.get(Review, review_id)
-
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-
-    # Verify access through project
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this review"
-        )
+    verify_review_access(review_id, current_user, session)
 
     try:
         # Build base query with filters
@@ -445,47 +411,39 @@ async def get_review_issues(
             detail=f"Error fetching issues: {str(e)}"
         )
 
-    # Build responses with suggestions
-    items = []
-    for issue in issues:
-        try:
-            # Manually load suggestions for this issue (N+1 but safer than selectinload issues)
-            sugg_stmt = select(Suggestion).where(Suggestion.issue_id == issue.id)
-            suggestions_list = session.exec(sugg_stmt).all()
-            suggestion_reads = [SuggestionRead(**s.model_dump()) for s in suggestions_list]
-
-            # Create response object with explicit field access
-            items.append(IssueReadWithSuggestions(
-                id=issue.id,
-                review_id=issue.review_id,
-                file_id=issue.file_id,
-                severity=issue.severity,
-                category=issue.category,
-                title=issue.title,
-                description=issue.description,
-                agent_role=getattr(issue, 'agent_role', None),
-                file_name=issue.file_name,
-                line_start=issue.line_start,
-                line_end=issue.line_end,
-                status=issue.status,
-                confirmed=issue.confirmed,
-                final_severity=issue.final_severity,
-                moderator_comment=issue.moderator_comment,
-                created_at=issue.created_at,
-                updated_at=issue.updated_at,
-                suggestion_count=len(suggestion_reads),
-                suggestions=suggestion_reads
-            ))
-        except Exception as e:
-            logger.error(f"Error serializing issue {issue.id}: {e}", exc_info=True)
-            # Continue with other issues rather than failing entire request
-            continue
+    # Suggestions of the whole page in one query, grouped per issue
+    suggestions_by_issue: dict[int, list[Suggestion]] = {issue.id: [] for issue in issues}
+    if issues:
+        for suggestion in session.exec(
+            select(Suggestion).where(Suggestion.issue_id.in_(list(suggestions_by_issue)))
+        ):
+            suggestions_by_issue[suggestion.issue_id].append(suggestion)
+
+    # Whole page validated and serialized by one compiled validator
+    rows = [
+        {
+            **issue.model_dump(),
+            "suggestions": suggestions_by_issue[issue.id],
+            "suggestion_count": len(suggestions_by_issue[issue.id]),
+        }
+        for issue in issues
+    ]
+    try:
+        items = ISSUE_PAGE.validate_python(rows, from_attributes=True)
+    except ValidationError as e:
+        # Skip the broken issues rather than failing the entire request
+        broken = {error["loc"][0] for error in e.errors()}
+        for index in sorted(broken):
+            logger.error(f"Error serializing issue {rows[index]['id']}: {e}")
+        items = ISSUE_PAGE.validate_python(
+            [row for index, row in enumerate(rows) if index not in broken], from_attributes=True
+        )
 
     # Calculate pagination metadata
     total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
 
     return {
-        "items": [item.model_dump() for item in items],
+        "items": ISSUE_PAGE.dump_python(items, mode="json"),
         "total": total,
         "page": page,
         "page_size": page_size,
@@ -496,32 +454,14 @@ async def get_review_issues(
 
 
 @router.patch("/issues/{issue_id}", response_model=IssueRead)
-async def update_issue(
+def update_issue(
     issue_id: int,
     issue_update: IssueUpdate,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Update an issue (e.g., mark as resolved, update severity)."""
-    issue = session.get(Issue, issue_id)
-
-    if not issue:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Issue not found"
-        )
-
-    # Verify access through review and project
-    review = session.get(Review, issue.review_id)
-    if not review:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
-
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to modify this issue"
-        )
+    issue = verify_issue_access(issue_id, current_user, session, action="modify")
 
     # Update fields
     update_data = issue_update.model_dump(exclude_unset=True)
@@ -551,7 +491,7 @@ async def update_issue(
 
 
 @router.post("/{review_id}/resume", response_model=ReviewRead)
-async def resume_review(
+def resume_review(
     review_id: int,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
@@ -562,21 +502,7 @@ async def resume_review(
     agent_configs: dict | None = None
 ):
     """Resume a failed or pending review."""
-    review = session.get(Review, review_id)
-    
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-    
-    # Verify access
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to resume this review"
-        )
+    review = verify_review_access(review_id, current_user, session, action="resume")
     
     # Only resume if failed or pending
     if review.status not in ["failed", "pending"]:
@@ -609,27 +535,13 @@ async def resume_review(
 
 
 @router.post("/{review_id}/stop", response_model=ReviewRead)
-async def stop_review(
+def stop_review(
     review_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Stop a running or pending review."""
-    review = session.get(Review, review_id)
-    
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-    
-    # Verify access
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to stop this review"
-        )
+    review = verify_review_access(review_id, current_user, session, action="stop")
     
     # Only stop if running or pending
     if review.status not in ["running", "pending"]:
@@ -646,23 +558,12 @@ async def stop_review(
     session.add(review)
     session.commit()
     session.refresh(review)
-    
-    # Get counts
-    agent_count_stmt = select(func.count(ReviewAgent.id)).where(ReviewAgent.review_id == review_id)
-    agent_count = session.exec(agent_count_stmt).one()
-    
-    issue_count_stmt = select(func.count(Issue.id)).where(Issue.review_id == review_id)
-    issue_count = session.exec(issue_count_stmt).one()
-    
-    return ReviewRead(
-        **review.model_dump(),
-        agent_count=agent_count,
-        issue_count=issue_count
-    )
+
+    return ReviewRead(**review.model_dump(), **_review_stats(session, review_id))
 
 
 @router.post("/{review_id}/recreate", response_model=ReviewRead, status_code=status.HTTP_201_CREATED)
-async def recreate_review(
+def recreate_review(
     review_id: int,
     background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
@@ -678,21 +579,7 @@ async def recreate_review(
     
     API keys can be optionally provided, otherwise will use defaults from settings.
     """
-    original_review = session.get(Review, review_id)
-    
-    if not original_review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-    
-    # Verify access
-    project = session.get(Project, original_review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to recreate this review"
-        )
+    original_review = verify_review_access(review_id, current_user, session, action="recreate")
     
     # Get all agents from original review to recreate their configuration
     original_agents = session.exec(
@@ -713,11 +600,10 @@ async def recreate_review(
         review_mode=original_review.review_mode
     )
     session.add(new_review)
-    session.commit()
-    session.refresh(new_review)
+    # Flush only for new_review.id - committed together with the agents below
+    session.flush()
     
     # Recreate agent configurations from original review
-    from app.models.review import AgentConfig
     agent_configs_dict = {}
     agent_roles = []
     
@@ -748,7 +634,7 @@ async def recreate_review(
     
     # Convert to dict for background task
     agent_configs_dict_for_task = {
-        role: {k: v for k, v in config.model_dump().items() if k != "prompt"}
+        role: config.model_dump(exclude={"prompt"})
         for role, config in agent_configs_dict.items()
     }
     
@@ -770,27 +656,13 @@ async def recreate_review(
 
 
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_review(
+def delete_review(
     review_id: int,
     current_user: User = Depends(get_current_user),
     session: Session = Depends(get_session)
 ):
     """Delete a review and all related data."""
-    review = session.get(Review, review_id)
-    
-    if not review:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Review not found"
-        )
-    
-    # Verify access
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this review"
-        )
+    review = verify_review_access(review_id, current_user, session, action="delete")
     
     # Don't allow deleting running reviews - stop them first
     if review.status == "running":
@@ -12,6 +12,11 @@ Architektura:
 """
 
 # ==================== IMPORTS ====================
+import logging
+from contextlib import ExitStack
+
+import orjson
+from sqlalchemy import event
 from sqlmodel import create_engine, Session, SQLModel
 from app.config import settings
 
@@ -29,17 +34,78 @@ from app.models.audit import AuditLog  # noqa: F401 - Tabela: audit_logs
 from app.models.arena import ArenaSession, TeamRating  # noqa: F401 - Tabele: arena_sessions, team_ratings
 
 # ==================== DATABASE ENGINE ====================
+def _json_dumps(value) -> str:
+    """Serializuj kolumny JSON przez orjson (kilka razy szybszy niż json.dumps).
+
+    OPT_NON_STR_KEYS - jak json.dumps akceptuje klucze int/float w słownikach.
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+logger = logging.getLogger(__name__)
+
+_is_sqlite = "sqlite" in settings.database_url
+
 # Engine - globalna instancja połączenia z bazą danych
 # To jest SINGLETON - tworzona raz przy starcie aplikacji
 engine = create_engine(
     settings.database_url,  # Z .env: sqlite:///./data/code_review.db
     echo=settings.debug,  # Jeśli debug=True, wypisuje wszystkie SQL queries do konsoli
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {}
+    connect_args={"check_same_thread": False} if _is_sqlite else {},
     # SQLite wymaga check_same_thread=False dla FastAPI (multi-threading)
     # PostgreSQL nie potrzebuje tego parametru
+    json_serializer=_json_dumps,  # Kolumny JSON (konfiguracje, issues) przez orjson
+    json_deserializer=orjson.loads,
+    # pool_pre_ping - martwe połączenie (restart bazy, timeout) jest wymieniane
+    # przy pobraniu z puli zamiast kończyć się błędem 500 w requeście
+    pool_pre_ping=True,
+    **({} if _is_sqlite else {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+    }),
 )
 
 
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite(dbapi_connection, _connection_record):
+        """Ustaw tryb WAL i busy_timeout na każdym nowym połączeniu SQLite.
+
+        SQLite ma jednego pisarza naraz. W trybie WAL odczyty (endpointy GET)
+        nie blokują zapisu i odwrotnie, a busy_timeout sprawia, że równoległy
+        zapis (głos, analiza Arena w tle, upload pliku) czeka na swoją kolej
+        zamiast od razu kończyć się "database is locked".
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")  # Zapamiętywane w pliku bazy
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute("PRAGMA synchronous=NORMAL")  # Bezpieczne w WAL, mniej fsync
+        cursor.close()
+
+
+def prewarm_pool() -> None:
+    """Otwórz od razu wszystkie stałe połączenia puli (PostgreSQL).
+
+    Handshake TCP/TLS + uwierzytelnienie odbywa się przy starcie, a nie
+    w pierwszych requestach (np. /auth/login) po wdrożeniu. Połączenia są
+    trzymane jednocześnie - inaczej pula oddawałaby w kółko to samo.
+    """
+    if _is_sqlite:
+        return  # Plik lokalny - otwarcie połączenia nic nie kosztuje
+
+    try:
+        with ExitStack() as stack:
+            for _ in range(settings.db_pool_size):
+                stack.enter_context(engine.connect())
+        logger.info(f"Database pool prewarmed ({settings.db_pool_size} connections)")
+    except Exception as e:
+        # Baza niedostępna przy starcie - połączenia otworzą się przy pierwszym użyciu
+        logger.warning(f"Database pool prewarm failed: {e}")
+
+
 # ==================== TABLE CREATION ====================
 def create_db_and_tables():
     """Create all database tables if they don't exist.
@@ -16,9 +16,10 @@ from fastapi.responses import JSONResponse
 
 # Importy z naszej aplikacji
 from app.config import settings  # Ustawienia z .env (klucze API, DB URL, etc.)
-from app.database import create_db_and_tables  # Funkcja inicjalizująca bazę danych
+from app.database import create_db_and_tables, prewarm_pool  # Inicjalizacja bazy danych i puli połączeń
 from app.api import auth, projects, files, reviews, conversations, ollama, websocket, audit, rankings, arena, providers  # Wszystkie routery API
 from app.utils.rate_limit import check_rate_limit  # Rate limiting (60 req/min)
+from app.utils.audit import flush_audit_events  # Zapis zdarzeń audytu partiami w tle
 
 # ==================== LOGGING CONFIGURATION ====================
 # Konfiguracja systemu logowania - poziom z settings (INFO/DEBUG/ERROR)
@@ -46,12 +47,14 @@ async def lifespan(app: FastAPI):
     # === STARTUP ===
     logger.info("🚀 Starting AI Code Review Arena...")
     create_db_and_tables()  # Tworzy tabele: users, projects, files, reviews, issues, etc.
+    prewarm_pool()  # Otwiera połączenia z puli przed pierwszym requestem
     logger.info("✅ Database initialized")
 
     yield  # Aplikacja działa między yield a końcem
 
     # === SHUTDOWN ===
     logger.info("👋 Shutting down gracefully...")
+    flush_audit_events()  # Zapisz zdarzenia audytu czekające w kolejce
     # Tutaj można dodać cleanup (zamykanie połączeń, flush cache, etc.)
 
 
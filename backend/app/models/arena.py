@@ -8,13 +8,25 @@ Arena to tryb porównywania dwóch konfiguracji zespołów:
 - Na podstawie głosów budowany jest ranking
 """
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Literal, get_args
+from pydantic import computed_field
+from sqlalchemy import Enum, ForeignKey, Index, Integer, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel, Column, JSON
 
 # Typy
 ArenaStatus = Literal["pending", "running", "voting", "completed", "failed"]
 ArenaWinner = Literal["A", "B", "tie"]
 
+# Konfiguracje na PostgreSQL trzymamy jako JSONB (sparsowane binarnie raz przy
+# zapisie, indeksowalne GIN), na pozostałych bazach jako zwykły JSON
+ConfigJSON = JSON().with_variant(JSONB(), "postgresql")
+
+# Status i zwycięzca jako typy ENUM na PostgreSQL (4 bajty, porównania po OID
+# zamiast po tekście), na SQLite VARCHAR z CHECK ograniczającym wartości
+ArenaStatusEnum = Enum(*get_args(ArenaStatus), name="arena_session_status", create_constraint=True)
+ArenaWinnerEnum = Enum(*get_args(ArenaWinner), name="arena_winner", create_constraint=True)
+
 
 class ArenaSession(SQLModel, table=True):
     """Sesja Arena - pojedyncza walka między dwoma zespołami.
@@ -27,19 +39,36 @@ class ArenaSession(SQLModel, table=True):
     5. failed - błąd podczas analizy
     """
     __tablename__ = "arena_sessions"
+    # Indeksy złożone zamiast osobnych na project_id/status/created_by -
+    # "sesje projektu w danym statusie, najnowsze" i "moje sesje, najnowsze"
+    # obsługuje jeden seek po indeksie
+    __table_args__ = (
+        Index("ix_arena_sessions_project_status_created",
+              "project_id", "status", text("created_at DESC")),
+        Index("ix_arena_sessions_created_by_created", "created_by", text("created_at DESC")),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    project_id: int = Field(foreign_key="projects.id", index=True)
-    created_by: int = Field(foreign_key="users.id", index=True)
+    # ON DELETE CASCADE - usunięcie projektu/użytkownika czyści jego sesje
+    # w bazie jednym poleceniem (indeksy złożone wyżej zaczynają się od tych kolumn)
+    project_id: int = Field(sa_column=Column(
+        Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    ))
+    created_by: int = Field(sa_column=Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    ))
 
     # Status sesji
-    status: str = Field(default="pending", index=True)
+    status: str = Field(
+        default="pending",
+        sa_column=Column(ArenaStatusEnum, nullable=False)
+    )
     error_message: str | None = Field(default=None, max_length=2000)
 
     # Konfiguracje zespołów (JSON z konfiguracją dla roli general)
     # Format: {"general": {"provider": "ollama", "model": "qwen2.5"}}
-    team_a_config: dict = Field(default={}, sa_column=Column(JSON))
-    team_b_config: dict = Field(default={}, sa_column=Column(JSON))
+    team_a_config: dict = Field(default={}, sa_column=Column(ConfigJSON))
+    team_b_config: dict = Field(default={}, sa_column=Column(ConfigJSON))
 
     # Wyniki zespołów (JSON z podsumowaniem od moderatora)
     team_a_summary: str | None = Field(default=None, max_length=10000)
@@ -50,7 +79,7 @@ class ArenaSession(SQLModel, table=True):
     team_b_issues: list = Field(default=[], sa_column=Column(JSON))
 
     # Głosowanie użytkownika
-    winner: str | None = Field(default=None, max_length=10)  # "A", "B" lub "tie"
+    winner: str | None = Field(default=None, sa_column=Column(ArenaWinnerEnum))  # "A", "B" lub "tie"
     vote_comment: str | None = Field(default=None, max_length=2000)
     voted_at: datetime | None = None
 
@@ -65,6 +94,18 @@ class TeamRating(SQLModel, table=True):
     Każdy unikalny silnik (provider/model) ma swój rating ELO.
     """
     __tablename__ = "team_ratings"
+    __table_args__ = (
+        # Wyszukiwanie po zawartości config (@>) - tylko PostgreSQL/JSONB
+        Index(
+            "ix_team_ratings_config_gin",
+            "config",
+            postgresql_using="gin",
+            postgresql_ops={"config": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        # Ranking: ORDER BY elo_rating DESC z filtrem games_played >= N -
+        # skan indeksu w kolejności ELO, filtr liczony z samego indeksu
+        Index("ix_team_ratings_elo_games", "elo_rating", "games_played"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
 
@@ -72,7 +113,7 @@ class TeamRating(SQLModel, table=True):
     config_hash: str = Field(max_length=64, unique=True, index=True)
 
     # Konfiguracja silnika (dla wyświetlania)
-    config: dict = Field(default={}, sa_column=Column(JSON))
+    config: dict = Field(default={}, sa_column=Column(ConfigJSON))
 
     # Statystyki ELO
     elo_rating: float = Field(default=1500.0)
@@ -132,4 +173,11 @@ class TeamRatingRead(SQLModel):
     wins: int
     losses: int
     ties: int
-    win_rate: float = 0.0
+
+    @computed_field
+    @property
+    def win_rate(self) -> float:
+        """Procent wygranych (0-100), zaokrąglony do 0.1."""
+        if self.games_played <= 0:
+            return 0.0
+        return round(self.wins / self.games_played * 100, 1)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from enum import Enum
+from sqlalchemy import Index, text
 from sqlmodel import Field, SQLModel
 
 
@@ -40,10 +41,15 @@ class AuditLog(SQLModel, table=True):
     """Audit log entry for tracking user actions."""
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Keyset pagination: "logs of a user / an action, newest first"
+        Index("ix_audit_logs_user_created", "user_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_audit_logs_action_created", "action", text("created_at DESC")),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    user_id: int | None = Field(default=None, index=True)
-    action: AuditAction = Field(index=True)
+    user_id: int | None = Field(default=None)
+    action: AuditAction
     resource_type: str | None = Field(default=None, max_length=50)
     resource_id: int | None = Field(default=None)
     details: str | None = Field(default=None, max_length=2000)
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Literal
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel, Column, JSON
 
 if TYPE_CHECKING:
@@ -19,9 +20,13 @@ class Conversation(SQLModel, table=True):
     """Agent conversation (council or arena mode)."""
 
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Keyset pagination of a review's conversations, newest first
+        Index("ix_conversations_review_created", "review_id", text("created_at DESC"), text("id DESC")),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    review_id: int = Field(foreign_key="reviews.id", index=True)
+    review_id: int = Field(foreign_key="reviews.id")
     mode: str = Field(index=True)
     topic_type: str = Field(index=True)
     topic_id: int | None = None  # project_id, file_id, or issue_id
@@ -33,16 +38,27 @@ class Conversation(SQLModel, table=True):
 
     # Relationships
     review: Review = Relationship(back_populates="conversations")
-    messages: Message = Relationship(back_populates="conversation")
+    # Only ever loaded explicitly (selectinload) - an accidental lazy load raises.
+    # collection_class: the plain annotation alone would map a scalar
+    messages: Message = Relationship(
+        back_populates="conversation",
+        sa_relationship_kwargs={
+            "collection_class": list, "order_by": "Message.turn_index", "lazy": "raise"
+        },
+    )
 
 
 class Message(SQLModel, table=True):
     """Message in a conversation."""
 
     __tablename__ = "messages"
+    __table_args__ = (
+        # Messages of a conversation in turn order (also serves the FK lookups)
+        Index("ix_messages_conversation_turn", "conversation_id", "turn_index"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    conversation_id: int = Field(foreign_key="conversations.id", index=True)
+    conversation_id: int = Field(foreign_key="conversations.id")
     sender_type: str = Field(index=True)
     sender_name: str = Field(max_length=100)  # agent role or username
     turn_index: int = Field(default=0, index=True)
@@ -95,6 +111,13 @@ class MessageRead(SQLModel):
     created_at: datetime
 
 
+class ConversationReadWithMessages(ConversationRead):
+    """Schema for conversation response with its messages."""
+
+    meta_info: dict[str, Any] = {}  # verdict, final_severity (adversarial debates)
+    messages: list[MessageRead] = []
+
+
 class DebateIssueRequest(SQLModel):
     """Schema for starting an adversarial debate on an issue."""
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 import hashlib
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -15,9 +15,13 @@ class File(SQLModel, table=True):
     """Code file belonging to a project."""
 
     __tablename__ = "files"
+    __table_args__ = (
+        # Files of a project in name order (also serves the FK lookups)
+        Index("ix_files_project_name", "project_id", "name"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    project_id: int = Field(foreign_key="projects.id", index=True)
+    project_id: int = Field(foreign_key="projects.id")
     name: str = Field(max_length=255)
     content: str = Field(max_length=10_000_000)  # 10MB text limit
     content_hash: str = Field(max_length=64, index=True)  # SHA256 hash
@@ -31,9 +35,15 @@ class File(SQLModel, table=True):
     issues: Issue = Relationship(back_populates="file")
 
     @staticmethod
-    def compute_hash(content: str) -> str:
-        """Compute SHA256 hash of file content."""
-        return hashlib.sha256(content.encode()).hexdigest()
+    def compute_hash(content: str | bytes) -> str:
+        """Compute SHA256 hash of file content (str, or its UTF-8 bytes).
+
+        hashlib's OpenSSL SHA-256 uses the CPU's SHA extensions where present
+        and releases the GIL, so callers on the event loop run it in a thread.
+        """
+        if isinstance(content, str):
+            content = content.encode()
+        return hashlib.sha256(content).hexdigest()
 
 
 class FileCreate(SQLModel):
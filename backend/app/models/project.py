@@ -20,6 +20,8 @@ class Project(SQLModel, table=True):
     name: str = Field(max_length=255, index=True)
     description: str | None = Field(default=None, max_length=2000)
     owner_id: int = Field(foreign_key="users.id", index=True)
+    # Number of files, maintained by create_file/delete_file (limit check without COUNT)
+    file_count: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Literal
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel, Column, JSON
 
 if TYPE_CHECKING:
@@ -25,10 +26,14 @@ class Review(SQLModel, table=True):
     """
 
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Reviews of a project, newest first (also serves the FK lookups)
+        Index("ix_reviews_project_created", "project_id", text("created_at DESC")),
+    )
 
     # Podstawowe pola
     id: int | None = Field(default=None, primary_key=True)
-    project_id: int = Field(foreign_key="projects.id", index=True)
+    project_id: int = Field(foreign_key="projects.id")
     status: str = Field(default="pending", index=True)
     created_by: int = Field(foreign_key="users.id", index=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -39,7 +44,6 @@ class Review(SQLModel, table=True):
     review_mode: str = Field(
         default="council",
         max_length=20,
-        index=True,
         description="Tryb review: 'council' (narada)"
     )
     # Podsumowanie moderatora (końcowy raport)
@@ -79,9 +83,13 @@ class Issue(SQLModel, table=True):
     """Issue found during code review."""
 
     __tablename__ = "issues"
+    __table_args__ = (
+        # Issues of a review by severity, then age (also serves the FK lookups)
+        Index("ix_issues_review_severity_created", "review_id", text("severity DESC"), "created_at"),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
-    review_id: int = Field(foreign_key="reviews.id", index=True)
+    review_id: int = Field(foreign_key="reviews.id")
     file_id: int | None = Field(default=None, foreign_key="files.id", index=True)
 
     severity: str = Field(default="info", index=True)
@@ -11,6 +11,13 @@ if TYPE_CHECKING:
     from app.models.project import Project
     from app.models.review import Review
 
+# Compiled once at import (the validators run on every register / password change)
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9._-]{3,30}')
+_UPPER_RE = re.compile(r'[A-Z]')
+_LOWER_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+
 
 def validate_email_format(email: str) -> str:
     """Validate email format and normalize to lowercase.
@@ -30,8 +37,7 @@ def validate_email_format(email: str) -> str:
         raise ValueError('nieprawidłowy format email')
 
     # Basic email regex that accepts .test and .local TLDs
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email.lower()):
+    if not _EMAIL_RE.fullmatch(email.lower()):
         raise ValueError('nieprawidłowy format email')
 
     return email.lower()
@@ -73,7 +79,7 @@ class UserCreate(SQLModel):
     @classmethod
     def validate_username(cls, v: str) -> str:
         """Validate username format (letters, numbers, ._-)."""
-        if not re.match(r'^[a-zA-Z0-9._-]{3,30}$', v):
+        if not _USERNAME_RE.fullmatch(v):
             raise ValueError("nieprawidłowa nazwa użytkownika")
         return v
 
@@ -81,11 +87,11 @@ class UserCreate(SQLModel):
     @classmethod
     def validate_password_strength(cls, v: str) -> str:
         """Validate password strength (uppercase, lowercase, digit)."""
-        if not re.search(r"[A-Z]", v):
+        if not _UPPER_RE.search(v):
             raise ValueError("hasło musi zawierać wielką literę")
-        if not re.search(r"[a-z]", v):
+        if not _LOWER_RE.search(v):
             raise ValueError("hasło musi zawierać małą literę")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("hasło musi zawierać cyfrę")
         return v
 
@@ -153,10 +159,10 @@ class PasswordChange(SQLModel):
     @classmethod
     def validate_new_password_strength(cls, v: str) -> str:
         """Validate new password strength (uppercase, lowercase, digit)."""
-        if not re.search(r"[A-Z]", v):
+        if not _UPPER_RE.search(v):
             raise ValueError("hasło musi zawierać wielką literę")
-        if not re.search(r"[a-z]", v):
+        if not _LOWER_RE.search(v):
             raise ValueError("hasło musi zawierać małą literę")
-        if not re.search(r"\d", v):
+        if not _DIGIT_RE.search(v):
             raise ValueError("hasło musi zawierać cyfrę")
         return v
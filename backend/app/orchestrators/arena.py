@@ -7,6 +7,7 @@ Przepływ:
 4. Generuje podsumowania dla każdego zespołu
 5. Ustawia status na "voting" - czeka na głos użytkownika
 """
+import asyncio
 import logging
 from datetime import datetime, timezone
 from sqlmodel import Session, select
@@ -85,35 +86,18 @@ Odpowiadaj po polsku, zwięźle i konkretnie. Używaj TYLKO informacji z analiz
     async def run_arena(self, session_id: int, api_keys: dict | None = None):
         """Przeprowadź sesję Arena.
 
+        Sesja bazy jest synchroniczna, więc odczyty i commity idą przez
+        asyncio.to_thread - event loop obsługuje w tym czasie inne requesty,
+        a nie czeka na bazę między wywołaniami LLM.
+
         Args:
             session_id: ID sesji Arena
             api_keys: Klucze API per provider
         """
-        arena_session = self.session.get(ArenaSession, session_id)
-        if not arena_session:
-            raise ValueError(f"ArenaSession {session_id} nie istnieje")
-
-        project = self.session.get(Project, arena_session.project_id)
-        if not project:
-            raise ValueError(f"Project {arena_session.project_id} nie istnieje")
-
-        # Aktualizuj status
-        arena_session.status = "running"
-        self.session.add(arena_session)
-        self.session.commit()
+        arena_session = await asyncio.to_thread(self._start_session, session_id)
 
         try:
-            # Pobierz pliki projektu (max 20, tak jak w Review Mode)
-            files_query = select(File).where(File.project_id == project.id).limit(20)
-            files = self.session.exec(files_query).all()
-
-            if not files:
-                raise ValueError("Projekt nie ma żadnych plików do analizy")
-
-            logger.info(f"Arena {session_id}: Znaleziono {len(files)} plików do analizy (max 20)")
-
-            # Zbuduj kontekst kodu
-            code_context = self._build_code_context(files)
+            code_context = await asyncio.to_thread(self._load_code_context, arena_session)
 
             # Uruchom oba zespoły
             logger.info(f"Arena {session_id}: Uruchamiam Zespół A...")
@@ -140,6 +124,41 @@ Odpowiadaj po polsku, zwięźle i konkretnie. Używaj TYLKO informacji z analiz
             arena_session.error_message = str(e)[:2000]
             logger.error(f"Arena {session_id} failed: {e}")
 
+        await asyncio.to_thread(self._save_session, arena_session)
+
+    def _start_session(self, session_id: int) -> ArenaSession:
+        """Pobierz sesję i oznacz ją jako "running" (synchronicznie, w wątku)."""
+        arena_session = self.session.get(ArenaSession, session_id)
+        if not arena_session:
+            raise ValueError(f"ArenaSession {session_id} nie istnieje")
+
+        project = self.session.get(Project, arena_session.project_id)
+        if not project:
+            raise ValueError(f"Project {arena_session.project_id} nie istnieje")
+
+        # Aktualizuj status
+        arena_session.status = "running"
+        self.session.add(arena_session)
+        self.session.commit()
+        # Odśwież tutaj - inaczej wygasłe po commicie pola doczytałby event loop
+        self.session.refresh(arena_session)
+        return arena_session
+
+    def _load_code_context(self, arena_session: ArenaSession) -> str:
+        """Pobierz pliki projektu i zbuduj z nich kontekst kodu (w wątku)."""
+        # Pobierz pliki projektu (max 20, tak jak w Review Mode)
+        files_query = select(File).where(File.project_id == arena_session.project_id).limit(20)
+        files = self.session.exec(files_query).all()
+
+        if not files:
+            raise ValueError("Projekt nie ma żadnych plików do analizy")
+
+        logger.info(f"Arena {arena_session.id}: Znaleziono {len(files)} plików do analizy (max 20)")
+
+        return self._build_code_context(files)
+
+    def _save_session(self, arena_session: ArenaSession) -> None:
+        """Zapisz wynik sesji (w wątku)."""
         self.session.add(arena_session)
         self.session.commit()
 
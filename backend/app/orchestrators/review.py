@@ -522,7 +522,8 @@ Jeśli brak błędów: {"issues": [], "summary": "Kod poprawny"}"""
             logger.warning("Moderator summary issues field is not a list - skipping")
             return
 
-        from datetime import datetime, timezone
+        # One timestamp for the whole batch (and created_at == updated_at)
+        now = datetime.now(timezone.utc)
         for issue_data in issues:
             if not isinstance(issue_data, dict):
                 continue
@@ -532,8 +533,8 @@ Jeśli brak błędów: {"issues": [], "summary": "Kod poprawny"}"""
                 category=issue_data.get("category") or "general",
                 title=issue_data.get("title") or "Moderator issue",
                 description=issue_data.get("description") or "Brak opisu problemu.",
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+                created_at=now,
+                updated_at=now,
             )
             self.session.add(issue)
 
@@ -1,12 +1,14 @@
 """Access control utilities for authorization checks."""
 from fastapi import HTTPException, status
-from sqlmodel import Session
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, func, select
 from app.models.user import User
 from app.models.project import Project
-from app.models.review import Review
+from app.models.review import Review, Issue
+from app.models.conversation import Conversation, Message
 
 
-async def verify_project_access(
+def verify_project_access(
     project_id: int,
     current_user: User,
     session: Session
@@ -41,17 +43,22 @@ async def verify_project_access(
     return project
 
 
-async def verify_review_access(
+def verify_review_access(
     review_id: int,
     current_user: User,
-    session: Session
+    session: Session,
+    action: str = "access"
 ) -> Review:
     """Verify user has access to the review.
 
+    The review and its project's owner are loaded in one joined SELECT
+    instead of two separate lookups.
+
     Args:
         review_id: ID of the review to check
         current_user: Current authenticated user
         session: Database session
+        action: Verb used in the 403 message ("Not authorized to <action> this review")
 
     Returns:
         Review object if user has access
@@ -59,20 +66,163 @@ async def verify_review_access(
     Raises:
         HTTPException: 404 if review not found, 403 if user doesn't own review
     """
-    review = session.get(Review, review_id)
+    row = session.exec(
+        select(Review, Project.owner_id)
+        .outerjoin(Project, Project.id == Review.project_id)
+        .where(Review.id == review_id)
+    ).first()
 
-    if not review:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Review not found"
         )
 
     # Check if user owns the project that this review belongs to
-    project = session.get(Project, review.project_id)
-    if not project or project.owner_id != current_user.id:
+    review, owner_id = row
+    if owner_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this review"
+            detail=f"Not authorized to {action} this review"
         )
 
     return review
+
+
+def _conversation_access_row(
+    conversation_id: int,
+    current_user: User,
+    session: Session,
+    action: str,
+    *columns,
+    load_messages: bool = False
+) -> tuple:
+    """Run the joined access query and return (Conversation, *columns)."""
+    statement = (
+        select(Conversation, Project.owner_id, *columns)
+        .outerjoin(Review, Review.id == Conversation.review_id)
+        .outerjoin(Project, Project.id == Review.project_id)
+        .where(Conversation.id == conversation_id)
+    )
+    if load_messages:
+        statement = statement.options(selectinload(Conversation.messages))
+    row = session.exec(statement).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found"
+        )
+
+    conversation, owner_id, *values = row
+    if owner_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this conversation"
+        )
+
+    return (conversation, *values)
+
+
+def verify_conversation_access(
+    conversation_id: int,
+    current_user: User,
+    session: Session,
+    action: str = "access",
+    load_messages: bool = False
+) -> Conversation:
+    """Verify user has access to the conversation.
+
+    Conversation -> Review -> Project owner in one joined SELECT instead of
+    three separate lookups.
+
+    Args:
+        conversation_id: ID of the conversation to check
+        current_user: Current authenticated user
+        session: Database session
+        action: Verb used in the 403 message ("Not authorized to <action> this conversation")
+        load_messages: Eager-load conversation.messages (ordered by turn_index)
+            with one extra SELECT ... WHERE conversation_id IN (...)
+
+    Returns:
+        Conversation object if user has access
+
+    Raises:
+        HTTPException: 404 if conversation not found, 403 if user doesn't own it
+    """
+    conversation, = _conversation_access_row(
+        conversation_id, current_user, session, action, load_messages=load_messages
+    )
+    return conversation
+
+
+def verify_conversation_access_with_count(
+    conversation_id: int,
+    current_user: User,
+    session: Session,
+    action: str = "access"
+) -> tuple[Conversation, int]:
+    """Like verify_conversation_access, plus the conversation's message count.
+
+    The count is a correlated subquery of the same access SELECT (an
+    index-only count on messages.conversation_id), not a separate query.
+
+    Returns:
+        (Conversation, message_count) if user has access
+
+    Raises:
+        HTTPException: 404 if conversation not found, 403 if user doesn't own it
+    """
+    message_count = (
+        select(func.count())
+        .where(Message.conversation_id == Conversation.id)
+        .correlate(Conversation)
+        .scalar_subquery()
+    )
+    return _conversation_access_row(conversation_id, current_user, session, action, message_count)
+
+
+def verify_issue_access(
+    issue_id: int,
+    current_user: User,
+    session: Session,
+    action: str = "access"
+) -> Issue:
+    """Verify user has access to the issue.
+
+    Issue -> Review -> Project owner in one joined SELECT instead of three
+    separate lookups.
+
+    Args:
+        issue_id: ID of the issue to check
+        current_user: Current authenticated user
+        session: Database session
+        action: Verb used in the 403 message ("Not authorized to <action> this issue")
+
+    Returns:
+        Issue object if user has access
+
+    Raises:
+        HTTPException: 404 if issue not found, 403 if user doesn't own it
+    """
+    row = session.exec(
+        select(Issue, Project.owner_id)
+        .outerjoin(Review, Review.id == Issue.review_id)
+        .outerjoin(Project, Project.id == Review.project_id)
+        .where(Issue.id == issue_id)
+    ).first()
+
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue not found"
+        )
+
+    issue, owner_id = row
+    if owner_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this issue"
+        )
+
+    return issue
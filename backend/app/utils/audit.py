@@ -1,13 +1,94 @@
-"""Audit logging utility for tracking user actions."""
+"""Audit logging utility for tracking user actions.
+
+With `audit_batching_enabled` events are not written inside the request:
+they go onto an in-process queue and a background thread inserts them in
+batches (up to AUDIT_BATCH_SIZE rows or AUDIT_FLUSH_INTERVAL seconds per
+multi-row INSERT). The queue is drained on shutdown (flush_audit_events).
+"""
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Any
 from fastapi import Request
+from sqlalchemy import Engine, insert
 from sqlmodel import Session
+from app.config import settings
 from app.models.audit import AuditLog, AuditAction
 
 logger = logging.getLogger(__name__)
 
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_INTERVAL = 0.1  # seconds
+
+# (engine, row) - the engine comes from the request's session, so events
+# land in the same database the request used
+_audit_queue: queue.Queue[tuple[Engine, dict[str, Any]]] = queue.Queue()
+_flusher: threading.Thread | None = None
+_flusher_lock = threading.Lock()
+
+
+def _write_batch(batch: list[tuple[Engine, dict[str, Any]]]) -> None:
+    """Insert a batch of audit rows, one executemany per engine."""
+    rows_by_engine: dict[Engine, list[dict[str, Any]]] = {}
+    for engine, row in batch:
+        rows_by_engine.setdefault(engine, []).append(row)
+
+    for engine, rows in rows_by_engine.items():
+        try:
+            with Session(engine) as session:
+                session.execute(insert(AuditLog), rows)
+                session.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(rows)} audit events: {e}")
+
+
+def _flush_loop() -> None:
+    """Background thread: drain the queue in batches, forever."""
+    while True:
+        batch = [_audit_queue.get()]
+        deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL
+        while len(batch) < AUDIT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_audit_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        _write_batch(batch)
+        for _ in batch:
+            _audit_queue.task_done()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="audit-flusher", daemon=True)
+            _flusher.start()
+
+
+def flush_audit_events() -> None:
+    """Block until every queued audit event has been written."""
+    if _flusher is not None:
+        _audit_queue.join()
+
+
+def _record(session: Session, audit_log: AuditLog) -> None:
+    """Queue an audit row for the background writer, or write it inline."""
+    if settings.audit_batching_enabled:
+        _ensure_flusher()
+        _audit_queue.put_nowait((session.get_bind(), audit_log.model_dump(exclude={"id"})))
+        return
+
+    session.add(audit_log)
+    session.commit()
+
 
 def get_client_ip(request: Request) -> str:
     """Get the client's IP address from the request.
@@ -86,8 +167,7 @@ async def log_audit_event(
             user_agent=user_agent,
         )
 
-        session.add(audit_log)
-        session.commit()
+        _record(session, audit_log)
 
         logger.debug(
             f"Audit: {action.value} by user {user_id} on {resource_type}:{resource_id}"
@@ -131,8 +211,7 @@ def sync_log_audit_event(
             user_agent=user_agent,
         )
 
-        session.add(audit_log)
-        session.commit()
+        _record(session, audit_log)
 
         logger.debug(
             f"Audit: {action.value} by user {user_id} on {resource_type}:{resource_id}"
@@ -1,5 +1,7 @@
 """Authentication utilities for password hashing and JWT tokens."""
+import hashlib
 import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from jose import JWTError, jwt
@@ -10,6 +12,18 @@ from app.config import settings
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 ACCESS_TOKEN_EXPIRE_MINUTES = 45  # Session duration: 45 minutes as requested by user
 
+# Verified refresh token payloads, keyed by a digest of the token
+REFRESH_DECODE_CACHE_TTL = 5  # seconds
+REFRESH_DECODE_CACHE_MAX = 10_000
+_refresh_payloads: dict[bytes, tuple[dict[str, Any], float]] = {}
+
+# Decoded access tokens (checked on every authenticated request); invalid
+# tokens are remembered too (payload None), for a shorter time
+ACCESS_DECODE_CACHE_TTL = 300  # seconds
+ACCESS_DECODE_NEGATIVE_TTL = 60  # seconds
+ACCESS_DECODE_CACHE_MAX = 50_000
+_access_payloads: dict[bytes, tuple[dict[str, Any] | None, float]] = {}
+
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt.
@@ -80,3 +94,76 @@ def decode_refresh_token(token: str) -> dict[str, Any] | None:
         return payload
     except JWTError:
         return None
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _decode_cached(
+    cache: dict[bytes, tuple[dict[str, Any] | None, float]],
+    max_size: int,
+    token: str,
+    decode,
+    ttl: float,
+    negative_ttl: float = 0,
+) -> dict[str, Any] | None:
+    """Look a token up in a decode cache, decoding and storing it on a miss.
+
+    Valid payloads are kept for ttl seconds but never past the token's own
+    exp; invalid tokens for negative_ttl seconds (not at all when 0).
+    """
+    key = _token_key(token)
+    now = time.time()
+    cached = cache.get(key)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    payload = decode(token)
+    if payload is not None:
+        expires = min(now + ttl, payload.get("exp", now))
+    elif negative_ttl > 0:
+        expires = now + negative_ttl
+    else:
+        return None
+    if len(cache) >= max_size:
+        cache.clear()
+    cache[key] = (payload, expires)
+    return payload
+
+
+def decode_access_token_cached(token: str) -> dict[str, Any] | None:
+    """decode_access_token with a TTL cache keyed by a digest of the token.
+
+    A token's payload cannot change, so repeated requests with the same
+    token (a dashboard calling several endpoints) skip the signature check
+    until ACCESS_DECODE_CACHE_TTL or the token's exp, whichever is sooner.
+    Garbage tokens are rejected from the cache for ACCESS_DECODE_NEGATIVE_TTL.
+    """
+    return _decode_cached(
+        _access_payloads, ACCESS_DECODE_CACHE_MAX, token, decode_access_token,
+        ACCESS_DECODE_CACHE_TTL, ACCESS_DECODE_NEGATIVE_TTL,
+    )
+
+
+def forget_access_token(token: str) -> None:
+    """Drop an access token from the decode cache (logout)."""
+    _access_payloads.pop(_token_key(token), None)
+
+
+def decode_refresh_token_cached(token: str) -> dict[str, Any] | None:
+    """decode_refresh_token with a short TTL cache of successful results.
+
+    A client retrying a refresh (several tabs, flaky mobile network) within
+    REFRESH_DECODE_CACHE_TTL seconds skips the signature check. Only valid
+    tokens are cached, and never past their own expiry.
+    """
+    return _decode_cached(
+        _refresh_payloads, REFRESH_DECODE_CACHE_MAX, token, decode_refresh_token,
+        REFRESH_DECODE_CACHE_TTL,
+    )
+
+
+def forget_refresh_token(token: str) -> None:
+    """Drop a refresh token from the decode cache (logout)."""
+    _refresh_payloads.pop(_token_key(token), None)
@@ -74,6 +74,38 @@ class CacheManager:
         import time
         _memory_cache[key] = (value, time.time() + ttl)
 
+    def get_raw(self, key: str) -> str | None:
+        """Get a pre-serialized string from cache (no JSON decoding)."""
+        if self.redis_client:
+            try:
+                return self.redis_client.get(key)
+            except Exception as e:
+                logger.warning(f"Redis get error: {e}")
+
+        import time
+        if key in _memory_cache:
+            value, expiry = _memory_cache[key]
+            if time.time() < expiry:
+                return value
+            del _memory_cache[key]
+
+        return None
+
+    def set_raw(self, key: str, value: str, ttl: int | None = None):
+        """Store a pre-serialized string in cache (no JSON encoding)."""
+        if ttl is None:
+            ttl = settings.cache_ttl_seconds
+
+        if self.redis_client:
+            try:
+                self.redis_client.setex(key, ttl, value)
+                return
+            except Exception as e:
+                logger.warning(f"Redis set error: {e}")
+
+        import time
+        _memory_cache[key] = (value, time.time() + ttl)
+
     def delete(self, key: str):
         """Delete value from cache."""
         if self.redis_client:
@@ -103,13 +135,11 @@ class CacheManager:
         """Delete cache keys with the given prefix."""
         if self.redis_client:
             try:
-                cursor = 0
-                while True:
-                    cursor, keys = self.redis_client.scan(cursor=cursor, match=f"{prefix}*")
-                    if keys:
-                        self.redis_client.delete(*keys)
-                    if cursor == 0:
-                        break
+                # Batch the DELs of all matched keys into one round-trip
+                pipe = self.redis_client.pipeline(transaction=False)
+                for key in self.redis_client.scan_iter(match=f"{prefix}*", count=500):
+                    pipe.delete(key)
+                pipe.execute()
                 return
             except Exception as e:
                 logger.warning(f"Redis delete_prefix error: {e}")
@@ -1,4 +1,6 @@
 """Pagination utilities for API endpoints."""
+import base64
+from datetime import datetime
 from typing import TypeVar, Generic
 from pydantic import BaseModel
 
@@ -50,3 +52,23 @@ class PaginatedResponse(BaseModel, Generic[T]):
             has_next=page < total_pages,
             has_prev=page > 1,
         )
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Encode the (created_at, id) of the last row of a page as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor made by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
@@ -1,5 +1,6 @@
 """Rate limiting utilities."""
 import logging
+import secrets
 import time
 from fastapi import HTTPException, Request, status
 from app.config import settings
@@ -10,6 +11,26 @@ logger = logging.getLogger(__name__)
 # In-memory fallback for rate limiting (if Redis unavailable)
 _memory_rate_limit: dict[str, list[float]] = {}
 
+# Sliding window on a sorted set, atomically in one round-trip:
+# drop entries older than the window, record this request, return the count
+_SLIDING_WINDOW_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1] - ARGV[2])
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return redis.call('ZCARD', KEYS[1])
+"""
+_sliding_window = None  # redis Script (EVALSHA, reloaded on NOSCRIPT)
+
+
+def _redis_window_count(key: str, now: float, window: int) -> int:
+    """Record a request in the Redis window for `key` and return the window count."""
+    global _sliding_window
+    if _sliding_window is None:
+        _sliding_window = cache.redis_client.register_script(_SLIDING_WINDOW_LUA)
+    # Unique member - two requests in the same instant must both count
+    member = f"{now}:{secrets.token_hex(4)}"
+    return int(_sliding_window(keys=[key], args=[now, window, member]))
+
 
 def check_rate_limit(request: Request, user_id: int | None = None, limit: int | None = None):
     """Check if request is within rate limit.
@@ -37,16 +58,14 @@ def check_rate_limit(request: Request, user_id: int | None = None, limit: int |
 
     current_time = time.time()
 
-    # Try Redis first
+    # Try Redis first (shared by all workers and replicas)
     if cache.redis_client:
         try:
-            # Use Redis sorted set for sliding window
-            cache.redis_client.zadd(key, {str(current_time): current_time})
-            cache.redis_client.zremrangebyscore(key, 0, current_time - window)
-            cache.redis_client.expire(key, window)
-
-            count = cache.redis_client.zcard(key)
-
+            count = _redis_window_count(key, current_time, window)
+        except Exception as e:
+            # Fall through to memory-based rate limiting
+            logger.warning(f"Redis rate limit error: {e}")
+        else:
             if count > rate_limit:
                 raise HTTPException(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -54,10 +73,6 @@ def check_rate_limit(request: Request, user_id: int | None = None, limit: int |
                 )
             return
 
-        except Exception as e:
-            # Fall through to memory-based rate limiting
-            logger.warning(f"Redis rate limit error: {e}")
-
     # Fallback to in-memory rate limiting
     if key not in _memory_rate_limit:
         _memory_rate_limit[key] = []
@@ -0,0 +1,75 @@
+"""Background task dispatch - Redis queue or FastAPI BackgroundTasks.
+
+Long-running jobs (Arena analysis, agent conversations) are pushed onto a
+Redis list when `task_queue_enabled` is set and Redis is reachable; a
+separate worker process (`python -m app.worker`) picks them up. Otherwise the job runs in
+the API process via BackgroundTasks, as before (dev/testing) - at most
+`background_task_concurrency` of them at a time, the rest wait their turn.
+"""
+import asyncio
+import json
+import logging
+import weakref
+from typing import Any, Awaitable, Callable
+
+from fastapi import BackgroundTasks
+from app.config import settings
+from app.utils.cache import cache
+
+logger = logging.getLogger(__name__)
+
+TASK_QUEUE_KEY = "tasks:queue"
+TASK_PROCESSING_KEY = "tasks:processing"
+
+# Registry: name -> async function (the worker resolves jobs by name)
+_tasks: dict[str, Callable[..., Awaitable[Any]]] = {}
+
+# In-process fallback slots, one semaphore per event loop
+_local_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def task(name: str):
+    """Register an async function as a queueable task."""
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        _tasks[name] = func
+        return func
+    return decorator
+
+
+def get_task(name: str) -> Callable[..., Awaitable[Any]]:
+    """Look up a registered task by name."""
+    return _tasks[name]
+
+
+async def _run_local(func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> None:
+    """Run a task in the API process once one of the local slots is free."""
+    loop = asyncio.get_running_loop()
+    slots = _local_slots.get(loop)
+    if slots is None:
+        slots = _local_slots[loop] = asyncio.Semaphore(settings.background_task_concurrency)
+    async with slots:
+        await func(*args, **kwargs)
+
+
+def enqueue_task(
+    background_tasks: BackgroundTasks,
+    name: str,
+    *args: Any,
+) -> None:
+    """Queue a task for the worker, or run it in-process as a fallback.
+
+    Args:
+        background_tasks: FastAPI BackgroundTasks of the current request
+        name: Registered task name
+        *args: JSON-serializable task arguments
+    """
+    if settings.task_queue_enabled and cache.redis_client:
+        try:
+            cache.redis_client.lpush(TASK_QUEUE_KEY, json.dumps({"task": name, "args": list(args)}))
+            return
+        except Exception as e:
+            logger.warning(f"Redis enqueue error, running task in-process: {e}")
+
+    background_tasks.add_task(_run_local, get_task(name), *args)
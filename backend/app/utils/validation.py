@@ -5,6 +5,13 @@ across the application and follow DRY principle.
 """
 import re
 
+# Patterns are compiled once at import instead of on every call
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_USERNAME_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9_-]*')
+_UPPER_RE = re.compile(r'[A-Z]')
+_LOWER_RE = re.compile(r'[a-z]')
+_DIGIT_RE = re.compile(r'\d')
+
 
 def validate_email_format(email: str) -> bool:
     """Validate email address format using regex pattern.
@@ -24,8 +31,7 @@ def validate_email_format(email: str) -> bool:
     if not email or not isinstance(email, str):
         return False
 
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -57,13 +63,13 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     if len(password) < 8:
         return False, "Password must be at least 8 characters long"
 
-    if not re.search(r'[A-Z]', password):
+    if not _UPPER_RE.search(password):
         return False, "Password must contain at least one uppercase letter"
 
-    if not re.search(r'[a-z]', password):
+    if not _LOWER_RE.search(password):
         return False, "Password must contain at least one lowercase letter"
 
-    if not re.search(r'\d', password):
+    if not _DIGIT_RE.search(password):
         return False, "Password must contain at least one digit"
 
     # Optional: Check for common weak passwords
@@ -104,7 +110,7 @@ def validate_username(username: str) -> tuple[bool, str]:
     if len(username) > 30:
         return False, "Username must be at most 30 characters long"
 
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', username):
+    if not _USERNAME_RE.fullmatch(username):
         return False, "Username must start with a letter and contain only letters, numbers, underscores, and hyphens"
 
     return True, ""
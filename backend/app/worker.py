@@ -0,0 +1,73 @@
+"""Task worker - runs jobs queued by app.utils.tasks.
+
+Usage (separate process, several can run side by side):
+    python -m app.worker [worker-name]
+
+Each job is moved atomically (BLMOVE) from the queue to this worker's
+processing list and removed only once it has finished, so a worker that
+crashes mid-job picks it up again when restarted under the same name.
+"""
+import asyncio
+import json
+import logging
+import socket
+import sys
+
+from app.config import settings
+from app.utils.cache import cache
+from app.utils.tasks import TASK_PROCESSING_KEY, TASK_QUEUE_KEY, get_task
+
+# Modules registering tasks (@task decorator)
+import app.api.arena  # noqa: F401
+import app.api.conversations  # noqa: F401
+
+logger = logging.getLogger(__name__)
+
+# A hung job (stuck provider call) is cancelled instead of blocking the worker
+JOB_TIMEOUT_SECONDS = 1800
+
+
+async def run_job(payload: str) -> None:
+    """Run a single queued job, cancelled after JOB_TIMEOUT_SECONDS."""
+    job = json.loads(payload)
+    await asyncio.wait_for(get_task(job["task"])(*job["args"]), timeout=JOB_TIMEOUT_SECONDS)
+
+
+def describe_job(payload: str) -> str:
+    """Task name and first argument only - the other args may hold API keys."""
+    try:
+        job = json.loads(payload)
+        args = job.get("args") or [None]
+        return f"{job['task']}({args[0]!r}, ...)"
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return "<unreadable job>"
+
+
+def main() -> None:
+    logging.basicConfig(level=settings.log_level)
+    redis_client = cache.redis_client
+    if redis_client is None:
+        raise SystemExit("Task worker requires Redis (REDIS_URL)")
+
+    worker_name = sys.argv[1] if len(sys.argv) > 1 else socket.gethostname()
+    processing_key = f"{TASK_PROCESSING_KEY}:{worker_name}"
+
+    # Jobs left over from a previous run of this worker go back to the queue
+    while redis_client.lmove(processing_key, TASK_QUEUE_KEY, "RIGHT", "RIGHT"):
+        pass
+
+    logger.info(f"Task worker {worker_name} started")
+    while True:
+        payload = redis_client.blmove(TASK_QUEUE_KEY, processing_key, 0, "RIGHT", "LEFT")
+        try:
+            asyncio.run(run_job(payload))
+        except asyncio.TimeoutError:
+            logger.error(f"Task timed out after {JOB_TIMEOUT_SECONDS}s: {describe_job(payload)}")
+        except Exception:
+            logger.exception(f"Task failed: {describe_job(payload)}")
+        finally:
+            redis_client.lrem(processing_key, 1, payload)
+
+
+if __name__ == "__main__":
+    main()
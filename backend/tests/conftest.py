@@ -3,12 +3,16 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import SQLModel, Session, create_engine
 from sqlmodel.pool import StaticPool
+from app import database
 from app.main import app
+from app.api import conversations
 from app.database import get_session
 from app.config import settings
 
 # Disable rate limiting globally for all tests
 settings.rate_limit_enabled = False
+# Write audit events inline, so they land in the test database right away
+settings.audit_batching_enabled = False
 
 
 @pytest.fixture(name="test_engine")
@@ -31,7 +35,7 @@ def test_session_fixture(test_engine):
 
 
 @pytest.fixture(name="client")
-def client_fixture(test_engine):
+def client_fixture(test_engine, monkeypatch):
     """Create test client with test database."""
     # Disable rate limiting for tests
     original_rate_limit_enabled = settings.rate_limit_enabled
@@ -42,6 +46,9 @@ def client_fixture(test_engine):
             yield session
 
     app.dependency_overrides[get_session] = get_test_session
+    # Background tasks open their own sessions on the module-level engine
+    monkeypatch.setattr(database, "engine", test_engine)
+    monkeypatch.setattr(conversations, "engine", test_engine)
 
     # Create TestClient without context manager to avoid lifespan issues
     client = TestClient(app, raise_server_exceptions=True)
@@ -3,10 +3,17 @@ import pytest
 from fastapi import HTTPException
 from sqlmodel import Session, create_engine, SQLModel
 from sqlmodel.pool import StaticPool
-from app.utils.access import verify_project_access, verify_review_access
+from app.utils.access import (
+    verify_conversation_access,
+    verify_conversation_access_with_count,
+    verify_issue_access,
+    verify_project_access,
+    verify_review_access,
+)
 from app.models.user import User
 from app.models.project import Project
-from app.models.review import Review
+from app.models.review import Review, Issue
+from app.models.conversation import Conversation, Message
 
 
 @pytest.fixture(name="session")
@@ -66,34 +73,30 @@ def test_project_fixture(session: Session, test_user: User):
     return project
 
 
-@pytest.mark.asyncio
-async def test_verify_project_access_success(session: Session, test_user: User, test_project: Project):
+def test_verify_project_access_success(session: Session, test_user: User, test_project: Project):
     """Test successful project access verification."""
-    project = await verify_project_access(test_project.id, test_user, session)
+    project = verify_project_access(test_project.id, test_user, session)
     assert project.id == test_project.id
     assert project.owner_id == test_user.id
 
 
-@pytest.mark.asyncio
-async def test_verify_project_access_not_found(session: Session, test_user: User):
+def test_verify_project_access_not_found(session: Session, test_user: User):
     """Test project not found raises 404."""
     with pytest.raises(HTTPException) as exc_info:
-        await verify_project_access(999, test_user, session)
+        verify_project_access(999, test_user, session)
     assert exc_info.value.status_code == 404
     assert "not found" in exc_info.value.detail.lower()
 
 
-@pytest.mark.asyncio
-async def test_verify_project_access_forbidden(session: Session, other_user: User, test_project: Project):
+def test_verify_project_access_forbidden(session: Session, other_user: User, test_project: Project):
     """Test accessing other user's project raises 403."""
     with pytest.raises(HTTPException) as exc_info:
-        await verify_project_access(test_project.id, other_user, session)
+        verify_project_access(test_project.id, other_user, session)
     assert exc_info.value.status_code == 403
     assert "not authorized" in exc_info.value.detail.lower()
 
 
-@pytest.mark.asyncio
-async def test_verify_review_access_success(session: Session, test_user: User, test_project: Project):
+def test_verify_review_access_success(session: Session, test_user: User, test_project: Project):
     """Test successful review access verification."""
     review = Review(
         project_id=test_project.id,
@@ -104,21 +107,19 @@ async def test_verify_review_access_success(session: Session, test_user: User, t
     session.commit()
     session.refresh(review)
 
-    verified_review = await verify_review_access(review.id, test_user, session)
+    verified_review = verify_review_access(review.id, test_user, session)
     assert verified_review.id == review.id
 
 
-@pytest.mark.asyncio
-async def test_verify_review_access_not_found(session: Session, test_user: User):
+def test_verify_review_access_not_found(session: Session, test_user: User):
     """Test review not found raises 404."""
     with pytest.raises(HTTPException) as exc_info:
-        await verify_review_access(999, test_user, session)
+        verify_review_access(999, test_user, session)
     assert exc_info.value.status_code == 404
     assert "not found" in exc_info.value.detail.lower()
 
 
-@pytest.mark.asyncio
-async def test_verify_review_access_forbidden(session: Session, other_user: User, test_project: Project, test_user: User):
+def test_verify_review_access_forbidden(session: Session, other_user: User, test_project: Project, test_user: User):
     """Test accessing review from other user's project raises 403."""
     review = Review(
         project_id=test_project.id,
@@ -130,6 +131,57 @@ async def test_verify_review_access_forbidden(session: Session, other_user: User
     session.refresh(review)
 
     with pytest.raises(HTTPException) as exc_info:
-        await verify_review_access(review.id, other_user, session)
+        verify_review_access(review.id, other_user, session)
     assert exc_info.value.status_code == 403
     assert "not authorized" in exc_info.value.detail.lower()
+
+
+def test_verify_conversation_access(session: Session, test_user: User, other_user: User, test_project: Project):
+    """Conversation access is checked through its review's project owner."""
+    review = Review(project_id=test_project.id, created_by=test_user.id, status="completed")
+    session.add(review)
+    session.commit()
+    conversation = Conversation(review_id=review.id, mode="council", topic_type="review")
+    session.add(conversation)
+    session.commit()
+    session.refresh(conversation)
+
+    verified = verify_conversation_access(conversation.id, test_user, session)
+    assert verified.id == conversation.id
+
+    session.add(Message(conversation_id=conversation.id, sender_type="agent", sender_name="general", content="Hi"))
+    session.commit()
+    verified, message_count = verify_conversation_access_with_count(conversation.id, test_user, session)
+    assert (verified.id, message_count) == (conversation.id, 1)
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_conversation_access(conversation.id, other_user, session, action="run")
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == "Not authorized to run this conversation"
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_conversation_access(999, test_user, session)
+    assert exc_info.value.status_code == 404
+
+
+def test_verify_issue_access(session: Session, test_user: User, other_user: User, test_project: Project):
+    """Issue access is checked through its review's project owner."""
+    review = Review(project_id=test_project.id, created_by=test_user.id, status="completed")
+    session.add(review)
+    session.commit()
+    issue = Issue(review_id=review.id, severity="warning", category="style", title="Issue", description="Details")
+    session.add(issue)
+    session.commit()
+    session.refresh(issue)
+
+    verified = verify_issue_access(issue.id, test_user, session)
+    assert verified.id == issue.id
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_issue_access(issue.id, other_user, session, action="debate")
+    assert exc_info.value.status_code == 403
+    assert exc_info.value.detail == "Not authorized to debate this issue"
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_issue_access(999, test_user, session)
+    assert exc_info.value.status_code == 404
@@ -6,6 +6,8 @@ This test verifies:
 3. Voting system
 4. ELO ranking updates
 """
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select
@@ -366,3 +368,43 @@ def test_arena_tie_vote(client: TestClient, auth_headers: dict, test_project: Pr
     assert team_a_rating.ties == 1
     assert team_a_rating.wins == 0
     assert team_a_rating.losses == 0
+
+
+def test_arena_list_sessions_filters_by_project(client: TestClient, auth_headers: dict, test_project: Project):
+    """Test that listing sessions can be narrowed to a single project."""
+    arena_payload = {
+        "project_id": test_project.id,
+        "team_a_config": {"general": {"provider": "mock", "model": "test-model-1"}},
+        "team_b_config": {"general": {"provider": "mock", "model": "test-model-2"}},
+    }
+    response = client.post("/arena/sessions", json=arena_payload, headers=auth_headers)
+    assert response.status_code == 201
+    arena_id = response.json()["id"]
+
+    response = client.get(f"/arena/sessions?project_id={test_project.id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert [s["id"] for s in response.json()] == [arena_id]
+
+    response = client.get(f"/arena/sessions?project_id={test_project.id + 1}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_arena_export_sessions_ndjson(client: TestClient, auth_headers: dict, test_project: Project):
+    """Test that the export endpoint streams one JSON session per line."""
+    arena_payload = {
+        "project_id": test_project.id,
+        "team_a_config": {"general": {"provider": "mock", "model": "test-model-1"}},
+        "team_b_config": {"general": {"provider": "mock", "model": "test-model-2"}},
+    }
+    created = [
+        client.post("/arena/sessions", json=arena_payload, headers=auth_headers).json()["id"]
+        for _ in range(2)
+    ]
+
+    response = client.get("/arena/sessions/export", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(s["id"] for s in lines) == sorted(created)
@@ -80,3 +80,161 @@ def test_login_invalid_credentials(client):
         }
     )
     assert response.status_code == 401
+
+
+def test_my_audit_logs_cursor_pagination(client, auth_headers):
+    """Audit logs are paged with a (created_at, id) cursor from the Link header."""
+    response = client.get("/audit/logs/my", params={"limit": 1}, headers=auth_headers)
+    assert response.status_code == 200
+    assert [log["action"] for log in response.json()] == ["login"]
+
+    next_url = response.links["next"]["url"]
+    response = client.get(next_url, headers=auth_headers)
+    assert response.status_code == 200
+    assert [log["action"] for log in response.json()] == ["register"]
+
+    # Only one of the two cursor fields
+    response = client.get("/audit/logs/my", params={"cursor_id": 1}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_audit_events_batched_in_background(client, test_session, monkeypatch):
+    """With batching on, audit events are written by the background flusher."""
+    from sqlmodel import select
+    from app.config import settings
+    from app.models.audit import AuditAction, AuditLog
+    from app.utils.audit import flush_audit_events
+
+    monkeypatch.setattr(settings, "audit_batching_enabled", True)
+    response = client.post(
+        "/auth/register",
+        json={"email": "batch@example.com", "username": "batchuser", "password": "Testpass123"}
+    )
+    assert response.status_code == 201
+
+    flush_audit_events()
+    logs = test_session.exec(select(AuditLog)).all()
+    assert [log.action for log in logs] == [AuditAction.REGISTER]
+    assert logs[0].created_at is not None
+
+
+def test_access_token_decode_is_cached(monkeypatch):
+    """Valid and invalid access tokens are decoded once, then served from the cache."""
+    from app.utils import auth
+
+    calls = []
+    decode = auth.decode_access_token
+    monkeypatch.setattr(auth, "decode_access_token", lambda token: calls.append(token) or decode(token))
+    token = auth.create_access_token({"user_id": 1})
+
+    assert auth.decode_access_token_cached(token)["user_id"] == 1
+    assert auth.decode_access_token_cached(token)["user_id"] == 1
+    assert auth.decode_access_token_cached("garbage") is None
+    assert auth.decode_access_token_cached("garbage") is None
+    assert calls == [token, "garbage"]
+
+    auth.forget_access_token(token)
+    auth.decode_access_token_cached(token)
+    assert calls == [token, "garbage", token]
+
+
+def test_token_payload_resolved_once_per_request(monkeypatch):
+    """A second resolution within the same request reuses request.state."""
+    from starlette.requests import Request
+    from app.api import deps
+    from app.utils.auth import create_access_token
+
+    calls = []
+    decode = deps.decode_access_token_cached
+    monkeypatch.setattr(deps, "decode_access_token_cached", lambda token: calls.append(token) or decode(token))
+    token = create_access_token({"user_id": 1})
+    request = Request({"type": "http", "headers": [(b"cookie", f"access_token={token}".encode())]})
+
+    assert deps.get_token_payload(request, None)["user_id"] == 1
+    assert deps.get_token_payload(request, None)["user_id"] == 1
+    assert calls == [token]
+
+
+def test_account_changes_apply_to_issued_tokens(client, auth_headers, test_session):
+    """Deactivation and password changes in the DB apply to already issued tokens."""
+    from sqlmodel import select
+    from app.models.user import User
+    from app.utils.auth import hash_password
+
+    assert client.get("/auth/me", headers=auth_headers).status_code == 200
+    user = test_session.exec(select(User)).one()
+
+    # Password changed behind the API's back (another worker, an admin)
+    user.hashed_password = hash_password("Otherpassword123")
+    test_session.add(user)
+    test_session.commit()
+    response = client.patch(
+        "/auth/me/password",
+        json={"current_password": "Testpassword123", "new_password": "Newpassword123"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+    # Deactivated behind the API's back
+    user.is_active = False
+    test_session.add(user)
+    test_session.commit()
+    assert client.get("/auth/me", headers=auth_headers).status_code == 403
+
+
+def test_superuser_claim_confirmed_against_db(client, auth_headers, test_session):
+    """A token still carrying "sup" is refused once the DB row lost the flag."""
+    from sqlmodel import select
+    from app.models.user import User
+    from app.utils.auth import create_access_token
+
+    user = test_session.exec(select(User)).one()
+    user.is_superuser = True
+    test_session.add(user)
+    test_session.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'user_id': user.id, 'sup': True})}"}
+
+    # Regular user tokens are rejected on the claim alone
+    assert client.get("/audit/logs/count", headers=auth_headers).status_code == 403
+    assert client.get("/audit/logs/count", headers=headers).status_code == 200
+
+    user.is_superuser = False
+    test_session.add(user)
+    test_session.commit()
+    assert client.get("/audit/logs/count", headers=headers).status_code == 403
+
+
+def test_superuser_token_without_claim_checked_against_db(client, auth_headers, test_session):
+    """Tokens issued before the "sup" claim existed fall back to the user row."""
+    from sqlmodel import select
+    from app.models.user import User
+    from app.utils.auth import create_access_token
+
+    user = test_session.exec(select(User)).one()
+    headers = {"Authorization": f"Bearer {create_access_token({'user_id': user.id})}"}
+    assert client.get("/audit/logs/count", headers=headers).status_code == 403
+
+    user.is_superuser = True
+    test_session.add(user)
+    test_session.commit()
+    assert client.get("/audit/logs/count", headers=headers).status_code == 200
+
+
+def test_csrf_entropy_not_shared_with_forked_child():
+    """A forked worker draws fresh bytes instead of the parent's buffered ones."""
+    import os
+    from app.api import auth
+
+    auth._csrf_token()  # fill the buffer
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, auth._csrf_token().encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    child_token = os.read(read_fd, 100).decode()
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    assert child_token and child_token != auth._csrf_token()
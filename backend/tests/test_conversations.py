@@ -0,0 +1,133 @@
+"""Tests for conversation endpoints."""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session, select
+from app.models.conversation import Conversation, Message
+from app.models.project import Project
+from app.models.review import Review
+from app.models.user import User
+
+
+@pytest.fixture(name="test_review")
+def test_review_fixture(test_session: Session, auth_headers: dict) -> Review:
+    """Create a project and a review owned by the authenticated test user."""
+    user = test_session.exec(select(User).where(User.email == "test@example.com")).one()
+    project = Project(name="Test Project", description="Test", owner_id=user.id)
+    test_session.add(project)
+    test_session.commit()
+    review = Review(project_id=project.id, created_by=user.id, status="completed")
+    test_session.add(review)
+    test_session.commit()
+    test_session.refresh(review)
+    return review
+
+
+def _add_conversations(session: Session, review: Review, count: int, messages_each: int) -> None:
+    for _ in range(count):
+        conversation = Conversation(review_id=review.id, mode="council", topic_type="review", status="completed")
+        session.add(conversation)
+        session.commit()
+        session.add_all(
+            Message(conversation_id=conversation.id, sender_type="agent", sender_name="general",
+                    turn_index=turn, content="Message")
+            for turn in range(messages_each)
+        )
+        session.commit()
+
+
+def _count_queries(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_list_conversations_query_count_is_constant(
+    client: TestClient, auth_headers: dict, test_session: Session, test_engine, test_review: Review
+):
+    """Listing conversations does not issue a query per conversation."""
+    _add_conversations(test_session, test_review, count=5, messages_each=3)
+    url = f"/reviews/{test_review.id}/conversations"
+    statements = _count_queries(test_engine)
+
+    response = client.get(url, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert [c["message_count"] for c in response.json()] == [3] * 5
+    # user + access check + page with counts
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) <= 3
+
+
+def test_list_conversations_cursor_pagination(
+    client: TestClient, auth_headers: dict, test_session: Session, test_review: Review
+):
+    """Conversations are paged newest first via the Link rel="next" cursor."""
+    _add_conversations(test_session, test_review, count=3, messages_each=0)
+    url = f"/reviews/{test_review.id}/conversations"
+
+    seen = []
+    response = client.get(url, params={"limit": 2}, headers=auth_headers)
+    while True:
+        assert response.status_code == 200
+        seen += [c["id"] for c in response.json()]
+        if "next" not in response.links:
+            break
+        response = client.get(response.links["next"]["url"], headers=auth_headers)
+
+    assert seen == [3, 2, 1]
+
+    response = client.get(url, params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_get_conversation_loads_messages_eagerly(
+    client: TestClient, auth_headers: dict, test_session: Session, test_engine, test_review: Review
+):
+    """A conversation and its messages (in turn order) come from two statements."""
+    conversation = Conversation(review_id=test_review.id, mode="council", topic_type="review", status="completed")
+    test_session.add(conversation)
+    test_session.commit()
+    test_session.add_all(
+        Message(conversation_id=conversation.id, sender_type="agent", sender_name="general",
+                turn_index=turn, content=f"Turn {turn}")
+        for turn in (2, 0, 1)
+    )
+    test_session.commit()
+    url = f"/conversations/{conversation.id}"
+    statements = _count_queries(test_engine)
+
+    response = client.get(url, headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["message_count"] == 3
+    assert [m["turn_index"] for m in data["messages"]] == [0, 1, 2]
+    # user + access check with conversation + selectinload of messages
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) <= 3
+
+
+def test_conversation_messages_etag(
+    client: TestClient, auth_headers: dict, test_session: Session, test_review: Review
+):
+    """Polling messages with If-None-Match gets 304 until a message is added."""
+    _add_conversations(test_session, test_review, count=1, messages_each=2)
+    url = "/conversations/1/messages"
+
+    response = client.get(url, headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    etag = response.headers["ETag"]
+
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    test_session.add(Message(conversation_id=1, sender_type="agent", sender_name="general",
+                             turn_index=2, content="Message"))
+    test_session.commit()
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert response.headers["ETag"] != etag
@@ -31,3 +31,13 @@ def test_get_k_factor_thresholds():
     assert get_k_factor(10) == 32.0
     assert get_k_factor(29) == 32.0
     assert get_k_factor(30) == 24.0
+
+
+def test_arena_elo_delta_is_zero_sum():
+    """Arena votes move both teams by the same amount in opposite directions."""
+    from app.api.arena import elo_delta
+
+    assert elo_delta(1500.0, 1500.0, 1.0) == 16.0
+    assert elo_delta(1500.0, 1500.0, 0.5) == 0.0
+    # Upset win of the weaker team earns more than an expected win
+    assert elo_delta(1400.0, 1600.0, 1.0) > elo_delta(1600.0, 1400.0, 1.0)
@@ -100,3 +100,30 @@ def test_validate_code_content_long_file():
     long_code = "# Comment\n" * 1000 + "def test():\n    pass"
     result = validate_code_content(long_code, "test.py")
     assert result["valid"] is True
+
+
+def test_validate_code_content_non_printable_with_unicode():
+    """Test non-printable characters are counted per character next to multi-byte text."""
+    code = "def zażółć():\n    return 'gęślą jaźń'\n" * 5 + "\x00\x01"
+    result = validate_code_content(code, "test.py")
+    assert result["valid"] is True
+    assert "File contains non-printable characters" in result["warnings"]
+
+
+def test_code_indicator_pattern_matches_every_indicator():
+    """The prefix-factored indicator regex matches exactly the indicator words."""
+    from app.api.files import CODE_INDICATORS, _CODE_INDICATOR_RE, _trie_pattern
+
+    assert _trie_pattern(["for", "from", "fn"]) == "f(?:n|or|rom)"
+    for indicator in CODE_INDICATORS:
+        assert _CODE_INDICATOR_RE.search(f"text {indicator} text").group() == indicator
+    assert _CODE_INDICATOR_RE.search("forum deflate classy") is None
+
+
+def test_validate_code_content_binary_rejected_before_other_checks():
+    """Test binary content is rejected without running the text heuristics."""
+    binary = "\x00\x01\x02\x03" * 100
+    result = validate_code_content(binary, "image.png")
+    assert result["valid"] is False
+    assert result["errors"] == ["File contains too many non-printable characters - may be binary file"]
+    assert result["warnings"] == []
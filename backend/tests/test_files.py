@@ -0,0 +1,82 @@
+"""Tests for the project files API."""
+import hashlib
+
+from app.config import settings
+from app.models.project import Project
+
+CODE = "def hello():\n    return 'hello world'\n"
+
+
+def test_file_limit_uses_project_file_count(client, auth_headers, test_session, monkeypatch):
+    """The per-project file limit is enforced by the file_count counter."""
+    monkeypatch.setattr(settings, "max_files_per_project", 2)
+    project_id = client.post("/projects", json={"name": "Limits"}, headers=auth_headers).json()["id"]
+
+    file_ids = []
+    for name in ("a.py", "b.py"):
+        response = client.post(f"/projects/{project_id}/files",
+                               json={"name": name, "content": CODE}, headers=auth_headers)
+        assert response.status_code == 201
+        file_ids.append(response.json()["id"])
+
+    response = client.post(f"/projects/{project_id}/files",
+                           json={"name": "c.py", "content": CODE}, headers=auth_headers)
+    assert response.status_code == 400
+    assert "Maximum 2 files" in response.json()["detail"]
+    assert test_session.get(Project, project_id).file_count == 2
+
+    # Deleting a file frees its slot
+    response = client.delete(f"/projects/{project_id}/files/{file_ids[0]}", headers=auth_headers)
+    assert response.status_code == 204
+    test_session.expire_all()
+    assert test_session.get(Project, project_id).file_count == 1
+
+    response = client.post(f"/projects/{project_id}/files",
+                           json={"name": "c.py", "content": CODE}, headers=auth_headers)
+    assert response.status_code == 201
+
+
+def test_validate_files_reports_each_file(client, auth_headers):
+    """Batch validation returns per-file results in file order."""
+    project_id = client.post("/projects", json={"name": "Validate"}, headers=auth_headers).json()["id"]
+    for name in ("a.py", "b.py"):
+        client.post(f"/projects/{project_id}/files",
+                    json={"name": name, "content": CODE}, headers=auth_headers)
+
+    response = client.post(f"/projects/{project_id}/files/validate", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["valid"] is True and data["can_review"] is True
+    assert [f["name"] for f in data["files"]] == ["a.py", "b.py"]
+
+
+def test_list_files_omits_content(client, auth_headers):
+    """The file list is sorted by name and carries metadata only."""
+    project_id = client.post("/projects", json={"name": "List"}, headers=auth_headers).json()["id"]
+    for name in ("b.py", "a.py"):
+        client.post(f"/projects/{project_id}/files",
+                    json={"name": name, "content": CODE}, headers=auth_headers)
+
+    response = client.get(f"/projects/{project_id}/files", headers=auth_headers)
+    assert response.status_code == 200
+    files = response.json()
+    assert [f["name"] for f in files] == ["a.py", "b.py"]
+    assert all("content" not in f and f["size_bytes"] == len(CODE) for f in files)
+    assert files[0]["content_hash"] == hashlib.sha256(CODE.encode()).hexdigest()
+
+
+def test_delete_file_never_drives_file_count_negative(client, auth_headers, test_session):
+    """A counter that drifted to 0 stays at 0 when a file is deleted."""
+    project_id = client.post("/projects", json={"name": "Drift"}, headers=auth_headers).json()["id"]
+    file_id = client.post(f"/projects/{project_id}/files",
+                          json={"name": "a.py", "content": CODE}, headers=auth_headers).json()["id"]
+
+    project = test_session.get(Project, project_id)
+    project.file_count = 0
+    test_session.add(project)
+    test_session.commit()
+
+    response = client.delete(f"/projects/{project_id}/files/{file_id}", headers=auth_headers)
+    assert response.status_code == 204
+    test_session.expire_all()
+    assert test_session.get(Project, project_id).file_count == 0
@@ -0,0 +1,47 @@
+"""Sanity checks for the Alembic revision graph."""
+import ast
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+VERSIONS_DIR = BACKEND_DIR / "alembic" / "versions"
+
+
+def _script_directory() -> ScriptDirectory:
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return ScriptDirectory.from_config(config)
+
+
+def _declared_revisions() -> list[str]:
+    """Read `revision = '...'` straight from every migration file."""
+    revisions = []
+    for path in sorted(VERSIONS_DIR.glob("*.py")):
+        for node in ast.parse(path.read_text()).body:
+            if (
+                isinstance(node, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "revision" for t in node.targets)
+            ):
+                revisions.append(node.value.value)
+    return revisions
+
+
+def test_revision_ids_are_unique():
+    """Two files declaring the same revision id silently shadow each other."""
+    revisions = _declared_revisions()
+    duplicates = {rev for rev in revisions if revisions.count(rev) > 1}
+    assert not duplicates, f"Duplicate Alembic revision ids: {sorted(duplicates)}"
+
+
+def test_single_head():
+    """`alembic upgrade head` must have exactly one target."""
+    heads = _script_directory().get_heads()
+    assert len(heads) == 1, f"Expected a single Alembic head, got {heads}"
+
+
+def test_every_revision_is_reachable_from_head():
+    """Walking down from head visits every migration file."""
+    walked = {script.revision for script in _script_directory().walk_revisions()}
+    assert walked == set(_declared_revisions())
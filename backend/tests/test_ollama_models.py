@@ -0,0 +1,56 @@
+"""Tests for the cached Ollama model list."""
+import asyncio
+
+import pytest
+
+from app.api import ollama
+from app.providers.ollama import OllamaProvider
+from app.utils.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_models_cache():
+    cache.delete_prefix("ollama:models")
+    yield
+    cache.delete_prefix("ollama:models")
+
+
+@pytest.fixture(name="fetches")
+def fetches_fixture(monkeypatch):
+    """Count Ollama requests; each one takes a moment, like the real API."""
+    fetches = []
+
+    async def list_models(self):
+        fetches.append(1)
+        await asyncio.sleep(0.01)
+        return ["qwen2.5-coder", "llama3", "llama3"]
+
+    monkeypatch.setattr(OllamaProvider, "list_models", list_models)
+    return fetches
+
+
+def test_concurrent_misses_share_one_request(fetches):
+    """A burst of cache misses makes a single Ollama request."""
+    async def burst():
+        return await asyncio.gather(*(ollama.list_ollama_models(current_user=None) for _ in range(5)))
+
+    responses = asyncio.run(burst())
+
+    assert len(fetches) == 1
+    assert all(r.models == ["llama3", "qwen2.5-coder"] and not r.cached for r in responses)
+
+
+def test_expired_list_is_served_while_refreshing(fetches):
+    """After the TTL the last list is returned and refreshed once in the background."""
+    cache.set(ollama.MODELS_STALE_KEY, ["old-model"], ttl=60)
+
+    async def expired():
+        responses = await asyncio.gather(*(ollama.list_ollama_models(current_user=None) for _ in range(3)))
+        await ollama._models_refresh
+        return responses
+
+    responses = asyncio.run(expired())
+
+    assert all(r.models == ["old-model"] and r.cached for r in responses)
+    assert len(fetches) == 1
+    assert cache.get(ollama.MODELS_CACHE_KEY) == ["llama3", "qwen2.5-coder"]
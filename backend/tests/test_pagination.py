@@ -114,3 +114,25 @@ class TestReviewPagination:
         response = client.get(f"/api/projects/{test_project.id}/reviews?page=0")
 
         assert response.status_code == 422  # Validation error
+
+
+def test_build_link_header_keeps_filters():
+    """Link header replaces page params but keeps the other query params."""
+    from starlette.requests import Request
+    from app.api.reviews import build_link_header
+
+    request = Request({
+        "type": "http", "scheme": "http", "server": ("testserver", 80), "method": "GET",
+        "path": "/reviews/1/issues", "query_string": b"severity=error&page=2&page_size=10",
+        "headers": [],
+    })
+
+    links = build_link_header(request, page=2, page_size=10, total=25)
+
+    base = "http://testserver/reviews/1/issues?severity=error&page="
+    assert links == ", ".join([
+        f'<{base}1&page_size=10>; rel="first"',
+        f'<{base}1&page_size=10>; rel="prev"',
+        f'<{base}3&page_size=10>; rel="next"',
+        f'<{base}3&page_size=10>; rel="last"',
+    ])
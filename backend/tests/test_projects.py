@@ -0,0 +1,28 @@
+"""Tests for the project API."""
+from app.models.review import Review
+
+CODE = "def hello():\n    return 'hello world'\n"
+
+
+def test_project_counts(client, auth_headers, test_session):
+    """List, get and update return file and review counts of each project."""
+    busy = client.post("/projects", json={"name": "Busy"}, headers=auth_headers).json()["id"]
+    client.post("/projects", json={"name": "Empty"}, headers=auth_headers)
+    for name in ("a.py", "b.py"):
+        client.post(f"/projects/{busy}/files", json={"name": name, "content": CODE}, headers=auth_headers)
+    for _ in range(3):
+        test_session.add(Review(project_id=busy, created_by=1, status="completed", review_mode="council"))
+    test_session.commit()
+
+    page = client.get("/projects", headers=auth_headers).json()
+    assert page["total"] == 2
+    counts = {p["name"]: (p["file_count"], p["review_count"]) for p in page["items"]}
+    assert counts == {"Busy": (2, 3), "Empty": (0, 0)}
+
+    project = client.get(f"/projects/{busy}", headers=auth_headers).json()
+    assert (project["file_count"], project["review_count"], len(project["files"])) == (2, 3, 2)
+
+    updated = client.patch(f"/projects/{busy}", json={"name": "Renamed"}, headers=auth_headers).json()
+    assert (updated["name"], updated["file_count"], updated["review_count"]) == ("Renamed", 2, 3)
+
+    assert client.get("/projects/999999", headers=auth_headers).status_code == 404
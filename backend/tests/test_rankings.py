@@ -0,0 +1,48 @@
+"""Tests for the review-based rankings."""
+import pytest
+
+from app.api.rankings import RANKINGS_CACHE_PREFIX
+from app.models.review import Review, ReviewAgent, Issue
+from app.utils.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_rankings_cache():
+    cache.delete_prefix(RANKINGS_CACHE_PREFIX)
+    yield
+    cache.delete_prefix(RANKINGS_CACHE_PREFIX)
+
+
+def _review(session, project_id, provider, model, parsed, issues):
+    review = Review(project_id=project_id, created_by=1, status="completed", review_mode="council")
+    session.add(review)
+    session.flush()
+    session.add(ReviewAgent(review_id=review.id, role="general", provider=provider, model=model,
+                            parsed_successfully=parsed))
+    for i in range(issues):
+        session.add(Issue(review_id=review.id, severity="info", category="style",
+                          title=f"Issue {i}", description="..."))
+
+
+def test_model_and_provider_rankings(client, auth_headers, test_session):
+    """Counts per model/provider come from one aggregate, issue counts included."""
+    project_id = client.post("/projects", json={"name": "Ranked"}, headers=auth_headers).json()["id"]
+    _review(test_session, project_id, "groq", "llama3", True, 3)
+    _review(test_session, project_id, "groq", "llama3", False, 1)
+    _review(test_session, project_id, "groq", "mixtral", True, 0)
+    _review(test_session, project_id, "gemini", "flash", True, 2)
+    test_session.commit()
+
+    models = client.get("/rankings/models", headers=auth_headers).json()
+    assert [(m["provider"], m["model"], m["reviews_count"], m["issues_found"], m["success_rate"])
+            for m in models] == [
+        ("groq", "llama3", 2, 4, 50.0),
+        ("gemini", "flash", 1, 2, 100.0),
+        ("groq", "mixtral", 1, 0, 100.0),
+    ]
+
+    providers = client.get("/rankings/providers", headers=auth_headers).json()
+    assert [(p["provider"], p["reviews_count"], p["issues_found"]) for p in providers] == [
+        ("groq", 3, 4),
+        ("gemini", 1, 2),
+    ]
@@ -49,3 +49,28 @@ def test_review_requires_moderator_config(client: TestClient, auth_headers: dict
         headers=auth_headers,
     )
     assert response.status_code == 422
+
+
+def test_rejected_agent_config_leaves_no_review(client: TestClient, auth_headers: dict):
+    project_id = _create_project(client, auth_headers)
+    client.post(
+        f"/projects/{project_id}/files",
+        json={"name": "main.py", "content": "def main():\n    return 42\n"},
+        headers=auth_headers,
+    )
+    response = client.post(
+        f"/projects/{project_id}/reviews",
+        json={
+            "review_mode": "council",
+            "agent_roles": ["general", "security"],
+            "agent_configs": {"general": {"provider": "mock", "model": "default"},
+                              "security": {"provider": "mock", "model": " "}},
+            "moderator_type": "debate",
+            "moderator_config": {"provider": "mock", "model": "default"},
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 422
+
+    reviews = client.get(f"/projects/{project_id}/reviews", headers=auth_headers)
+    assert reviews.json() == []
@@ -0,0 +1,53 @@
+"""Tests for background task dispatch."""
+import asyncio
+import pytest
+from fastapi import BackgroundTasks
+from app.config import settings
+from app.utils.tasks import enqueue_task, task
+
+
+@pytest.mark.asyncio
+async def test_local_tasks_respect_concurrency_limit(monkeypatch):
+    """Without the Redis queue, at most background_task_concurrency tasks run at once."""
+    monkeypatch.setattr(settings, "task_queue_enabled", False)
+    monkeypatch.setattr(settings, "background_task_concurrency", 2)
+    running, peak = 0, 0
+
+    @task("tests.sleep")
+    async def sleep_task(delay: float):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+
+    background_tasks = BackgroundTasks()
+    for _ in range(5):
+        enqueue_task(background_tasks, "tests.sleep", 0.01)
+    await asyncio.gather(*(t.func(*t.args, **t.kwargs) for t in background_tasks.tasks))
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_job_timeout(monkeypatch):
+    """A job running past JOB_TIMEOUT_SECONDS is cancelled."""
+    from app import worker
+    monkeypatch.setattr(worker, "JOB_TIMEOUT_SECONDS", 0.01)
+
+    @task("tests.hang")
+    async def hang_task():
+        await asyncio.sleep(10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await worker.run_job('{"task": "tests.hang", "args": []}')
+
+
+def test_worker_job_description_hides_later_args():
+    """Failed jobs are logged by task name and first argument only (no API keys)."""
+    from app.worker import describe_job
+
+    described = describe_job('{"task": "arena.run", "args": [7, {"groq": "secret-key"}]}')
+    assert described == "arena.run(7, ...)"
+    assert "secret" not in described
+    assert describe_job("not json") == "<unreadable job>"